@@ -1,32 +1,31 @@
 import contextlib
-import dataclasses
-import json
+import copy
 import os
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 from app_state import AppState
 import numpy as np
 
 from app_gui import AppGui
+from least_squares_solver import LeastSquaresSolver
 from linear_regression_model import LinearRegressionModel
 from input_vectors import InputVectors
+from instrumentation import Instrumentation, instrumented
+from job_executor import JobContext, JobExecutor
+from limits import Limits
+from random_streams import RandomStreams
+from recursive_least_squares import RecursiveLeastSquares
+from sparse_matrix import density, is_sparse, scipy_sparse
+from state_snapshot_store import StateSnapshotStore
 
 
-class App:
-    MIN_DIMENSION_DATASET = 1
-    MAX_DIMENSION_DATASET = 100_000
+# Межі параметрів (MIN_VAL, MAX_PRECISION тощо) успадковуються з Limits
+class App(Limits):
+    # Рівень довіри бутстреп-інтервалів B̂
+    BOOTSTRAP_CONFIDENCE = 0.95
 
-    MIN_VAL = 0
-    MAX_VAL = 100_000_000
-
-    LOWER_LIMIT_E = -100
-    UPPER_LIMIT_E = 100
-
-    LOWER_LIMIT_SIGMA = 0
-    UPPER_LIMIT_SIGMA = 100
-
-    MIN_PRECISION = 0
-    MAX_PRECISION = 9
+    # Інтервал оновлення панелі вимірів етапів, мс
+    TIMINGS_REFRESH_MS = 250
 
     def __init__(self, root: tk.Tk):
         """
@@ -35,25 +34,50 @@ class App:
         </summary>
         <param name="root">Кореневе вікно Tkinter для створення GUI.</param>
         """
+        self.root = root
         self.input_handler = InputVectors(root)
+        self.instrumentation = Instrumentation()
         self.state = AppState()
+        self.rls: RecursiveLeastSquares | None = None
         if os.path.exists("regression_state.json"):
             with contextlib.suppress(Exception):
                 os.remove("regression_state.json")
                 print("Cleared regression_state.json")
+        self.state_store = StateSnapshotStore(
+            "regression_state",
+            background=True,
+            instrumentation=self.instrumentation,
+            on_error=self.__on_save_error,
+        )
+        self.state_store.clear()
         self.gui = AppGui(root, self)
+        self.jobs = JobExecutor(root, self.gui.update_progress)
+        self.__timings_version = -1
+        self.__refresh_timings()
 
-    def save_state(self, filename="regression_state.json"):
+    def save_state(self):
         """
         <summary>
-            Зберігає поточний стан додатку у файл JSON.
+            Зберігає поточний стан додатку у двійковий знімок у фоновому потоці.
+            Перезаписуються лише поля, що змінилися від попереднього збереження.
         </summary>
-        <param name="filename">Ім'я файлу для збереження стану (за замовчуванням "regression_state.json").</param>
         """
-        with open(filename, "w") as f:
-            json.dump(
-                dataclasses.asdict(self.state), f, indent=4, default=lambda o: list(o)
-            )
+        self.state_store.save(self.state)
+
+    def __on_save_error(self, error: BaseException):
+        """
+        <summary>
+            Повідомляє про невдалий фоновий запис знімка стану. Викликається з потоку запису,
+            тож повідомлення передається в головний потік Tk через root.after.
+        </summary>
+        <param name="error">Виняток запису.</param>
+        """
+        self.root.after(
+            0,
+            lambda: messagebox.showerror(
+                "Save State Error", f"The state snapshot could not be saved and is out of date: {error}"
+            ),
+        )
 
     @staticmethod
     def __check_bounds(value, lower_limit, upper_limit):
@@ -68,6 +92,32 @@ class App:
         """
         return lower_limit <= value <= upper_limit
 
+    def __read_seed(self) -> RandomStreams | None:
+        """
+        <summary>
+            Зчитує seed з поля GUI і створює з нього джерело випадкових чисел.
+            Якщо поле порожнє, генерує новий seed і показує його в полі, щоб прогін можна було повторити.
+        </summary>
+        <returns>RandomStreams або None, якщо введене значення некоректне.</returns>
+        """
+        text = self.gui.seed_entry.get().strip()
+        if not text:
+            streams = RandomStreams()
+            self.gui.seed_entry.insert(0, str(streams.seed))
+        else:
+            try:
+                seed = int(text)
+                if seed < 0:
+                    raise ValueError("seed must be non-negative")
+            except ValueError as e:
+                self.gui.seed_entry.delete(0, tk.END)
+                messagebox.showerror("Error", f"Invalid seed: {e}")
+                return None
+            streams = RandomStreams(seed)
+        self.state.seed = streams.seed
+        return streams
+
+    @instrumented("apply_dimensions")
     def apply_dimensions(self):
         """
         <summary>
@@ -105,6 +155,7 @@ class App:
             messagebox.showerror("Error", f"Invalid dimensions: {e}")
             return
 
+    @instrumented("apply_X")
     def apply_X(self):
         """
         <summary>
@@ -115,6 +166,7 @@ class App:
         if not self.gui.x_choice.get():
             messagebox.showerror("Error", "Select input method for X")
             return
+        dtype = self.gui.x_dtype_choice.get() or InputVectors.DTYPES[0]
 
         match self.gui.x_choice.get():
             case "Generate":
@@ -125,6 +177,7 @@ class App:
                     min_bounds_x_program = float(self.gui.x_min_entry.get())
                     max_bounds_x_program = float(self.gui.x_max_entry.get())
                     self.state.x_precision = int(self.gui.x_precision_entry.get())
+                    x_density = float(self.gui.x_density_entry.get() or 1)
 
                     if not (
                         self.__check_bounds(
@@ -165,43 +218,101 @@ class App:
                             f"Precision must be between {self.MIN_PRECISION} and {self.MAX_PRECISION}",
                         )
                         return
-                    self.state.data_X = InputVectors.generate_random_matrix(
-                        min_bounds_x_program,
-                        max_bounds_x_program,
-                        self.state.n_obs,
-                        self.state.n_feats,
-                        self.state.x_precision,
+                    if not 0 < x_density <= 1:
+                        self.gui.x_density_entry.delete(0, tk.END)
+                        messagebox.showerror("Error", "Density must be in the range (0, 1]")
+                        return
+                    if (streams := self.__read_seed()) is None:
+                        return
+                    n_obs, n_feats, x_precision = (
+                        self.state.n_obs, self.state.n_feats, self.state.x_precision
                     )
+                    if x_density < 1:
+                        generate = lambda job: InputVectors.generate_random_sparse_matrix(  # noqa: E731
+                            min_bounds_x_program,
+                            max_bounds_x_program,
+                            n_obs,
+                            n_feats,
+                            x_density,
+                            x_precision,
+                            job.progress,
+                            streams,
+                            dtype=dtype,
+                        )
+                    else:
+                        generate = lambda job: InputVectors.generate_random_matrix(  # noqa: E731
+                            min_bounds_x_program,
+                            max_bounds_x_program,
+                            n_obs,
+                            n_feats,
+                            x_precision,
+                            job.progress,
+                            streams,
+                            dtype=dtype,
+                        )
+                    self.__submit_job("X", generate, self.__on_X_ready)
+                    return
                 except ValueError as e:
                     self.gui.x_min_entry.delete(0, tk.END)
                     self.gui.x_max_entry.delete(0, tk.END)
                     self.gui.x_precision_entry.delete(0, tk.END)
-                    messagebox.showerror("Error", f"Invalid range/precision: {e}")
+                    messagebox.showerror("Error", f"Invalid range/precision/density: {e}")
 
             case "Manual":
                 if not self.state.n_obs or not self.state.n_feats:
                     messagebox.showerror("Error", "Apply X dimensions first")
                     return
-                self.state.data_X = self.input_handler.input_matrix_gui(
-                    "Enter design matrix X", self.state.n_obs, self.state.n_feats, self.MAX_PRECISION
+                self.__on_X_ready(
+                    self.input_handler.input_matrix_gui(
+                        "Enter design matrix X", self.state.n_obs, self.state.n_feats, self.MAX_PRECISION
+                    ).astype(dtype)
                 )
+                return
 
             case "File":
-                if (
-                    data_X := InputVectors.load_from_file()
-                ) is not None and np.all(data_X):
-                    self.state.data_X = data_X
-                    self.state.n_obs, self.state.n_feats = data_X.shape
-                    self.gui.obs_entry.delete(0, tk.END)
-                    self.gui.obs_entry.insert(0, data_X.shape[0])
-                    self.gui.feat_entry.delete(0, tk.END)
-                    self.gui.feat_entry.insert(0, data_X.shape[1])
-                    self.gui.dimensions_label.config({"text": "✓", "foreground": "green"})
-                    self.save_state()
+                if not (file_path := InputVectors.ask_file_path()):
+                    return
+                self.__submit_job(
+                    "X",
+                    lambda job: InputVectors.read_file(file_path, dtype, job.progress),
+                    self.__on_X_loaded,
+                    lambda e: messagebox.showerror("Error", f"Invalid numbers in file: {e}"),
+                )
+                return
             case _:
                 pass
 
-        if np.all(self.state.data_X):
+        self.__on_X_ready(self.state.data_X)
+
+    def __on_X_loaded(self, data_X: np.ndarray):
+        """
+        <summary>
+            Встановлює розміри датасету за матрицею X, завантаженою з файлу, та відображає її.
+        </summary>
+        <param name="data_X">Завантажена матриця ознак.</param>
+        """
+        if data_X.size:
+            self.state.n_obs, self.state.n_feats = data_X.shape
+            self.gui.obs_entry.delete(0, tk.END)
+            self.gui.obs_entry.insert(0, data_X.shape[0])
+            self.gui.feat_entry.delete(0, tk.END)
+            self.gui.feat_entry.insert(0, data_X.shape[1])
+            self.gui.dimensions_label.config({"text": "✓", "foreground": "green"})
+        self.__on_X_ready(data_X)
+
+    def __on_X_ready(self, data_X: np.ndarray):
+        """
+        <summary>
+            Зберігає отриману матрицю X у стані та відображає її в GUI.
+        </summary>
+        <param name="data_X">Згенерована, введена або завантажена матриця ознак, щільна або розріджена.</param>
+        """
+        if data_X.size:
+            self.state.data_X = data_X
+            self.rls = None
+            self.state.dtype = data_X.dtype.name
+            self.state.x_density = density(data_X) if is_sparse(data_X) else 1.0
+            self.gui.x_dtype_choice.set(self.state.dtype)
             self.gui.update_display(
                 self.gui.x_display, self.state.data_X, self.state.x_precision
             )
@@ -216,6 +327,7 @@ class App:
         </summary>
         """
         self.state = AppState()
+        self.rls = None
         self.gui.update_display(self.gui.x_display, np.array([]), 0)
         self.gui.update_display(self.gui.y_display, np.array([]), 0)
         self.gui.update_display(self.gui.b_display, np.array([]), 0)
@@ -227,6 +339,7 @@ class App:
         self.gui.x_min_entry.delete(0, tk.END)
         self.gui.x_max_entry.delete(0, tk.END)
         self.gui.x_precision_entry.delete(0, tk.END)
+        self.gui.x_density_entry.delete(0, tk.END)
         self.gui.b_min_entry.delete(0, tk.END)
         self.gui.b_max_entry.delete(0, tk.END)
         self.gui.b_precision_entry.delete(0, tk.END)
@@ -236,20 +349,32 @@ class App:
         self.gui.noise_e_entry.insert(0, "0")
         self.gui.noise_sigma_entry.delete(0, tk.END)
         self.gui.noise_sigma_entry.insert(0, "1")
+        self.gui.seed_entry.delete(0, tk.END)
+        self.gui.forgetting_entry.delete(0, tk.END)
+        self.gui.forgetting_entry.insert(0, "1")
+        self.gui.refactor_every_entry.delete(0, tk.END)
+        self.gui.refactor_every_entry.insert(0, "100")
+        self.gui.x_dtype_choice.set(InputVectors.DTYPES[0])
         self.gui.mse_label.config(text="MSE: N/A")
         self.gui.rmse_label.config(text="RMSE: N/A")
         self.gui.mae_label.config(text="MAE: N/A")
         self.gui.mape_label.config(text="MAPE: N/A")
+        self.gui.r2_label.config(text="R²: N/A")
+        self.gui.adj_r2_label.config(text="Adj. R²: N/A")
+        self.gui.residual_variance_label.config(text="σ̂²: N/A")
+        self.gui.lambda_label.config(text="λ (GCV): N/A")
+        self.gui.df_label.config(text="df(λ): N/A")
+        self.gui.cv_mse_label.config(text="CV MSE: N/A")
+        self.gui.cv_r2_label.config(text="CV R²: N/A")
+        self.gui.solver_label.config(text="Solver: N/A")
 
-    def apply_noise(self):
+    def __read_noise_parameters(self) -> tuple[float, float] | None:
         """
         <summary>
-            Генерує шум для регресійної моделі на основі параметрів E та σ від користувача.
+            Зчитує та перевіряє параметри шуму E та σ з полів GUI.
         </summary>
+        <returns>Пара (E, σ) або None, якщо введені значення некоректні.</returns>
         """
-        if not self.state.n_obs or not self.state.n_feats:
-            messagebox.showerror("Error", "Apply X dimensions first")
-            return
         try:
             noise_e = float(self.gui.noise_e_entry.get())
             noise_sigma = float(self.gui.noise_sigma_entry.get())
@@ -263,7 +388,7 @@ class App:
                     "Error",
                     f"E must be in the range [{self.LOWER_LIMIT_E}, {self.UPPER_LIMIT_E}]",
                 )
-                return
+                return None
             if not (
                 self.__check_bounds(
                     noise_sigma, self.LOWER_LIMIT_SIGMA, self.UPPER_LIMIT_SIGMA
@@ -275,22 +400,81 @@ class App:
                     "Error",
                     f"σ must be in the range [{self.LOWER_LIMIT_SIGMA}, {self.UPPER_LIMIT_SIGMA}]",
                 )
-                return
+                return None
 
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid range/σ, E: {e}")
+            return None
+        return noise_e, noise_sigma
+
+    def __read_iterative_parameters(self) -> tuple[float, int | None] | None:
+        """
+        <summary>
+            Зчитує та перевіряє точність і максимальну кількість ітерацій методу lsqr.
+            Порожнє поле кількості ітерацій означає типове обмеження.
+        </summary>
+        <returns>Пара (точність, кількість ітерацій або None) або None, якщо значення некоректні.</returns>
+        """
+        try:
+            tolerance = float(self.gui.tolerance_entry.get())
+            max_iterations_text = self.gui.max_iterations_entry.get().strip()
+            max_iterations = int(max_iterations_text) if max_iterations_text else None
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid tolerance/max iterations: {e}")
+            return None
+        if not 0 < tolerance < 1:
+            messagebox.showerror("Error", "Tolerance must be in the range (0, 1)")
+            return None
+        if max_iterations is not None and max_iterations < 1:
+            messagebox.showerror("Error", "Max iterations must be positive")
+            return None
+        return tolerance, max_iterations
+
+    @instrumented("apply_noise")
+    def apply_noise(self):
+        """
+        <summary>
+            Генерує шум для регресійної моделі на основі параметрів E та σ від користувача.
+        </summary>
+        """
+        if not self.state.n_obs or not self.state.n_feats:
+            messagebox.showerror("Error", "Apply X dimensions first")
+            return
+        if (noise_parameters := self.__read_noise_parameters()) is None:
+            return
+        noise_e, noise_sigma = noise_parameters
+        if (streams := self.__read_seed()) is None:
             return
 
-        self.state.noise = LinearRegressionModel.generate_noise(
-            noise_e, noise_sigma, self.state.n_obs, self.MAX_PRECISION
+        n_obs = self.state.n_obs
+        self.__submit_job(
+            "noise",
+            lambda job: LinearRegressionModel.generate_noise(
+                noise_e, noise_sigma, n_obs, self.MAX_PRECISION, streams, progress=job.progress
+            ),
+            self.__on_noise_ready,
         )
+
+    def __on_noise_ready(self, noise: np.ndarray):
+        """
+        <summary>
+            Зберігає згенерований шум у стані та відображає його в GUI.
+        </summary>
+        <param name="noise">Вектор шуму.</param>
+        """
+        if noise.shape[0] != self.state.n_obs:
+            # Поки задача виконувалася, розміри X змінено: шум іншої довжини застарів
+            messagebox.showerror("Error", "The X dimensions changed while generating noise; apply noise again")
+            return
+        self.state.noise = noise
         self.gui.update_display(
             self.gui.noise_display,
-            np.array([[n] for n in self.state.noise]),
+            self.state.noise.reshape(-1, 1),
             self.MAX_PRECISION,
         )
         self.save_state()
 
+    @instrumented("apply_B")
     def apply_B(self):
         """
          <summary>
@@ -364,12 +548,16 @@ class App:
                             f"Precision must be between {self.MIN_PRECISION} and {self.MAX_PRECISION}",
                         )
                         return
+                    if (streams := self.__read_seed()) is None:
+                        return
                     self.state.data_B = InputVectors.generate_random_matrix(
                         min_bounds_b_program,
                         max_bounds_b_program,
                         self.state.n_feats,
                         1,
                         self.state.b_precision,
+                        streams=streams,
+                        key=(RandomStreams.B,),
                     )
                 except ValueError as e:
                     self.gui.b_precision_entry.delete(0, tk.END)
@@ -389,6 +577,7 @@ class App:
         )
         self.save_state()
 
+    @instrumented("calculate_y_and_B_hat")
     def calculate_y_and_B_hat(self):
         """
         <summary>
@@ -397,7 +586,7 @@ class App:
             відображає отримані y і B̂ у GUI та оновлює метрики помилок.
         </summary>
         """
-        if not np.any(self.state.data_X):
+        if not self.state.data_X.size:
             messagebox.showerror("Error", "Data X cannot be None")
             return
         if not np.any(self.state.data_B):
@@ -410,43 +599,434 @@ class App:
         X_np = self.state.data_X
         B_np = self.state.data_B
         noise_np = self.state.noise
+        b_0 = self.state.b_0
+        self.state.solver = self.gui.solver_choice.get() or "auto"
+        solver = self.state.solver
+        if solver == "lsqr":
+            if (iterative_parameters := self.__read_iterative_parameters()) is None:
+                return
+            # Попередня B̂ тієї ж форми є початковим наближенням для lsqr
+            B_init = self.state.B_hat if self.state.B_hat.shape == (X_np.shape[1] + 1, 1) else None
+
+        def job(context: JobContext):
+            Y_np = LinearRegressionModel.calculate_y(X_np, B_np, b_0, noise_np)
+            context.progress(0.2)
 
-        self.state.data_Y = LinearRegressionModel.calculate_y(
-            X_np, B_np, self.state.b_0, noise_np
+            # Оцінка повідомляє прогрес поблоково або за ітераціями, тож її можна скасувати
+            def progress(fraction: float):
+                context.progress(0.2 + 0.7 * fraction)
+
+            ridge = moments = None
+            if solver == "lsqr":
+                solution = LinearRegressionModel.calculate_B_hat_iterative(
+                    X_np, Y_np, *iterative_parameters, B_init=B_init, progress=progress
+                )
+                B_hat, solver_used = solution.B_hat, "lsqr"
+            elif solver == "ridge":
+                solution = None
+                ridge = LinearRegressionModel.calculate_ridge(X_np, Y_np, progress=progress)
+                B_hat, solver_used = ridge["B_hat"], "ridge"
+            elif solver == "parallel":
+                solution = None
+                moments = LinearRegressionModel.calculate_moments_parallel(X_np, Y_np, progress=progress)
+                B_hat, solver_used = moments.solve(), "parallel"
+            else:
+                solution = None
+                B_hat, solver_used = LinearRegressionModel.calculate_B_hat(X_np, Y_np, solver, progress)
+            context.progress(0.9)
+            metrics = LinearRegressionModel.calculate_metrics(B_np, B_hat[1:])
+            diagnostics = LinearRegressionModel.calculate_diagnostics(
+                X_np, Y_np, B_hat, solver, ridge, moments
+            )
+            if solution is not None:
+                diagnostics.update(iterations=solution.iterations, residual_norm=solution.residual_norm)
+            return (X_np, B_np, noise_np, b_0), Y_np, B_hat, solver_used, metrics, diagnostics
+
+        self.__submit_job(
+            "calculate",
+            job,
+            self.__on_B_hat_ready,
+            lambda e: messagebox.showerror("Calculate B̂ Error", f"Error calculating B̂: {e}"),
         )
-        if self.state.data_Y is None:
-            messagebox.showerror("Error", "Failed to calculate y")
+
+    def __on_B_hat_ready(self, result: tuple):
+        """
+        <summary>
+            Зберігає обчислені y, B̂ та метрики у стані й відображає їх у GUI.
+            Поруч із B̂ відображаються стовпці стандартних похибок і t-статистик,
+            а для lsqr біля методу — кількість ітерацій і норма залишку.
+        </summary>
+        <param name="result">Кортеж (вихідні X, B, шум і b₀, y, B̂, назва методу, метрики, діагностика підгонки).</param>
+        """
+        (X_np, B_np, noise_np, b_0), Y_np, B_hat, solver_used, metrics, diagnostics = result
+        if (
+            self.state.data_X is not X_np
+            or self.state.data_B is not B_np
+            or self.state.noise is not noise_np
+            or self.state.b_0 != b_0
+        ):
+            # Поки задача виконувалася, дані змінено (нова X, B, шум тощо): результат застарів
+            messagebox.showerror("Error", "The data changed while calculating B̂; calculate again")
             return
+        self.state.data_Y, self.state.B_hat, self.state.solver_used = Y_np, B_hat, solver_used
+        self.rls = None
         self.gui.update_display(
             self.gui.y_display,
             self.state.data_Y,
             self.state.b_precision,
         )
+        self.gui.update_display(
+            self.gui.b_hat_display,
+            np.hstack([self.state.B_hat, diagnostics["se"], diagnostics["t_stats"]]),
+            self.MAX_PRECISION,
+        )
+        self.gui.update_metrics({**metrics, **diagnostics})
+        solver_text = self.state.solver_used
+        if "iterations" in diagnostics:
+            solver_text += f" ({diagnostics['iterations']} it, ‖r‖={diagnostics['residual_norm']:.6g})"
+        self.gui.solver_label.config(text=f"Solver: {solver_text}")
+        self.save_state()
 
-        Y_np = self.state.data_Y
+    @instrumented("simulate")
+    def simulate(self):
+        """
+        <summary>
+            Моделювання Монте-Карло: генерує R реплік шуму з параметрами E та σ,
+            оцінює B̂ для кожної з них за одним спільним розкладом X
+            і відображає середнє та стандартне відхилення B̂ і середні метрики.
+        </summary>
+        """
+        if not self.state.data_X.size:
+            messagebox.showerror("Error", "Data X cannot be None")
+            return
+        if not np.any(self.state.data_B):
+            messagebox.showerror("Error", "Data B cannot be None")
+            return
+        if (noise_parameters := self.__read_noise_parameters()) is None:
+            return
         try:
-            self.state.B_hat = LinearRegressionModel.calculate_B_hat(
-                X_np, Y_np
-            )
-            np.round(self.state.B_hat, self.state.b_precision)
-        except Exception as e:
-            messagebox.showerror("Calculate B̂ Error", f"Error calculating B̂: {e}")
+            replicates = int(self.gui.replicates_entry.get())
+            if not self.__check_bounds(replicates, self.MIN_REPLICATES, self.MAX_REPLICATES):
+                raise ValueError(
+                    f"Replicates must be between {self.MIN_REPLICATES} and {self.MAX_REPLICATES}"
+                )
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid replicates: {e}")
+            return
+        if (streams := self.__read_seed()) is None:
+            return
+
+        X_np = self.state.data_X
+        B_np = self.state.data_B
+        b_0 = self.state.b_0
+        solver = self.gui.solver_choice.get()
+        solver = solver if solver in LeastSquaresSolver.SOLVERS else "auto"
+        self.__submit_job(
+            "simulate",
+            lambda job: LinearRegressionModel.simulate(
+                X_np, B_np, b_0, *noise_parameters, replicates, self.MAX_PRECISION, solver, streams=streams
+            ),
+            self.__on_simulation_ready,
+        )
+
+    def __on_simulation_ready(self, result: dict):
+        """
+        <summary>
+            Відображає результати моделювання: стовпці середнього та стандартного відхилення B̂
+            і середні метрики за всіма репліками.
+        </summary>
+        <param name="result">Результат LinearRegressionModel.simulate.</param>
+        """
+        self.gui.update_display(
+            self.gui.b_hat_display,
+            np.hstack([result["B_hat_mean"], result["B_hat_std"]]),
+            self.MAX_PRECISION,
+        )
+        self.gui.update_metrics(result["metrics_mean"])
+        self.gui.solver_label.config(
+            text=f"Solver: {result['solver']} (R={result['B_hat'].shape[1]})"
+        )
 
-        if self.state.B_hat is None:
-            messagebox.showerror("Error", "Failed to calculate B̂")
+    @instrumented("cross_validate")
+    def cross_validate(self):
+        """
+        <summary>
+            Перехресна перевірка поточних X та y: k-кратна (частини обчислюються паралельно,
+            навчальні статистики — відніманням статистик частини) або з виключенням по одному
+            ("loo") через діагональ матриці впливу без n повторних оцінок.
+        </summary>
+        """
+        if not self.state.data_Y.size:
+            messagebox.showerror("Error", "Calculate y first")
+            return
+        text = self.gui.folds_entry.get().strip().lower()
+        leave_one_out = text == "loo"
+        if not leave_one_out:
+            try:
+                folds = int(text)
+                if not self.__check_bounds(folds, 2, self.state.data_X.shape[0]):
+                    raise ValueError(f"Folds must be between 2 and {self.state.data_X.shape[0]} or 'loo'")
+            except ValueError as e:
+                messagebox.showerror("Error", f"Invalid folds: {e}")
+                return
+            if (streams := self.__read_seed()) is None:
+                return
+
+        X_np = self.state.data_X
+        Y_np = self.state.data_Y
+        solver = self.gui.solver_choice.get() or "auto"
+
+        def job(context: JobContext):
+            if leave_one_out:
+                return LinearRegressionModel.calculate_leave_one_out(X_np, Y_np, solver)
+            return LinearRegressionModel.calculate_cross_validation(X_np, Y_np, folds, streams)
+
+        self.__submit_job(
+            "cv",
+            job,
+            self.gui.show_cross_validation,
+            lambda e: messagebox.showerror("Cross-validation Error", f"Error in cross-validation: {e}"),
+        )
+
+    @instrumented("bootstrap")
+    def bootstrap(self):
+        """
+        <summary>
+            Бутстреп-оцінка невизначеності B̂ за поточними X та y без істинних коефіцієнтів:
+            вибірки з мультиноміальними вагами рядків розв'язуються паралельно в пулі процесів.
+            Поруч із B̂ відображаються бутстреп-стандартні похибки та межі перцентильних інтервалів.
+        </summary>
+        """
+        if not self.state.B_hat.size or not self.state.data_Y.size:
+            messagebox.showerror("Error", "Calculate B̂ first")
+            return
+        try:
+            resamples = int(self.gui.resamples_entry.get())
+            if not self.__check_bounds(resamples, self.MIN_REPLICATES, self.MAX_REPLICATES):
+                raise ValueError(
+                    f"Resamples must be between {self.MIN_REPLICATES} and {self.MAX_REPLICATES}"
+                )
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid resamples: {e}")
+            return
+        if (streams := self.__read_seed()) is None:
             return
 
+        X_np = self.state.data_X
+        Y_np = self.state.data_Y
+        self.__submit_job(
+            "bootstrap",
+            lambda job: LinearRegressionModel.calculate_bootstrap(
+                X_np, Y_np, resamples, self.BOOTSTRAP_CONFIDENCE, streams
+            ),
+            self.__on_bootstrap_ready,
+            lambda e: messagebox.showerror("Bootstrap Error", f"Error in bootstrap: {e}"),
+        )
+
+    def __on_bootstrap_ready(self, result: dict):
+        """
+        <summary>
+            Відображає B̂ разом зі стовпцями бутстреп-стандартних похибок і меж довірчих інтервалів.
+        </summary>
+        <param name="result">Результат LinearRegressionModel.calculate_bootstrap.</param>
+        """
         self.gui.update_display(
             self.gui.b_hat_display,
-            self.state.B_hat,
+            np.hstack([self.state.B_hat, result["B_hat_std"], result["lower"], result["upper"]]),
             self.MAX_PRECISION,
         )
+        self.gui.solver_label.config(
+            text=f"Solver: {self.state.solver_used} (bootstrap R={result['B_hat'].shape[0]}, "
+            f"{result['confidence']:.0%} CI)"
+        )
+
+    @instrumented("append_rows")
+    def append_rows(self):
+        """
+        <summary>
+            Дописує до датасету нові спостереження: рядки X з діапазону поточної X,
+            шум з параметрами E та σ і відповідні y. B̂ оновлюється рекурсивним МНК
+            за O(k·p²) без повторної оцінки за всіма даними.
+        </summary>
+        """
+        if not self.state.B_hat.size or not self.state.data_Y.size:
+            messagebox.showerror("Error", "Calculate B̂ first")
+            return
+        try:
+            rows = int(self.gui.append_rows_entry.get())
+            max_rows = self.MAX_DIMENSION_DATASET - self.state.n_obs
+            if not self.__check_bounds(rows, 1, max_rows):
+                raise ValueError(f"Rows must be between 1 and {max_rows}")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid rows: {e}")
+            return
+        try:
+            forgetting = float(self.gui.forgetting_entry.get())
+            refactor_every = int(self.gui.refactor_every_entry.get())
+            if not 0 < forgetting <= 1:
+                raise ValueError("forgetting factor must be in (0, 1]")
+            if refactor_every < 0:
+                raise ValueError("refactor interval must be non-negative")
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid RLS parameters: {e}")
+            return
+        if (noise_parameters := self.__read_noise_parameters()) is None:
+            return
+        if (streams := self.__read_seed()) is None:
+            return
+
+        X_np = self.state.data_X
+        Y_np = self.state.data_Y
+        B_np = self.state.data_B
+        b_0 = self.state.b_0
+        x_precision = self.state.x_precision
+        rls = self.rls
 
-        B_pred = self.state.B_hat
-        metrics = LinearRegressionModel.calculate_metrics(B_np, B_pred[1:])
+        def job(context: JobContext):
+            offset = X_np.shape[0]
+            X_new = InputVectors.generate_rows_like(
+                X_np, rows, x_precision, streams, (RandomStreams.APPEND, offset, RandomStreams.X)
+            )
+            noise_new = LinearRegressionModel.generate_noise(
+                *noise_parameters,
+                rows,
+                self.MAX_PRECISION,
+                streams,
+                (RandomStreams.APPEND, offset, RandomStreams.NOISE),
+            )
+            Y_new = LinearRegressionModel.calculate_y(X_new, B_np, b_0, noise_new)
+            context.progress(0.2)
+            if rls is None:
+                model = RecursiveLeastSquares(forgetting, refactor_every).initialize(X_np, Y_np)
+            else:
+                # Оновлюється копія: спільна модель замінюється лише в on_done, тож скасована
+                # або застаріла задача не залишає її частково оновленою
+                model = copy.deepcopy(rls)
+                model.forgetting, model.refactor_every = forgetting, refactor_every
+            context.progress(0.8)
+            model.update(X_new, Y_new)
+            B_hat = model.B_hat
+            metrics = LinearRegressionModel.calculate_metrics(B_np, B_hat[1:])
+            return (X_np, Y_np, rls), model, X_new, noise_new, Y_new, B_hat, metrics
+
+        self.__submit_job("append", job, self.__on_rows_appended)
+
+    def __on_rows_appended(self, result: tuple):
+        """
+        <summary>
+            Додає нові рядки до X, шуму та y у стані, зберігає оновлений B̂ і відображає результати.
+        </summary>
+        <param name="result">Кортеж (вихідні X, y та модель RLS, оновлена модель RLS, нові рядки X,
+        новий шум, нові y, B̂, метрики).</param>
+        """
+        (X_np, Y_np, rls), model, X_new, noise_new, Y_new, B_hat, metrics = result
+        if self.state.data_X is not X_np or self.state.data_Y is not Y_np or self.rls is not rls:
+            # Поки задача виконувалася, дані змінено (Calculate, Clear тощо): результат застарів
+            messagebox.showerror("Error", "The data changed while appending rows; append again")
+            return
+        self.rls, self.state.B_hat = model, B_hat
+        if is_sparse(self.state.data_X):
+            self.state.data_X = scipy_sparse().vstack([self.state.data_X, X_new], format="csr")
+        else:
+            self.state.data_X = np.vstack([self.state.data_X, X_new])
+        self.state.noise = np.concatenate([self.state.noise, noise_new])
+        self.state.data_Y = np.vstack([self.state.data_Y, Y_new])
+        self.state.n_obs = self.state.data_X.shape[0]
+        self.state.solver_used = "rls"
+        self.gui.obs_entry.delete(0, tk.END)
+        self.gui.obs_entry.insert(0, self.state.n_obs)
+        self.gui.update_display(self.gui.x_display, self.state.data_X, self.state.x_precision)
+        self.gui.update_display(self.gui.noise_display, self.state.noise.reshape(-1, 1), self.MAX_PRECISION)
+        self.gui.update_display(self.gui.y_display, self.state.data_Y, self.state.b_precision)
+        self.gui.update_display(self.gui.b_hat_display, self.state.B_hat, self.MAX_PRECISION)
         self.gui.update_metrics(metrics)
+        self.gui.solver_label.config(text=f"Solver: rls (n={self.rls.n_obs})")
         self.save_state()
 
+    def __submit_job(self, stage: str, job, on_done, on_error=None):
+        """
+        <summary>
+            Запускає обчислення етапу у фоновому потоці. Для кожного етапу допускається
+            лише одна активна задача. Обчислення та обробка результату вимірюються
+            окремо як етапи "<stage>: compute" і "<stage>: display".
+        </summary>
+        <param name="stage">Назва етапу.</param>
+        <param name="job">Функція, що приймає JobContext і повертає результат.</param>
+        <param name="on_done">Обробник результату в головному потоці.</param>
+        <param name="on_error">Обробник винятку в головному потоці.</param>
+        """
+        def measured_job(context: JobContext):
+            with self.instrumentation.measure(f"{stage}: compute"):
+                return job(context)
+
+        def measured_on_done(result):
+            with self.instrumentation.measure(f"{stage}: display"):
+                on_done(result)
+
+        if not self.jobs.submit(
+            stage,
+            measured_job,
+            measured_on_done,
+            on_error or (lambda e: messagebox.showerror("Error", str(e))),
+        ):
+            messagebox.showerror("Error", f"The '{stage}' step is still running")
+
+    def cancel_jobs(self):
+        """
+        <summary>
+            Скасовує всі фонові обчислення.
+        </summary>
+        """
+        self.jobs.cancel()
+
+    def __refresh_timings(self):
+        """
+        <summary>
+            Періодично оновлює панель вимірів у головному потоці. Виміри записуються
+            також із фонових потоків, тому панель не оновлюється безпосередньо з них.
+        </summary>
+        """
+        if self.instrumentation.version != self.__timings_version:
+            self.__timings_version = self.instrumentation.version
+            self.gui.update_timings(self.instrumentation.last_run())
+        self.root.after(self.TIMINGS_REFRESH_MS, self.__refresh_timings)
+
+    def toggle_profiling(self):
+        """
+        <summary>
+            Вмикає або вимикає профілювання етапів через cProfile згідно з прапорцем у GUI.
+            Разом із профілюванням вмикається облік пам'яті етапів (tracemalloc),
+            який поза профілюванням не ведеться, щоб не сповільнювати виділення пам'яті.
+        </summary>
+        """
+        enabled = self.gui.profile_var.get()
+        self.instrumentation.set_profiling(enabled)
+        self.instrumentation.set_memory_tracking(enabled)
+
+    def dump_profile(self):
+        """
+        <summary>
+            Зберігає накопичений профіль етапів у файл формату pstats.
+        </summary>
+        """
+        path = filedialog.asksaveasfilename(
+            defaultextension=".pstats", filetypes=[("pstats files", "*.pstats")]
+        )
+        if path and not self.instrumentation.dump_profile(path):
+            messagebox.showerror("Error", "No profile recorded: enable Profile and run a step first")
+
+    def log_timings_to_file(self):
+        """
+        <summary>
+            Починає записувати виміри етапів у файл журналу (JSON-рядки).
+        </summary>
+        """
+        path = filedialog.asksaveasfilename(
+            defaultextension=".jsonl", filetypes=[("JSON lines", "*.jsonl")]
+        )
+        if path:
+            self.instrumentation.log_to_file(path)
+
 
 if __name__ == "__main__":
     root = tk.Tk()
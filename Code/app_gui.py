@@ -2,6 +2,10 @@ import tkinter as tk
 from tkinter import ttk
 import numpy as np
 
+from input_vectors import InputVectors
+from linear_regression_model import LinearRegressionModel
+from matrix_view import MatrixView
+
 
 class AppGui:
 
@@ -37,6 +41,8 @@ class AppGui:
         self.setup_dimensions_panel()
         self.setup_input_panels()
         self.setup_results_panel()
+        self.setup_timings_panel()
+        self.setup_status_panel()
 
     def setup_title_label(self):
         """
@@ -68,6 +74,10 @@ class AppGui:
         )
         self.dimensions_label.grid(row=0, column=6, padx=2, pady=2)
 
+        ttk.Label(frame, text="Seed:").grid(row=0, column=7, padx=2, pady=2)
+        self.seed_entry = ttk.Entry(frame, width=12)
+        self.seed_entry.grid(row=0, column=8, padx=2, pady=2)
+
         ttk.Button(frame, text="Apply", command=self.app.apply_dimensions).grid(
             row=0, column=4, padx=2, pady=2
         )
@@ -112,15 +122,29 @@ class AppGui:
         self.x_precision_entry = ttk.Entry(self.x_range_frame, width=8)
         self.x_precision_entry.grid(row=0, column=5, padx=2, pady=2)
 
+        ttk.Label(self.x_range_frame, text="Density:").grid(
+            row=0, column=6, padx=2, pady=2
+        )
+        self.x_density_entry = ttk.Entry(self.x_range_frame, width=8)
+        self.x_density_entry.grid(row=0, column=7, padx=2, pady=2)
+
         ttk.Button(frame, text="Apply", command=self.app.apply_X).grid(
             row=0, column=2, padx=2, pady=2
         )
+
+        ttk.Label(frame, text="Type:").grid(row=0, column=3, padx=2, pady=2)
+        self.x_dtype_choice = ttk.Combobox(
+            frame, values=InputVectors.DTYPES, width=8, state="readonly"
+        )
+        self.x_dtype_choice.set(InputVectors.DTYPES[0])
+        self.x_dtype_choice.grid(row=0, column=4, padx=2, pady=2)
         ttk.Label(
             frame,
             text=(
                 f"1) File (.csv) input will automatically set the size\n"
                 f"2) X values within the range of [{self.app.MIN_VAL};{self.app.MAX_VAL}]\n"
-                f"3) Maximum precision - {self.app.MAX_PRECISION} decimal places"
+                f"3) Maximum precision - {self.app.MAX_PRECISION} decimal places\n"
+                f"4) Density below 1 (or a .npz/.mtx file) gives a sparse X"
             ),
             anchor="w",
             justify="left",
@@ -252,7 +276,7 @@ class AppGui:
             "Values (y)", 4, 4, height=30, width=25
         )
         self.b_hat_display = self.create_matrix_display(
-            "Estimated B̂", 4, 5, height=30, width=25
+            "Estimated B̂ | SE | t", 4, 5, height=30, width=25
         )
 
         metrics_frame = ttk.LabelFrame(self.root, text="Metrics (B vs B̂)")
@@ -265,30 +289,134 @@ class AppGui:
         self.mae_label.pack(padx=2, pady=2)
         self.mape_label = ttk.Label(metrics_frame, text="MAPE: N/A")
         self.mape_label.pack(padx=2, pady=2)
+        self.r2_label = ttk.Label(metrics_frame, text="R²: N/A")
+        self.r2_label.pack(padx=2, pady=2)
+        self.adj_r2_label = ttk.Label(metrics_frame, text="Adj. R²: N/A")
+        self.adj_r2_label.pack(padx=2, pady=2)
+        self.residual_variance_label = ttk.Label(metrics_frame, text="σ̂²: N/A")
+        self.residual_variance_label.pack(padx=2, pady=2)
+        self.lambda_label = ttk.Label(metrics_frame, text="λ (GCV): N/A")
+        self.lambda_label.pack(padx=2, pady=2)
+        self.df_label = ttk.Label(metrics_frame, text="df(λ): N/A")
+        self.df_label.pack(padx=2, pady=2)
+        self.cv_mse_label = ttk.Label(metrics_frame, text="CV MSE: N/A")
+        self.cv_mse_label.pack(padx=2, pady=2)
+        self.cv_r2_label = ttk.Label(metrics_frame, text="CV R²: N/A")
+        self.cv_r2_label.pack(padx=2, pady=2)
+        self.solver_label = ttk.Label(metrics_frame, text="Solver: N/A")
+        self.solver_label.pack(padx=2, pady=2)
+        self.solver_choice = ttk.Combobox(
+            metrics_frame, values=list(LinearRegressionModel.SOLVERS), width=10, state="readonly"
+        )
+        self.solver_choice.set("auto")
+        self.solver_choice.pack(padx=2, pady=2)
         ttk.Button(
             metrics_frame, text="Calculate", command=self.app.calculate_y_and_B_hat
         ).pack(anchor="se", side="bottom", padx=10, pady=10)
+        simulation_frame = ttk.Frame(metrics_frame)
+        simulation_frame.pack(side="bottom", padx=2, pady=2)
+        ttk.Label(simulation_frame, text="Replicates:").grid(row=0, column=0, padx=2, pady=2)
+        self.replicates_entry = ttk.Entry(simulation_frame, width=8)
+        self.replicates_entry.insert(0, "1000")
+        self.replicates_entry.grid(row=0, column=1, padx=2, pady=2)
+        ttk.Button(simulation_frame, text="Simulate", command=self.app.simulate).grid(
+            row=0, column=2, padx=2, pady=2
+        )
+        ttk.Label(simulation_frame, text="Rows:").grid(row=1, column=0, padx=2, pady=2)
+        self.append_rows_entry = ttk.Entry(simulation_frame, width=8)
+        self.append_rows_entry.insert(0, "100")
+        self.append_rows_entry.grid(row=1, column=1, padx=2, pady=2)
+        ttk.Button(simulation_frame, text="Append rows", command=self.app.append_rows).grid(
+            row=1, column=2, padx=2, pady=2
+        )
+        ttk.Label(simulation_frame, text="Tol:").grid(row=2, column=0, padx=2, pady=2)
+        self.tolerance_entry = ttk.Entry(simulation_frame, width=8)
+        self.tolerance_entry.insert(0, "1e-10")
+        self.tolerance_entry.grid(row=2, column=1, padx=2, pady=2)
+        ttk.Label(simulation_frame, text="Max iter:").grid(row=3, column=0, padx=2, pady=2)
+        self.max_iterations_entry = ttk.Entry(simulation_frame, width=8)
+        self.max_iterations_entry.grid(row=3, column=1, padx=2, pady=2)
+        ttk.Label(simulation_frame, text="Folds:").grid(row=4, column=0, padx=2, pady=2)
+        self.folds_entry = ttk.Entry(simulation_frame, width=8)
+        self.folds_entry.insert(0, "5")
+        self.folds_entry.grid(row=4, column=1, padx=2, pady=2)
+        ttk.Button(simulation_frame, text="Cross-validate", command=self.app.cross_validate).grid(
+            row=4, column=2, padx=2, pady=2
+        )
+        ttk.Label(simulation_frame, text="Resamples:").grid(row=5, column=0, padx=2, pady=2)
+        self.resamples_entry = ttk.Entry(simulation_frame, width=8)
+        self.resamples_entry.insert(0, "1000")
+        self.resamples_entry.grid(row=5, column=1, padx=2, pady=2)
+        ttk.Button(simulation_frame, text="Bootstrap", command=self.app.bootstrap).grid(
+            row=5, column=2, padx=2, pady=2
+        )
+        ttk.Label(simulation_frame, text="Forgetting:").grid(row=6, column=0, padx=2, pady=2)
+        self.forgetting_entry = ttk.Entry(simulation_frame, width=8)
+        self.forgetting_entry.insert(0, "1")
+        self.forgetting_entry.grid(row=6, column=1, padx=2, pady=2)
+        ttk.Label(simulation_frame, text="Refactor every:").grid(row=7, column=0, padx=2, pady=2)
+        self.refactor_every_entry = ttk.Entry(simulation_frame, width=8)
+        self.refactor_every_entry.insert(0, "100")
+        self.refactor_every_entry.grid(row=7, column=1, padx=2, pady=2)
         ttk.Button(metrics_frame, text="Clear all", command=self.app.clear_state).pack(
             anchor="se", side="bottom", padx=10, pady=10
         )
 
+    def setup_timings_panel(self):
+        """
+        Створює панель вимірів останнього виконання етапів: час, процесорний час і виділена пам'ять,
+        а також керування профілюванням і журналом етапів.
+        """
+        frame = ttk.LabelFrame(self.root, text="Timings (last run)")
+        frame.grid(row=1, column=6, rowspan=2, padx=5, pady=2, sticky="nsew")
+        self.timings_table = ttk.Treeview(
+            frame, columns=("wall", "cpu", "memory"), height=8, selectmode="none"
+        )
+        self.timings_table.heading("#0", text="Stage")
+        self.timings_table.heading("wall", text="Wall, s")
+        self.timings_table.heading("cpu", text="CPU, s")
+        self.timings_table.heading("memory", text="Alloc, MiB")
+        self.timings_table.column("#0", width=140)
+        for column in ("wall", "cpu", "memory"):
+            self.timings_table.column(column, width=70, anchor="e")
+        self.timings_table.pack(fill="both", expand=True, padx=2, pady=2)
+
+        controls = ttk.Frame(frame)
+        controls.pack(fill="x", padx=2, pady=2)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            controls, text="Profile", variable=self.profile_var, command=self.app.toggle_profiling
+        ).pack(side="left", padx=2)
+        ttk.Button(controls, text="Save profile", command=self.app.dump_profile).pack(side="left", padx=2)
+        ttk.Button(controls, text="Log to file", command=self.app.log_timings_to_file).pack(side="left", padx=2)
+
+    def setup_status_panel(self):
+        """
+        Створює панель стану фонових обчислень: назва етапу, індикатор прогресу та кнопка скасування.
+        """
+        frame = ttk.Frame(self.root)
+        frame.grid(row=5, column=0, columnspan=7, padx=5, pady=2, sticky="ew")
+        self.status_label = ttk.Label(frame, text="Ready", width=30)
+        self.status_label.pack(side="left", padx=2, pady=2)
+        self.progress_bar = ttk.Progressbar(frame, mode="determinate", maximum=1.0, length=300)
+        self.progress_bar.pack(side="left", padx=2, pady=2)
+        self.cancel_button = ttk.Button(
+            frame, text="Cancel", command=self.app.cancel_jobs, state="disabled"
+        )
+        self.cancel_button.pack(side="left", padx=2, pady=2)
+
     def create_matrix_display(
         self, title: str, row: int, col: int, height: int, width: int
-    ) -> tk.Text:
-        # Створює текстове поле з прокруткою для виводу матриці.
+    ) -> MatrixView:
+        # Створює віртуалізований перегляд матриці з прокруткою.
         # title — заголовок рамки
         # row, col — координати в сітці
         # height, width — розміри текстового поля
         frame = ttk.LabelFrame(self.root, text=title)
         frame.grid(row=row, column=col, padx=5, pady=2, sticky="nsew")
-        text = tk.Text(frame, height=height, width=width, state="disabled", wrap="none")
-        scrollbar_y = ttk.Scrollbar(frame, orient="vertical", command=text.yview)
-        scrollbar_x = ttk.Scrollbar(frame, orient="horizontal", command=text.xview)
-        text.config(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
-        scrollbar_y.pack(side="right", fill="y")
-        scrollbar_x.pack(side="bottom", fill="x")
-        text.pack(fill="both", expand=True)
-        return text
+        view = MatrixView(frame, height=height, width=width)
+        view.pack(fill="both", expand=True)
+        return view
 
     def toggle_x_range_fields(self, _=None):
         # Перемикає відображення полів для введення діапазону X,
@@ -306,22 +434,78 @@ class AppGui:
         else:
             self.b_range_frame.grid_remove()
 
-    def update_display(self, text_widget: tk.Text, data: np.ndarray, precision: int):
-        # Очищує текстове поле і вставляє нові рядки даних із заданою точністю.
-        # text_widget — поле, в яке виводяться дані
+    def update_display(self, view: MatrixView, data: np.ndarray, precision: int):
+        # Передає дані у віртуалізований перегляд; форматуються лише видимі рядки.
+        # view — перегляд, в який виводяться дані
         # data — масив чисел
         # precision — кількість знаків після коми
-        text_widget.config(state="normal")
-        text_widget.delete(1.0, tk.END)
-        for row in data:
-            formatted_row = ", ".join(f"{round(val, precision)}" for val in row)
-            text_widget.insert(tk.END, f"{formatted_row}\n")
-        text_widget.config(state="disabled")
+        view.set_data(data, precision)
+
+    def update_progress(self, stage: str | None, fraction: float):
+        # Відображає прогрес фонової задачі.
+        # stage — назва етапу або None, якщо активних задач немає
+        # fraction — частка виконаної роботи
+        if stage is None:
+            self.status_label.config(text="Ready")
+            self.progress_bar["value"] = 0
+            self.cancel_button.config(state="disabled")
+        else:
+            self.status_label.config(text=f"Running: {stage}")
+            self.progress_bar["value"] = fraction
+            self.cancel_button.config(state="normal")
+
+    def update_timings(self, timings: list):
+        # Виводить останні виміри етапів у таблицю.
+        # timings — список StageTiming у порядку завершення етапів
+        self.timings_table.delete(*self.timings_table.get_children())
+        for timing in timings:
+            memory = "N/A" if timing.allocated_bytes is None else f"{timing.allocated_bytes / 2**20:.1f}"
+            self.timings_table.insert(
+                "", "end", text=timing.stage, values=(f"{timing.wall_seconds:.3f}", f"{timing.cpu_seconds:.3f}", memory)
+            )
 
     def update_metrics(self, metrics: dict):
-        # Виводить метрики помилок (MSE, RMSE, MAE, MAPE) у відповідні поля.
+        # Виводить метрики помилок (MSE, RMSE, MAE, MAPE) та, якщо вони є, R², скоригований R²,
+        # дисперсію залишків, а для гребеневої регресії — обране λ та df(λ) у відповідні поля.
         # metrics — словник з обчисленими значеннями
         self.mse_label.config(text=f"MSE: {metrics['mse']:.9f}")
         self.rmse_label.config(text=f"RMSE: {metrics['rmse']:.9f}")
         self.mae_label.config(text=f"MAE: {metrics['mae']:.9f}")
-        self.mape_label.config(text=f"MAPE: {metrics['mape']:.9f}%")
\ No newline at end of file
+        self.mape_label.config(text=f"MAPE: {metrics['mape']:.9f}%")
+        for label, name, title in (
+            (self.r2_label, "r2", "R²"),
+            (self.adj_r2_label, "adj_r2", "Adj. R²"),
+            (self.residual_variance_label, "residual_variance", "σ̂²"),
+            (self.lambda_label, "lambda", "λ (GCV)"),
+            (self.df_label, "df", "df(λ)"),
+        ):
+            label.config(text=f"{title}: {metrics[name]:.9f}" if name in metrics else f"{title}: N/A")
+
+    def show_cross_validation(self, result: dict):
+        # Виводить середні метрики перехресної перевірки, а для k-кратної перевірки —
+        # ще й таблицю метрик кожної частини в окремому вікні.
+        # result — результат calculate_cross_validation або calculate_leave_one_out
+        summary = result.get("mean", result)
+        self.cv_mse_label.config(text=f"CV MSE: {summary['mse']:.9f}")
+        self.cv_r2_label.config(text=f"CV R²: {summary['r2']:.9f}")
+        if "folds" not in result:
+            return
+        window = tk.Toplevel(self.root)
+        window.title(f"Cross-validation ({len(result['folds'])} folds)")
+        columns = ("n_test", "mse", "rmse", "r2")
+        table = ttk.Treeview(window, columns=columns, height=min(len(result["folds"]) + 1, 20), selectmode="none")
+        table.heading("#0", text="Fold")
+        table.column("#0", width=60)
+        for column, title in zip(columns, ("n", "MSE", "RMSE", "R²")):
+            table.heading(column, text=title)
+            table.column(column, width=110, anchor="e")
+        for fold in result["folds"]:
+            table.insert(
+                "", "end", text=str(fold["fold"]),
+                values=(fold["n_test"], *(f"{fold[name]:.9f}" for name in columns[1:])),
+            )
+        table.insert(
+            "", "end", text="mean",
+            values=(sum(fold["n_test"] for fold in result["folds"]), *(f"{summary[name]:.9f}" for name in columns[1:])),
+        )
+        table.pack(fill="both", expand=True, padx=2, pady=2)
@@ -12,5 +12,10 @@ class AppState:
     B_hat: np.ndarray = ndarray_field()
     noise: np.ndarray = ndarray_field()
     x_precision: int = 9
+    dtype: str = "float64"
+    x_density: float = 1.0
     b_precision: int = 9
-    b_0: float = 1.0
\ No newline at end of file
+    b_0: float = 1.0
+    seed: int | None = None
+    solver: str = "auto"
+    solver_used: str = ""
@@ -0,0 +1,47 @@
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from input_vectors import InputVectors
+
+
+# <summary>
+# Порівнює час завантаження файлу через np.loadtxt та InputVectors.read_matrix_file
+# на згенерованих файлах заданої кількості рядків.
+# Приклад: python benchmark_loader.py --rows 100000 1000000 10000000 --cols 10
+# </summary>
+def main():
+    parser = argparse.ArgumentParser(description="Text loader benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--cols", type=int, default=100)
+    parser.add_argument("--dtype", choices=["float32", "float64"], default="float64")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>10} {'MiB':>8} {'loadtxt, s':>11} {'chunked, s':>11} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.rows:
+            file_path = os.path.join(directory, f"X_{rows}.txt")
+            with open(file_path, "w") as f:
+                for start in range(0, rows, 100_000):
+                    block = rng.uniform(0, 100, size=(min(100_000, rows - start), args.cols))
+                    np.savetxt(f, block, delimiter=",", fmt="%.6f")
+
+            start = time.perf_counter()
+            np.loadtxt(file_path, delimiter=",", dtype=args.dtype)
+            baseline = time.perf_counter() - start
+
+            start = time.perf_counter()
+            InputVectors.read_matrix_file(file_path, dtype=args.dtype)
+            chunked = time.perf_counter() - start
+
+            size = os.path.getsize(file_path) / 2**20
+            print(f"{rows:>10} {size:>8.0f} {baseline:>11.3f} {chunked:>11.3f} {baseline / chunked:>8.2f}")
+            os.remove(file_path)
+
+
+if __name__ == "__main__":
+    main()
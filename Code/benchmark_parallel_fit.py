@@ -0,0 +1,55 @@
+import argparse
+import os
+import time
+
+import numpy as np
+
+from linear_regression_model import LinearRegressionModel
+
+
+# <summary>
+# Повертає степені двійки до кількості ядер включно та саму кількість ядер.
+# </summary>
+def default_workers() -> list[int]:
+    cpu_count = os.cpu_count() or 1
+    return sorted({2 ** i for i in range(cpu_count.bit_length()) if 2 ** i <= cpu_count} | {cpu_count})
+
+
+# <summary>
+# Вимірює час паралельного накопичення XᵀX/XᵀY для різної кількості потоків
+# і виводить прискорення відносно одного потоку.
+# Приклад: python benchmark_parallel_fit.py --rows 1000000 --cols 200
+# </summary>
+def main():
+    parser = argparse.ArgumentParser(description="Parallel Gram accumulation scaling benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cols", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=default_workers(),
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 100, size=(args.rows, args.cols))
+    Y = X @ rng.uniform(0, 10, size=(args.cols, 1)) + 1.0 + rng.normal(size=(args.rows, 1))
+
+    print(f"X: {args.rows}x{args.cols} float64, {X.nbytes / 2**20:.0f} MiB")
+    print(f"{'workers':>8} {'best, s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            LinearRegressionModel.calculate_B_hat_parallel(X, Y, n_workers=workers, blas_threads=1)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        baseline = baseline or best
+        print(f"{workers:>8} {best:>10.3f} {baseline / best:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
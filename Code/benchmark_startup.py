@@ -0,0 +1,90 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Скрипт, що вимірює час створення App у чистому процесі. Без дисплея виводить "skipped"
+CONSTRUCT_SCRIPT = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print("skipped")
+    raise SystemExit
+root.withdraw()
+from app import App
+App(root)
+root.update_idletasks()
+print(time.perf_counter() - start)
+root.destroy()
+"""
+
+
+# <summary>
+# Запускає код Python в окремому процесі з директорією Code у sys.path.
+# Робочою директорією є тимчасова, щоб App не чіпав знімок стану поточної директорії.
+# </summary>
+# <param name="arguments">Аргументи інтерпретатора</param>
+# <returns>Результат виконання процесу</returns>
+def run_python(arguments: list[str]) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [CODE_DIR, os.environ.get("PYTHONPATH")]))}
+    with tempfile.TemporaryDirectory() as directory:
+        return subprocess.run(
+            [sys.executable, *arguments], cwd=directory, env=env, capture_output=True, text=True, check=True
+        )
+
+
+# <summary>
+# Імпортує модуль з -X importtime і розбирає звіт інтерпретатора.
+# </summary>
+# <param name="module">Назва модуля</param>
+# <returns>Список (власний час, сумарний час у секундах, модуль) у порядку звіту</returns>
+def import_times(module: str) -> list[tuple[float, float, str]]:
+    report = run_python(["-X", "importtime", "-c", f"import {module}"]).stderr
+    times = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times.append((int(self_us) / 1e6, int(cumulative_us) / 1e6, name.rstrip()))
+    return times
+
+
+# <summary>
+# Вимірює час запуску додатку: час імпорту app (з найдовшими імпортами за звітом
+# python -X importtime) і час створення App. Завершується з кодом 1, якщо один із
+# часів перевищує заданий поріг, тож скрипт можна використовувати як перевірку.
+# Приклад: python benchmark_startup.py --max-import 0.5 --max-construct 1.5
+# </summary>
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Application startup benchmark")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to show")
+    parser.add_argument("--max-import", type=float, default=0.5, help="Import time limit, s")
+    parser.add_argument("--max-construct", type=float, default=1.5, help="Import and App() time limit, s")
+    args = parser.parse_args()
+
+    times = import_times("app")
+    total = next(cumulative for _, cumulative, name in times if name.strip() == "app")
+    print(f"{'self, s':>8} {'cumul., s':>9}  module")
+    for self_time, cumulative, name in sorted(times, key=lambda t: t[1], reverse=True)[:args.top]:
+        print(f"{self_time:>8.3f} {cumulative:>9.3f}  {name}")
+    print(f"import app: {total:.3f} s (limit {args.max_import} s)")
+
+    failed = total > args.max_import
+    output = run_python(["-c", CONSTRUCT_SCRIPT]).stdout.strip()
+    if output == "skipped":
+        print("App(): skipped, no display available")
+    else:
+        construct = float(output)
+        print(f"import + App(): {construct:.3f} s (limit {args.max_construct} s)")
+        failed |= construct > args.max_construct
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # resource недоступний у Windows
+    resource = None
+
+from app_state import AppState
+from dataset_store import DatasetStore
+from input_vectors import InputVectors
+from limits import Limits
+from linear_regression_model import LinearRegressionModel
+from matrix_format import BLOCK_ROWS, format_block
+from random_streams import RandomStreams
+
+DEFAULT_SHAPES = ["1000x10", "10000x100", f"{Limits.MAX_DIMENSION_DATASET}x100"]
+
+
+# <summary>
+# Розбирає форму у вигляді "рядкиxстовпці".
+# </summary>
+# <param name="text">Рядок форми, наприклад 10000x100</param>
+# <returns>Пара (n_obs, n_feats)</returns>
+def parse_shape(text: str) -> tuple[int, int]:
+    try:
+        n_obs, n_feats = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Shape must look like 10000x100, got '{text}'") from None
+    if not (
+        Limits.MIN_DIMENSION_DATASET <= n_obs <= Limits.MAX_DIMENSION_DATASET
+        and Limits.MIN_DIMENSION_DATASET <= n_feats <= Limits.MAX_DIMENSION_DATASET
+    ):
+        raise argparse.ArgumentTypeError(
+            f"Dimensions must be in the range [{Limits.MIN_DIMENSION_DATASET}, {Limits.MAX_DIMENSION_DATASET}]"
+        )
+    return n_obs, n_feats
+
+
+# <summary>
+# Повертає пікове значення RSS процесу в байтах або None, якщо воно недоступне.
+# </summary>
+def max_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+# <summary>
+# Формує етапи конвеєра для однієї форми. Етапи виконуються по черзі і передають
+# результати через спільний словник data, як це відбувається в App.
+# update_display вимірюється без вікна: форматується одне вікно BLOCK_ROWS рядків,
+# саме його MatrixView показує після set_data.
+# </summary>
+# <param name="n_obs">Кількість спостережень</param>
+# <param name="n_feats">Кількість ознак</param>
+# <param name="directory">Тимчасова директорія для файлів</param>
+# <param name="dtype">Тип елементів X</param>
+# <returns>Список пар (назва етапу, функція етапу)</returns>
+def pipeline_stages(
+    n_obs: int, n_feats: int, directory: str, dtype: str
+) -> list[tuple[str, Callable[[], None]]]:
+    streams = RandomStreams(0)
+    precision = Limits.MAX_PRECISION
+    data = {}
+    text_path = os.path.join(directory, "X.csv")
+
+    def generate_random_matrix():
+        data["X"] = InputVectors.generate_random_matrix(
+            0, 100, n_obs, n_feats, precision, streams=streams, dtype=dtype
+        )
+        data["B"] = InputVectors.generate_random_matrix(
+            0, 10, n_feats, 1, precision, streams=streams, key=(RandomStreams.B,)
+        )
+
+    def generate_noise():
+        data["noise"] = LinearRegressionModel.generate_noise(0, 1, n_obs, precision, streams)
+
+    def calculate_y():
+        data["Y"] = LinearRegressionModel.calculate_y(data["X"], data["B"], 1.0, data["noise"])
+
+    def calculate_B_hat():
+        LinearRegressionModel.factorization_cache.clear()
+        data["B_hat"], _ = LinearRegressionModel.calculate_B_hat(data["X"], data["Y"])
+
+    def calculate_metrics():
+        LinearRegressionModel.calculate_metrics(data["B"], data["B_hat"][1:])
+        LinearRegressionModel.calculate_diagnostics(data["X"], data["Y"], data["B_hat"])
+
+    def write_text_file():
+        np.savetxt(text_path, data["X"], delimiter=",", fmt=f"%.{precision}f")
+
+    def load_from_file():
+        InputVectors.read_file(text_path, dtype=dtype)
+
+    def save_state():
+        state = AppState(
+            n_obs=n_obs,
+            n_feats=n_feats,
+            data_X=data["X"],
+            data_B=data["B"],
+            data_Y=data["Y"],
+            B_hat=data["B_hat"],
+            noise=data["noise"],
+            dtype=dtype,
+        )
+        DatasetStore.save_state(os.path.join(directory, "state"), state)
+
+    def update_display():
+        format_block(data["X"][:BLOCK_ROWS], precision)
+
+    return [
+        ("generate_random_matrix", generate_random_matrix),
+        ("generate_noise", generate_noise),
+        ("calculate_y", calculate_y),
+        ("calculate_B_hat", calculate_B_hat),
+        ("calculate_metrics", calculate_metrics),
+        ("write_text_file", write_text_file),
+        ("load_from_file", load_from_file),
+        ("save_state", save_state),
+        ("update_display", update_display),
+    ]
+
+
+# <summary>
+# Вимірює етап: найменший час з кількох повторів без tracemalloc, потім окремий
+# прогін під tracemalloc для пікового обсягу виділеної пам'яті.
+# </summary>
+# <param name="stage">Функція етапу</param>
+# <param name="repeats">Кількість повторів для вимірювання часу</param>
+# <returns>Словник: seconds, peak_bytes, max_rss_bytes</returns>
+def measure(stage: Callable[[], None], repeats: int) -> dict:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        stage()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_bytes": peak, "max_rss_bytes": max_rss_bytes()}
+
+
+# <summary>
+# Виконує всі етапи для кожної форми.
+# </summary>
+# <param name="shapes">Список форм (n_obs, n_feats)</param>
+# <param name="repeats">Кількість повторів для вимірювання часу</param>
+# <param name="dtype">Тип елементів X</param>
+# <returns>Список результатів: етап, форма та виміри</returns>
+def run_suite(shapes: list[tuple[int, int]], repeats: int, dtype: str) -> list[dict]:
+    results = []
+    for n_obs, n_feats in shapes:
+        with tempfile.TemporaryDirectory() as directory:
+            for name, stage in pipeline_stages(n_obs, n_feats, directory, dtype):
+                result = {"stage": name, "shape": [n_obs, n_feats], **measure(stage, repeats)}
+                results.append(result)
+                print(
+                    f"{n_obs:>7}x{n_feats:<6} {name:<24} {result['seconds']:>9.4f} s"
+                    f" {result['peak_bytes'] / 2**20:>9.1f} MiB"
+                )
+    return results
+
+
+# <summary>
+# Порівнює результати з базовими і повертає опис регресій: етап стає повільнішим
+# або виділяє більше пам'яті, ніж базовий, більш ніж на tolerance. Для часу
+# і пам'яті додатково вимагається абсолютна різниця понад min_seconds і min_bytes,
+# щоб ігнорувати шум на малих формах.
+# </summary>
+# <param name="results">Поточні результати</param>
+# <param name="baseline">Базові результати</param>
+# <param name="tolerance">Допустиме відносне погіршення</param>
+# <param name="min_seconds">Мінімальна абсолютна різниця часу, що вважається регресією</param>
+# <param name="min_bytes">Мінімальна абсолютна різниця пікової пам'яті, що вважається регресією</param>
+# <returns>Список рядків з описом регресій</returns>
+def compare(
+    results: list[dict], baseline: list[dict], tolerance: float, min_seconds: float, min_bytes: int
+) -> list[str]:
+    baseline_by_key = {(entry["stage"], tuple(entry["shape"])): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        base = baseline_by_key.get((entry["stage"], tuple(entry["shape"])))
+        if base is None:
+            continue
+        label = f"{entry['stage']} {entry['shape'][0]}x{entry['shape'][1]}"
+        if (
+            entry["seconds"] > base["seconds"] * (1 + tolerance)
+            and entry["seconds"] - base["seconds"] > min_seconds
+        ):
+            regressions.append(f"{label}: time {base['seconds']:.4f} s -> {entry['seconds']:.4f} s")
+        if (
+            entry["peak_bytes"] > base["peak_bytes"] * (1 + tolerance)
+            and entry["peak_bytes"] - base["peak_bytes"] > min_bytes
+        ):
+            regressions.append(
+                f"{label}: peak memory {base['peak_bytes'] / 2**20:.1f} MiB"
+                f" -> {entry['peak_bytes'] / 2**20:.1f} MiB"
+            )
+    return regressions
+
+
+# <summary>
+# Набір вимірювань етапів конвеєра без GUI: генерація X і шуму, y, B̂, метрики,
+# запис і читання текстового файлу, збереження стану та форматування вікна перегляду.
+# Результати записуються в JSON; з --baseline порівнюються з попереднім запуском
+# і скрипт завершується з кодом 1, якщо знайдено регресії.
+# Приклад: python benchmark_suite.py --shapes 1000x10 100000x1000 -o bench.json --baseline base.json
+# </summary>
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Regression pipeline benchmark suite")
+    parser.add_argument("--shapes", type=parse_shape, nargs="+", default=[parse_shape(s) for s in DEFAULT_SHAPES])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--dtype", choices=InputVectors.DTYPES, default=InputVectors.DTYPES[0])
+    parser.add_argument("--output", "-o", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="Ignore smaller time differences")
+    parser.add_argument("--min-bytes", type=int, default=2**20, help="Ignore smaller peak memory differences")
+    args = parser.parse_args()
+
+    results = run_suite(args.shapes, args.repeats, args.dtype)
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "dtype": args.dtype,
+            "repeats": args.repeats,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {args.output}")
+
+    if args.baseline is None:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance, args.min_seconds, args.min_bytes)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"No regressions against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from random_streams import RandomStreams
+from sparse_matrix import column_means, is_sparse
+from streaming_regression import RegressionMoments
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # threadpoolctl є необов'язковою залежністю
+    threadpool_limits = None
+
+# Дані бутстрепу в процесі пулу, встановлюються ініціалізатором процесу
+_worker: "BootstrapWorker | None" = None
+
+
+class BootstrapWorker:
+
+    # <summary>
+    # Оцінює B̂ для діапазону бутстреп-вибірок. Вибірка з номером r задається вагами —
+    # кількостями повторень рядків з мультиноміального розподілу Mult(n, 1/n), які
+    # генеруються власним потоком (BOOTSTRAP, r), тож результат не залежить від
+    # кількості процесів і розбиття на пакети. Щільна X центрується один раз при
+    # створенні, щоб XᵀWX - n·x̄x̄ᵀ не втрачала точність при великих значеннях X.
+    # </summary>
+    # <param name="X">Матриця спостережень, щільна або розріджена</param>
+    # <param name="Y">Відповіді розміру n × k</param>
+    # <param name="seed">Початкове значення RandomStreams</param>
+    def __init__(self, X: np.ndarray, Y: np.ndarray, seed: int):
+        self.x_shift = np.zeros(X.shape[1]) if is_sparse(X) else column_means(X)
+        self.y_shift = Y.mean(axis=0)
+        self.X = X if is_sparse(X) else X - self.x_shift
+        self.Y = Y - self.y_shift
+        self.streams = RandomStreams(seed)
+
+    # <summary>
+    # Оцінює коефіцієнти для вибірок start..stop-1 за зваженими статистиками
+    # без копіювання повторених рядків.
+    # </summary>
+    # <param name="start">Номер першої вибірки</param>
+    # <param name="stop">Номер після останньої вибірки</param>
+    # <returns>Масив розміру (stop - start) × (n_feats + 1) × k</returns>
+    def run(self, start: int, stop: int) -> np.ndarray:
+        n_obs = self.X.shape[0]
+        B_hats = np.empty((stop - start, self.X.shape[1] + 1, self.Y.shape[1]))
+        for index in range(start, stop):
+            generator = self.streams.generator(RandomStreams.BOOTSTRAP, index)
+            # Кількості потраплень n рівноймовірних номерів рядків мають розподіл Mult(n, 1/n)
+            weights = np.bincount(generator.integers(0, n_obs, n_obs), minlength=n_obs)
+            moments = RegressionMoments.from_weighted_block(self.X, self.Y, weights)
+            moments.x_mean += self.x_shift
+            moments.y_mean += self.y_shift
+            B_hats[index - start] = moments.solve()
+        return B_hats
+
+
+# <summary>
+# Ініціалізує процес пулу: отримує дані один раз на процес і обмежує потоки BLAS,
+# щоб процеси не конкурували за ядра.
+# </summary>
+# <param name="X">Матриця спостережень</param>
+# <param name="Y">Відповіді розміру n × k</param>
+# <param name="seed">Початкове значення RandomStreams</param>
+# <param name="blas_threads">Кількість потоків BLAS у процесі; None — не обмежувати</param>
+def _init_worker(X: np.ndarray, Y: np.ndarray, seed: int, blas_threads: int | None):
+    global _worker
+    if threadpool_limits is not None and blas_threads is not None:
+        threadpool_limits(limits=blas_threads, user_api="blas")
+    _worker = BootstrapWorker(X, Y, seed)
+
+
+# <summary>
+# Виконує пакет вибірок у процесі пулу.
+# </summary>
+# <param name="start">Номер першої вибірки</param>
+# <param name="stop">Номер після останньої вибірки</param>
+# <returns>Коефіцієнти вибірок пакета</returns>
+def _run_batch(start: int, stop: int) -> np.ndarray:
+    return _worker.run(start, stop)
+
+
+class Bootstrap:
+    # Кількість пакетів на один процес: дрібніші пакети вирівнюють навантаження
+    BATCHES_PER_WORKER = 4
+
+    # <summary>
+    # Непараметричний бутстреп коефіцієнтів МНК. Кожна вибірка коштує один зважений
+    # прохід по X за O(n·p²) без копіювання даних, а вибірки розподіляються пакетами між
+    # процесами пулу, кожен з яких отримує X один раз. Процеси запускаються методом spawn,
+    # оскільки бутстреп може викликатися з фонового потоку GUI.
+    # </summary>
+    # <param name="X">Матриця спостережень, щільна або розріджена</param>
+    # <param name="Y">Вектор або матриця відповідей</param>
+    # <param name="resamples">Кількість бутстреп-вибірок</param>
+    # <param name="streams">Джерело випадкових чисел; None — нове з випадковим seed</param>
+    # <param name="n_workers">Кількість процесів (за замовчуванням — кількість ядер); 1 — без пулу</param>
+    # <param name="blas_threads">Кількість потоків BLAS у кожному процесі; None — не обмежувати</param>
+    # <returns>Масив розміру resamples × (n_feats + 1) або resamples × (n_feats + 1) × k</returns>
+    @staticmethod
+    def resample(
+        X: np.ndarray,
+        Y: np.ndarray,
+        resamples: int = 1000,
+        streams: RandomStreams | None = None,
+        n_workers: int | None = None,
+        blas_threads: int | None = 1,
+    ) -> np.ndarray:
+        if resamples < 1:
+            raise ValueError("resamples must be positive")
+        streams = streams or RandomStreams()
+        Y_2d = Y.reshape(X.shape[0], -1)
+        n_workers = min(n_workers or os.cpu_count() or 1, resamples)
+        if n_workers == 1:
+            B_hats = BootstrapWorker(X, Y_2d, streams.seed).run(0, resamples)
+        else:
+            step = -(-resamples // (n_workers * Bootstrap.BATCHES_PER_WORKER))
+            starts = range(0, resamples, step)
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(X, Y_2d, streams.seed, blas_threads),
+            ) as executor:
+                B_hats = np.concatenate(list(executor.map(
+                    _run_batch, starts, [min(start + step, resamples) for start in starts]
+                )))
+        return B_hats if Y.ndim == 2 else B_hats[..., 0]
+
+    # <summary>
+    # Перцентильні довірчі інтервали за бутстреп-оцінками.
+    # </summary>
+    # <param name="B_hats">Бутстреп-оцінки; перша вісь — номер вибірки</param>
+    # <param name="confidence">Рівень довіри, 0 < confidence < 1</param>
+    # <returns>Нижні та верхні межі форми однієї оцінки</returns>
+    @staticmethod
+    def percentile_intervals(B_hats: np.ndarray, confidence: float = 0.95) -> tuple[np.ndarray, np.ndarray]:
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be in (0, 1)")
+        alpha = (1 - confidence) / 2
+        lower, upper = np.quantile(B_hats, [alpha, 1 - alpha], axis=0)
+        return lower, upper
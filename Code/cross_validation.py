@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+from least_squares_solver import CenteredFactorization, block_rows
+from random_streams import RandomStreams
+from sparse_matrix import to_dense
+from streaming_regression import RegressionMoments
+
+
+class CrossValidation:
+
+    # <summary>
+    # Розбиває рядки на folds частин майже однакового розміру. Без streams частини є
+    # суцільними діапазонами рядків (зрізи без копіювання X), інакше рядки перемішуються
+    # потоком RandomStreams.FOLDS, тож розбиття відтворюється за тим самим seed.
+    # </summary>
+    # <param name="n_obs">Кількість спостережень</param>
+    # <param name="folds">Кількість частин, 2 ≤ folds ≤ n_obs</param>
+    # <param name="streams">Джерело випадкових чисел для перемішування або None</param>
+    # <returns>Список зрізів або впорядкованих масивів індексів рядків кожної частини</returns>
+    @staticmethod
+    def split(n_obs: int, folds: int, streams: RandomStreams | None = None) -> list:
+        if not 2 <= folds <= n_obs:
+            raise ValueError(f"folds must be between 2 and {n_obs}")
+        if streams is None:
+            bounds = np.linspace(0, n_obs, folds + 1).astype(int)
+            return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+        permutation = streams.generator(RandomStreams.FOLDS).permutation(n_obs)
+        return [np.sort(part) for part in np.array_split(permutation, folds)]
+
+    # <summary>
+    # K-кратна перехресна перевірка з відніманням статистик частин. Центровані XᵀX та XᵀY
+    # кожної частини обчислюються один раз (паралельно), їх об'єднання дає статистики всіх
+    # даних, а навчальні статистики частини — віднімання її внеску за O(p²) замість повторного
+    # проходу по решті k - 1 частин. Помилка на тестовій частині теж обчислюється з її
+    # статистик, тож X читається рівно один раз.
+    # </summary>
+    # <param name="X">Матриця спостережень, щільна або розріджена</param>
+    # <param name="Y">Вектор або матриця відповідей</param>
+    # <param name="folds">Кількість частин</param>
+    # <param name="streams">Джерело випадкових чисел для перемішування рядків або None</param>
+    # <param name="n_workers">Кількість потоків пулу</param>
+    # <returns>Словник: folds — список метрик частин (n_test, mse, rmse, r2 — масиви довжини k),
+    # mean — середні метрики за частинами, pooled_mse — сумарна SSE / n_obs</returns>
+    @staticmethod
+    def k_fold(
+        X: np.ndarray,
+        Y: np.ndarray,
+        folds: int = 5,
+        streams: RandomStreams | None = None,
+        n_workers: int | None = None,
+    ) -> dict:
+        n_obs = X.shape[0]
+        Y_2d = Y.reshape(n_obs, -1)
+        parts = CrossValidation.split(n_obs, folds, streams)
+
+        def fold_moments(part) -> RegressionMoments:
+            return RegressionMoments.from_block(X[part], Y_2d[part])
+
+        def evaluate(moments: RegressionMoments) -> dict:
+            B_hat = total.remove(moments).solve()
+            sse = moments.sum_of_squared_errors(B_hat)
+            mse = sse / moments.n_obs
+            with np.errstate(divide="ignore", invalid="ignore"):
+                r2 = 1 - sse / moments.syy
+            return {"n_test": moments.n_obs, "sse": sse, "mse": mse, "rmse": np.sqrt(mse), "r2": r2}
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            moments = list(executor.map(fold_moments, parts))
+            total = reduce(RegressionMoments.merge, moments)
+            results = list(executor.map(evaluate, moments))
+
+        return {
+            "folds": results,
+            "mean": {name: np.mean([result[name] for result in results], axis=0) for name in ("mse", "rmse", "r2")},
+            "pooled_mse": sum(result["sse"] for result in results) / n_obs,
+        }
+
+    # <summary>
+    # Перехресна перевірка з виключенням по одному без n повторних оцінок: залишок для
+    # i-го рядка при оцінці без нього дорівнює eᵢ / (1 - hᵢᵢ), де hᵢᵢ = 1/n + xcᵢᵀ(XcᵀXc)⁻¹xcᵢ —
+    # діагональ матриці впливу. (XcᵀXc)⁻¹ береться з розкладу X, діагональ обчислюється
+    # поблоково за O(n·p²), тож уся перевірка коштує як одна оцінка.
+    # </summary>
+    # <param name="X">Матриця спостережень, щільна або розріджена</param>
+    # <param name="Y">Вектор або матриця відповідей</param>
+    # <param name="factorization">Розклад X (зазвичай з кешу розкладів)</param>
+    # <returns>Словник: press, mse, rmse, r2 — масиви довжини k; max_leverage — найбільше hᵢᵢ</returns>
+    @staticmethod
+    def leave_one_out(X: np.ndarray, Y: np.ndarray, factorization: CenteredFactorization) -> dict:
+        n_obs = X.shape[0]
+        Y_2d = Y.reshape(n_obs, -1)
+        B_hat = factorization.solve(X, Y_2d)
+        gram_inverse = factorization.gram_inverse()
+        x_mean = factorization.x_mean
+        y_mean = Y_2d.mean(axis=0)
+
+        press = np.zeros(Y_2d.shape[1])
+        sst = np.zeros(Y_2d.shape[1])
+        max_leverage = 0.0
+        step = block_rows(X)
+        for start in range(0, n_obs, step):
+            block = to_dense(X[start:start + step])
+            Xc = block - x_mean
+            leverage = 1 / n_obs + np.einsum("ij,ij->i", Xc @ gram_inverse, Xc)
+            residuals = Y_2d[start:start + step] - B_hat[0] - block @ B_hat[1:]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                loo_residuals = residuals / (1 - leverage)[:, None]
+            press += np.einsum("ij,ij->j", loo_residuals, loo_residuals)
+            deviations = Y_2d[start:start + step] - y_mean
+            sst += np.einsum("ij,ij->j", deviations, deviations)
+            max_leverage = max(max_leverage, float(leverage.max(initial=0.0)))
+
+        mse = press / n_obs
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = 1 - press / sst
+        return {"press": press, "mse": mse, "rmse": np.sqrt(mse), "r2": r2, "max_leverage": max_leverage}
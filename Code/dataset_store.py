@@ -0,0 +1,117 @@
+import contextlib
+import dataclasses
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from app_state import AppState
+from sparse_matrix import is_sparse, scipy_sparse
+
+
+class DatasetStore:
+    # Масиви AppState, що зберігаються у двійковому вигляді
+    ARRAY_FIELDS = ("data_X", "data_B", "data_Y", "noise", "B_hat")
+    METADATA_FILE = "state.json"
+
+    # <summary>
+    # Атомарно записує файл: дані пишуться у тимчасовий файл у тій самій директорії,
+    # який потім замінює цільовий через os.replace.
+    # </summary>
+    # <param name="path">Шлях до цільового файлу</param>
+    # <param name="write">Функція, що записує вміст у відкритий двійковий файл</param>
+    @staticmethod
+    def write_atomic(path: str, write) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    # <summary>
+    # Зберігає масив у форматі .npy (заголовок + сирий буфер), який можна відкрити через np.memmap.
+    # Розріджена матриця зберігається без ущільнення у форматі scipy .npz (data, indices, indptr);
+    # файл іншого формату з тим самим ім'ям поля видаляється.
+    # </summary>
+    # <param name="directory">Директорія контейнера</param>
+    # <param name="name">Ім'я поля AppState</param>
+    # <param name="array">Масив для збереження</param>
+    @staticmethod
+    def save_array(directory: str, name: str, array: np.ndarray) -> None:
+        if is_sparse(array):
+            path, stale = f"{name}.npz", f"{name}.npy"
+            write = lambda f: scipy_sparse().save_npz(f, array.tocsr(), compressed=False)  # noqa: E731
+        else:
+            path, stale = f"{name}.npy", f"{name}.npz"
+            write = lambda f: np.save(f, np.asarray(array), allow_pickle=False)  # noqa: E731
+        DatasetStore.write_atomic(os.path.join(directory, path), write)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(directory, stale))
+
+    # <summary>
+    # Зберігає скалярні поля AppState у файл state.json контейнера.
+    # </summary>
+    # <param name="directory">Директорія контейнера</param>
+    # <param name="state">Стан додатку</param>
+    @staticmethod
+    def save_metadata(directory: str, state: AppState) -> None:
+        metadata = {
+            field.name: getattr(state, field.name)
+            for field in dataclasses.fields(state)
+            if field.name not in DatasetStore.ARRAY_FIELDS
+        }
+        DatasetStore.write_atomic(
+            os.path.join(directory, DatasetStore.METADATA_FILE),
+            lambda f: f.write(json.dumps(metadata, indent=4).encode()),
+        )
+
+    # <summary>
+    # Зберігає весь стан додатку у директорію-контейнер: кожен масив в окремий .npy файл,
+    # скалярні поля — у state.json.
+    # </summary>
+    # <param name="directory">Директорія контейнера (створюється за потреби)</param>
+    # <param name="state">Стан додатку</param>
+    @staticmethod
+    def save_state(directory: str, state: AppState) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name in DatasetStore.ARRAY_FIELDS:
+            DatasetStore.save_array(directory, name, getattr(state, name))
+        DatasetStore.save_metadata(directory, state)
+
+    # <summary>
+    # Відкриває масив з .npy файлу. При mmap_mode дані не копіюються в пам'ять,
+    # а підвантажуються з диска, коли до них звертаються.
+    # </summary>
+    # <param name="path">Шлях до .npy файлу</param>
+    # <param name="mmap_mode">Режим np.memmap ("r", "r+", "c") або None для читання в пам'ять</param>
+    # <returns>Масив або np.memmap</returns>
+    @staticmethod
+    def load_array(path: str, mmap_mode: str | None = "r") -> np.ndarray:
+        return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+
+    # <summary>
+    # Відкриває стан додатку з директорії-контейнера. Розріджені масиви (.npz)
+    # читаються в пам'ять, оскільки формат CSR не відкривається через np.memmap.
+    # </summary>
+    # <param name="directory">Директорія контейнера</param>
+    # <param name="mmap_mode">Режим np.memmap для масивів або None для читання в пам'ять</param>
+    # <returns>Відновлений стан додатку</returns>
+    @staticmethod
+    def load_state(directory: str, mmap_mode: str | None = "r") -> AppState:
+        with open(os.path.join(directory, DatasetStore.METADATA_FILE)) as f:
+            metadata = json.load(f)
+        known_fields = {field.name for field in dataclasses.fields(AppState)}
+        metadata = {name: value for name, value in metadata.items() if name in known_fields}
+        arrays = {}
+        for name in DatasetStore.ARRAY_FIELDS:
+            path = os.path.join(directory, name)
+            if os.path.exists(f"{path}.npy"):
+                arrays[name] = DatasetStore.load_array(f"{path}.npy", mmap_mode)
+            elif os.path.exists(f"{path}.npz"):
+                arrays[name] = scipy_sparse().load_npz(f"{path}.npz").tocsr()
+        return AppState(**metadata, **arrays)
@@ -1,16 +1,34 @@
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+import io
+import itertools
+import os
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+
 import numpy as np
 
+from dataset_store import DatasetStore
+from random_streams import RandomStreams
+from sparse_matrix import density, is_sparse, scipy_sparse
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
 
 class InputVectors:
     MAX_MATRIX_SIZE = 10
 
+    # Підтримувані типи елементів матриці X; float32 удвічі зменшує обсяг X у пам'яті
+    DTYPES = ("float64", "float32")
+
+    # Розмір байтового блоку, який розбирається за один виклик парсера
+    CHUNK_BYTES = 16 * 2**20
+
     # <summary>
     # Ініціалізує екземпляр InputVectors з посиланням на головне вікно Tkinter.
+    # tkinter імпортується лише в діалогах, тож генерація і читання файлів працюють без Tk.
     # </summary>
     # <param name="root" type="tk.Tk">Головне вікно Tkinter</param>
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: "tk.Tk"):
         self.root = root
 
     # <summary>
@@ -24,6 +42,9 @@ class InputVectors:
     def input_matrix_gui(
             self, title: str, rows: int, cols: int, precision: int
     ) -> np.ndarray:
+        import tkinter as tk
+        from tkinter import messagebox, ttk
+
         if rows > self.MAX_MATRIX_SIZE or cols > self.MAX_MATRIX_SIZE:
             messagebox.showerror(
                 "Error",
@@ -92,31 +113,273 @@ class InputVectors:
 
     # <summary>
     # Генерує випадкову матрицю з заданими розмірами, діапазоном значень і точністю округлення.
+    # Матриця заповнюється паралельно блоками рядків з незалежних потоків RandomStreams,
+    # тому за однакового seed результат однаковий незалежно від кількості ядер.
     # </summary>
     # <param name="min_val" type="float">Мінімальне значення</param>
     # <param name="max_val" type="float">Максимальне значення</param>
     # <param name="rows" type="int">Кількість рядків</param>
     # <param name="cols" type="int">Кількість стовпців</param>
     # <param name="precision" type="int">Кількість знаків після коми для округлення</param>
+    # <param name="progress" type="Callable[[float], None] | None">Функція, що отримує частку згенерованих рядків</param>
+    # <param name="streams" type="RandomStreams | None">Джерело випадкових чисел; None — нове з випадковим seed</param>
+    # <param name="key" type="tuple[int, ...]">Ключ потоку, наприклад (RandomStreams.B,) для коефіцієнтів</param>
+    # <param name="dtype" type="np.dtype">Тип елементів матриці (float32 або float64)</param>
     # <returns type="np.ndarray">Згенерована та округлена матриця</returns>
     @staticmethod
     def generate_random_matrix(
-            min_val: float, max_val: float, rows: int, cols: int, precision: int
+            min_val: float,
+            max_val: float,
+            rows: int,
+            cols: int,
+            precision: int,
+            progress: Callable[[float], None] | None = None,
+            streams: RandomStreams | None = None,
+            key: tuple[int, ...] = (RandomStreams.X,),
+            dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
+        streams = streams or RandomStreams()
+        return streams.uniform(key, min_val, max_val, (rows, cols), precision, progress, dtype)
+
+    # <summary>
+    # Генерує розріджену випадкову матрицю CSR: кожен елемент з імовірністю density
+    # ненульовий і рівномірно розподілений на [min_val, max_val). Час і пам'ять
+    # пропорційні кількості ненульових елементів, а не rows·cols.
+    # </summary>
+    # <param name="min_val" type="float">Мінімальне значення</param>
+    # <param name="max_val" type="float">Максимальне значення</param>
+    # <param name="rows" type="int">Кількість рядків</param>
+    # <param name="cols" type="int">Кількість стовпців</param>
+    # <param name="density" type="float">Частка ненульових елементів, 0 < density ≤ 1</param>
+    # <param name="precision" type="int">Кількість знаків після коми для округлення</param>
+    # <param name="progress" type="Callable[[float], None] | None">Функція, що отримує частку згенерованих рядків</param>
+    # <param name="streams" type="RandomStreams | None">Джерело випадкових чисел; None — нове з випадковим seed</param>
+    # <param name="key" type="tuple[int, ...]">Ключ потоку</param>
+    # <param name="dtype" type="np.dtype">Тип елементів матриці (float32 або float64)</param>
+    # <returns type="scipy.sparse.csr_matrix">Згенерована розріджена матриця</returns>
+    @staticmethod
+    def generate_random_sparse_matrix(
+            min_val: float,
+            max_val: float,
+            rows: int,
+            cols: int,
+            density: float,
+            precision: int,
+            progress: Callable[[float], None] | None = None,
+            streams: RandomStreams | None = None,
+            key: tuple[int, ...] = (RandomStreams.X,),
+            dtype: np.dtype = np.float64,
+    ):
+        if not 0 < density <= 1:
+            raise ValueError("density must be in (0, 1]")
+        streams = streams or RandomStreams()
+        return streams.sparse_uniform(key, min_val, max_val, (rows, cols), density, precision, progress, dtype)
+
+    # <summary>
+    # Генерує нові рядки для дописування до X: з діапазону значень поточної X, того ж типу
+    # і, для розрідженої X, з тією ж щільністю та діапазоном ненульових значень.
+    # </summary>
+    # <param name="X" type="np.ndarray | scipy.sparse.csr_matrix">Поточна матриця спостережень</param>
+    # <param name="rows" type="int">Кількість нових рядків</param>
+    # <param name="precision" type="int">Кількість знаків після коми для округлення</param>
+    # <param name="streams" type="RandomStreams | None">Джерело випадкових чисел</param>
+    # <param name="key" type="tuple[int, ...]">Ключ потоку, наприклад (RandomStreams.APPEND, номер першого рядка, RandomStreams.X)</param>
+    # <returns type="np.ndarray | scipy.sparse.csr_matrix">Нові рядки того ж формату, що й X</returns>
+    @staticmethod
+    def generate_rows_like(
+            X, rows: int, precision: int, streams: RandomStreams | None, key: tuple[int, ...]
+    ):
+        if is_sparse(X):
+            # Діапазон ненульових значень; для X без ненульових елементів — [0, 1)
+            low, high = (float(X.data.min()), float(X.data.max())) if X.nnz else (0.0, 1.0)
+            return InputVectors.generate_random_sparse_matrix(
+                low,
+                high,
+                rows,
+                X.shape[1],
+                max(density(X), 1 / X.shape[1]),
+                precision,
+                streams=streams,
+                key=key,
+                dtype=X.dtype,
+            )
+        return InputVectors.generate_random_matrix(
+            float(X.min()), float(X.max()), rows, X.shape[1], precision, streams=streams, key=key, dtype=X.dtype
+        )
+
+    # <summary>
+    # Відкриває діалог вибору файлу з матрицею.
+    # </summary>
+    # <returns type="str">Шлях до файлу або порожній рядок, якщо вибір скасовано</returns>
+    @staticmethod
+    def ask_file_path() -> str:
+        from tkinter import filedialog
+
+        return filedialog.askopenfilename(
+            filetypes=[
+                ("Text files", "*.txt"),
+                ("CSV files", "*.csv"),
+                ("NumPy arrays", "*.npy"),
+                ("Sparse CSR/COO (scipy .npz)", "*.npz"),
+                ("Matrix Market coordinate", "*.mtx"),
+            ]
+        )
+
+    # <summary>
+    # Читає матрицю з текстового файлу з роздільниками-комами або з двійкового .npy файлу.
+    # Файл .npy відкривається через np.memmap без копіювання в пам'ять і зберігає свій тип елементів.
+    # Розріджені формати — .npz (scipy.sparse.save_npz, CSR/CSC/COO) та координатний
+    # Matrix Market .mtx — читаються як розріджена матриця CSR без ущільнення.
+    # </summary>
+    # <param name="file_path" type="str">Шлях до файлу</param>
+    # <param name="dtype" type="np.dtype">Тип елементів матриці (float32 або float64)</param>
+    # <param name="progress" type="Callable[[float], None] | None">Функція, що отримує частку розібраного файлу</param>
+    # <returns type="np.ndarray | scipy.sparse.csr_matrix">Двовимірна матриця</returns>
+    @staticmethod
+    def read_file(
+            file_path: str, dtype: np.dtype = np.float64, progress: Callable[[float], None] | None = None
     ) -> np.ndarray:
-        mat = np.random.uniform(min_val, max_val, size=(rows, cols))
-        return np.round(mat, precision)
+        if file_path.endswith(".npy"):
+            return np.atleast_2d(DatasetStore.load_array(file_path))
+        if file_path.endswith((".npz", ".mtx")):
+            return InputVectors.read_sparse_file(file_path, dtype)
+        return InputVectors.read_matrix_file(file_path, dtype=dtype, progress=progress)
+
+    # <summary>
+    # Читає розріджену матрицю з файлу .npz (scipy.sparse.save_npz) або координатного
+    # файлу Matrix Market .mtx і перетворює її у CSR.
+    # </summary>
+    # <param name="file_path" type="str">Шлях до файлу</param>
+    # <param name="dtype" type="np.dtype">Тип елементів матриці (float32 або float64)</param>
+    # <returns type="scipy.sparse.csr_matrix">Розріджена матриця</returns>
+    @staticmethod
+    def read_sparse_file(file_path: str, dtype: np.dtype = np.float64):
+        if file_path.endswith(".mtx"):
+            from scipy.io import mmread
+
+            matrix = mmread(file_path)
+        else:
+            matrix = scipy_sparse().load_npz(file_path)
+        if not scipy_sparse().issparse(matrix):
+            raise ValueError("Matrix Market file must use the coordinate format")
+        return scipy_sparse().csr_matrix(matrix, dtype=dtype)
 
     # <summary>
-    # Відкриває діалог для завантаження матриці з текстового файлу з роздільниками-комами.
+    # Відкриває діалог для завантаження матриці з текстового файлу з роздільниками-комами
+    # або з двійкового .npy файлу.
     # </summary>
+    # <param name="dtype" type="np.dtype">Тип елементів матриці (float32 або float64)</param>
+    # <param name="progress" type="Callable[[float], None] | None">Функція, що отримує частку розібраного файлу</param>
     # <returns type="np.ndarray | None">Завантажена матриця або порожній масив, якщо скасовано або коректно задано</returns>
     @staticmethod
-    def load_from_file() -> np.ndarray | None:
-        file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
+    def load_from_file(
+            dtype: np.dtype = np.float64, progress: Callable[[float], None] | None = None
+    ) -> np.ndarray | None:
+        file_path = InputVectors.ask_file_path()
         if not file_path:
             return np.array([])
         try:
-            data = np.loadtxt(file_path, delimiter=",", dtype=float)
-            return data
+            return InputVectors.read_file(file_path, dtype=dtype, progress=progress)
         except ValueError:
+            from tkinter import messagebox
+
             messagebox.showerror("Error", "Invalid numbers in file")
+
+    # <summary>
+    # Ітерує файл великими байтовими блоками, кожен з яких закінчується на межі рядка.
+    # </summary>
+    # <param name="f" type="BinaryIO">Файл, відкритий у двійковому режимі</param>
+    # <param name="chunk_bytes" type="int">Приблизний розмір блоку в байтах</param>
+    # <returns type="Iterator[bytes]">Ітератор блоків із цілих рядків</returns>
+    @staticmethod
+    def _iter_line_blocks(f, chunk_bytes: int) -> Iterator[bytes]:
+        tail = b""
+        while chunk := f.read(chunk_bytes):
+            chunk = tail + chunk
+            cut = chunk.rfind(b"\n") + 1
+            tail = chunk[cut:]
+            if cut:
+                yield chunk[:cut]
+        if tail.strip():
+            yield tail
+
+    # <summary>
+    # Швидко читає текстовий файл з роздільниками-комами. Спершу рахує рядки,
+    # щоб виділити пам'ять під результат одним масивом, далі розбирає файл
+    # великими байтовими блоками парсером NumPy і записує їх у виділений масив.
+    # </summary>
+    # <param name="file_path" type="str">Шлях до файлу</param>
+    # <param name="dtype" type="np.dtype">Тип елементів (float32 або float64)</param>
+    # <param name="has_header" type="bool | None">Чи містить перший рядок заголовок; None — визначити автоматично</param>
+    # <param name="target_column" type="int | None">Індекс стовпця відповіді, який повертається окремо</param>
+    # <param name="progress" type="Callable[[float], None] | None">Функція, що отримує частку розібраного файлу</param>
+    # <returns type="np.ndarray | tuple[np.ndarray, np.ndarray]">Матриця X або пара (X, y), якщо задано target_column</returns>
+    @staticmethod
+    def read_matrix_file(
+            file_path: str,
+            dtype: np.dtype = np.float64,
+            has_header: bool | None = None,
+            target_column: int | None = None,
+            progress: Callable[[float], None] | None = None,
+    ) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+        file_size = os.path.getsize(file_path)
+        with open(file_path, "rb") as f:
+            first_line = f.readline()
+            n_lines = 1 + sum(
+                block.count(b"\n") for block in iter(lambda: f.read(InputVectors.CHUNK_BYTES), b"")
+            )
+            f.seek(0)
+
+            if has_header is None:
+                try:
+                    np.loadtxt(io.BytesIO(first_line), delimiter=",", ndmin=2)
+                    has_header = False
+                except ValueError:
+                    has_header = True
+            if has_header:
+                f.readline()
+                n_lines -= 1
+
+            n_cols = first_line.count(b",") + 1
+            if target_column is not None:
+                target_column %= n_cols
+                X = np.empty((n_lines, n_cols - 1), dtype=dtype)
+                y = np.empty(n_lines, dtype=dtype)
+            else:
+                X = np.empty((n_lines, n_cols), dtype=dtype)
+
+            n_rows = 0
+            for block in InputVectors._iter_line_blocks(f, InputVectors.CHUNK_BYTES):
+                values = np.loadtxt(io.BytesIO(block), delimiter=",", dtype=dtype, ndmin=2)
+                if values.size == 0:
+                    continue
+                if values.shape[1] != n_cols:
+                    raise ValueError(f"Expected {n_cols} columns, got {values.shape[1]}")
+                rows = slice(n_rows, n_rows + values.shape[0])
+                if target_column is not None:
+                    y[rows] = values[:, target_column]
+                    X[rows] = np.delete(values, target_column, axis=1)
+                else:
+                    X[rows] = values
+                n_rows += values.shape[0]
+                if progress is not None:
+                    progress(f.tell() / file_size)
+
+        if target_column is not None:
+            return X[:n_rows], y[:n_rows]
+        return X[:n_rows]
+
+    # <summary>
+    # Читає текстовий файл з роздільниками-комами блоками по chunk_rows рядків,
+    # не завантажуючи весь файл у пам'ять.
+    # </summary>
+    # <param name="file_path" type="str">Шлях до файлу</param>
+    # <param name="chunk_rows" type="int">Кількість рядків у блоці</param>
+    # <returns type="Iterator[np.ndarray]">Ітератор двовимірних блоків</returns>
+    @staticmethod
+    def iter_file_chunks(file_path: str, chunk_rows: int = 100_000) -> Iterator[np.ndarray]:
+        with open(file_path) as f:
+            while lines := list(itertools.islice(f, chunk_rows)):
+                lines = [line for line in lines if line.strip()]
+                if lines:
+                    yield np.loadtxt(lines, delimiter=",", dtype=float, ndmin=2)
@@ -0,0 +1,184 @@
+import contextlib
+import cProfile
+import dataclasses
+import functools
+import json
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+
+logger = logging.getLogger("linear_regression.instrumentation")
+
+
+@dataclasses.dataclass()
+class StageTiming:
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    allocated_bytes: int | None
+
+
+class Instrumentation:
+
+    # <summary>
+    # Вимірює етапи роботи додатку: час виконання, процесорний час і, за запитом, обсяг
+    # пам'яті, виділеної під час етапу (за tracemalloc). Зберігає останній вимір кожного
+    # етапу, пише структурований журнал (JSON-рядки) і за запитом профілює етапи через cProfile.
+    # Етапи можуть виконуватися в різних потоках, тому процесорний час рахується для всього
+    # процесу і при паралельних етапах є наближеним. Пік пам'яті tracemalloc один на процес,
+    # тому пам'ять вимірюється лише для етапів, що не перетиналися з іншими; для решти — None.
+    # tracemalloc сповільнює кожне виділення пам'яті, тому за замовчуванням вимкнений.
+    # </summary>
+    # <param name="track_memory">Чи вмикати tracemalloc для обліку виділеної пам'яті</param>
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = False
+        self.profiling = False
+        self.version = 0
+        self._timings: OrderedDict[str, StageTiming] = OrderedDict()
+        self._stats: pstats.Stats | None = None
+        self._lock = threading.Lock()
+        self._log_handler: logging.Handler | None = None
+        # Активні етапи: ідентифікатор виміру -> чи перетинався він з іншим етапом
+        self._active: dict[int, bool] = {}
+        self._started_tracing = False
+        self.set_memory_tracking(track_memory)
+
+    # <summary>
+    # Вмикає або вимикає облік пам'яті етапів. tracemalloc зупиняється лише тоді,
+    # коли його запустив цей екземпляр.
+    # </summary>
+    # <param name="enabled">Чи вимірювати пам'ять етапів</param>
+    def set_memory_tracking(self, enabled: bool):
+        with self._lock:
+            if enabled and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            elif not enabled and self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+            self.track_memory = enabled
+
+    # <summary>
+    # Вимірює блок коду як етап stage. Використовується як контекстний менеджер:
+    # with instrumentation.measure("calculate: compute"): ...
+    # </summary>
+    # <param name="stage">Назва етапу</param>
+    @contextlib.contextmanager
+    def measure(self, stage: str):
+        profiler = None
+        if self.profiling:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:  # інший профайлер уже активний
+                profiler = None
+        token = object()
+        with self._lock:
+            # Скидання піку пам'яті зіпсувало б вимір уже активних етапів
+            overlapped = bool(self._active)
+            for active in self._active:
+                self._active[active] = True
+            self._active[id(token)] = overlapped
+            tracing = self.track_memory and tracemalloc.is_tracing() and not overlapped
+            if tracing:
+                start_bytes, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            with self._lock:
+                overlapped = self._active.pop(id(token))
+                allocated = None
+                if tracing and not overlapped and tracemalloc.is_tracing():
+                    allocated = max(tracemalloc.get_traced_memory()[1] - start_bytes, 0)
+            timing = StageTiming(
+                stage,
+                time.perf_counter() - start_wall,
+                time.process_time() - start_cpu,
+                allocated,
+            )
+            if profiler is not None:
+                profiler.disable()
+            self._record(timing, profiler)
+
+    # <summary>
+    # Зберігає вимір етапу, додає профіль до накопиченої статистики і пише запис журналу.
+    # </summary>
+    # <param name="timing">Вимір етапу</param>
+    # <param name="profiler">Профайлер етапу або None</param>
+    def _record(self, timing: StageTiming, profiler: cProfile.Profile | None):
+        with self._lock:
+            self._timings.pop(timing.stage, None)
+            self._timings[timing.stage] = timing
+            if profiler is not None:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profiler)
+                else:
+                    self._stats.add(profiler)
+            self.version += 1
+        logger.info(json.dumps(dataclasses.asdict(timing)))
+
+    # <summary>
+    # Повертає останні виміри етапів у порядку їх завершення.
+    # </summary>
+    # <returns>Список вимірів</returns>
+    def last_run(self) -> list[StageTiming]:
+        with self._lock:
+            return list(self._timings.values())
+
+    # <summary>
+    # Вмикає або вимикає профілювання наступних етапів. Під час вмикання
+    # попередня статистика профілю скидається.
+    # </summary>
+    # <param name="enabled">Чи профілювати етапи</param>
+    def set_profiling(self, enabled: bool):
+        with self._lock:
+            if enabled and not self.profiling:
+                self._stats = None
+            self.profiling = enabled
+
+    # <summary>
+    # Записує накопичену статистику профілю у файл формату pstats.
+    # </summary>
+    # <param name="path">Шлях до файлу</param>
+    # <returns>False, якщо жоден етап ще не профілювався</returns>
+    def dump_profile(self, path: str) -> bool:
+        with self._lock:
+            if self._stats is None:
+                return False
+            self._stats.dump_stats(path)
+            return True
+
+    # <summary>
+    # Починає дописувати записи журналу етапів у файл, по одному JSON-об'єкту в рядку.
+    # </summary>
+    # <param name="path">Шлях до файлу журналу</param>
+    def log_to_file(self, path: str):
+        if self._log_handler is not None:
+            logger.removeHandler(self._log_handler)
+            self._log_handler.close()
+        self._log_handler = logging.FileHandler(path, encoding="utf-8")
+        self._log_handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(self._log_handler)
+        logger.setLevel(logging.INFO)
+
+
+# <summary>
+# Декоратор методу об'єкта з атрибутом instrumentation: вимірює виклик методу як етап stage.
+# </summary>
+# <param name="stage">Назва етапу</param>
+def instrumented(stage: str):
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.instrumentation.measure(stage):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,193 @@
+import dataclasses
+from collections.abc import Callable
+
+import numpy as np
+
+from least_squares_solver import block_rows
+from sparse_matrix import column_means, is_sparse
+
+
+@dataclasses.dataclass()
+class IterativeSolution:
+    B_hat: np.ndarray
+    iterations: int
+    residual_norm: float
+    converged: bool
+
+
+class CenteredOperator:
+
+    # <summary>
+    # Лінійний оператор центрованої матриці Xc = X - 1·x̄ᵀ без її формування:
+    # потрібні лише добутки з X та Xᵀ, які рахуються поблоково, тож float32 X
+    # не перетворюється у float64 цілком. Розріджена X множиться цілком за O(nnz).
+    # Додаткова пам'ять — O(n + p).
+    # </summary>
+    # <param name="X">Матриця спостережень, щільна або розріджена</param>
+    def __init__(self, X: np.ndarray):
+        self.X = X
+        self.x_mean = column_means(X)
+        self.sparse = is_sparse(X)
+        self.step = block_rows(X)
+
+    # <summary>
+    # Обчислює Xc·v = X·v - (x̄·v)·1.
+    # </summary>
+    # <param name="v">Вектор довжини n_feats</param>
+    # <returns>Вектор довжини n_obs</returns>
+    def matvec(self, v: np.ndarray) -> np.ndarray:
+        if self.sparse:
+            result = np.asarray(self.X @ v, dtype=np.float64)
+        else:
+            result = np.empty(self.X.shape[0])
+            for start in range(0, self.X.shape[0], self.step):
+                np.dot(self.X[start:start + self.step], v, out=result[start:start + self.step])
+        result -= self.x_mean @ v
+        return result
+
+    # <summary>
+    # Обчислює Xcᵀ·u = Xᵀ·u - x̄·Σu.
+    # </summary>
+    # <param name="u">Вектор довжини n_obs</param>
+    # <returns>Вектор довжини n_feats</returns>
+    def rmatvec(self, u: np.ndarray) -> np.ndarray:
+        if self.sparse:
+            result = np.asarray(self.X.T @ u, dtype=np.float64)
+        else:
+            result = np.zeros(self.X.shape[1])
+            for start in range(0, self.X.shape[0], self.step):
+                result += self.X[start:start + self.step].T @ u[start:start + self.step]
+        result -= self.x_mean * u.sum()
+        return result
+
+
+class LSQRSolver:
+
+    # <summary>
+    # Ітераційний МНК за алгоритмом LSQR (Paige, Saunders) на основі бідіагоналізації
+    # Голуба—Кахана. Використовує лише добутки з X та Xᵀ, тому не формує ні XᵀX, ні
+    # розклад X: пам'ять — сама X плюс кілька векторів довжини n та p. Порівняно з
+    # методом спряжених градієнтів для нормальних рівнянь LSQR математично еквівалентний,
+    # але стійкіший для погано обумовленої X. Центрування X виконується неявно.
+    # </summary>
+    # <param name="tolerance">Відносна точність: зупинка, коли ‖Xcᵀr‖ ≤ tolerance·‖Xc‖·‖r‖ або ‖r‖ ≤ tolerance·‖y‖</param>
+    # <param name="max_iterations">Максимальна кількість ітерацій; None — 2·min(n_obs, n_feats)</param>
+    def __init__(self, tolerance: float = 1e-10, max_iterations: int | None = None):
+        if not 0 < tolerance < 1:
+            raise ValueError("tolerance must be in (0, 1)")
+        if max_iterations is not None and max_iterations < 1:
+            raise ValueError("max_iterations must be positive")
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+
+    # <summary>
+    # Оцінює коефіцієнти разом із вільним членом. З початковим наближенням B_init
+    # розв'язується задача для поправки до нього, тож близьке наближення (наприклад,
+    # попередня B̂ після зміни шуму чи кількох нових рядків) скорочує кількість ітерацій.
+    # </summary>
+    # <param name="X">Матриця спостережень</param>
+    # <param name="Y">Вектор або матриця відповідей; стовпці розв'язуються по черзі</param>
+    # <param name="B_init">Початкове наближення [b₀, b₁, ..., bₚ] або None</param>
+    # <param name="progress">Функція, що отримує частку виконаних ітерацій від max_iterations</param>
+    # <returns>Розв'язок: B̂ тієї ж вимірності, що й Y, найбільша кількість ітерацій і норма залишку</returns>
+    def solve(
+        self,
+        X: np.ndarray,
+        Y: np.ndarray,
+        B_init: np.ndarray | None = None,
+        progress: Callable[[float], None] | None = None,
+    ) -> IterativeSolution:
+        operator = CenteredOperator(X)
+        n_obs, n_feats = X.shape
+        Y_2d = Y.reshape(n_obs, -1)
+        B_hat = np.empty((n_feats + 1, Y_2d.shape[1]))
+        init = None if B_init is None else np.reshape(B_init, (n_feats + 1, -1))
+        iterations, residual_norms, converged = 0, [], True
+        for column in range(Y_2d.shape[1]):
+            y = Y_2d[:, column]
+            if init is None:
+                coefs = np.zeros(n_feats)
+            else:
+                coefs = init[1:, min(column, init.shape[1] - 1)].astype(np.float64)
+            column_progress = None if progress is None else (
+                lambda fraction, column=column: progress((column + fraction) / Y_2d.shape[1])
+            )
+            coefs, column_iterations, residual_norm, column_converged = self._solve_column(
+                operator, y - y.mean(), coefs, column_progress
+            )
+            B_hat[0, column] = y.mean() - operator.x_mean @ coefs
+            B_hat[1:, column] = coefs
+            iterations = max(iterations, column_iterations)
+            residual_norms.append(residual_norm)
+            converged &= column_converged
+        return IterativeSolution(
+            B_hat if Y.ndim == 2 else B_hat[:, 0],
+            iterations,
+            float(np.linalg.norm(residual_norms)),
+            converged,
+        )
+
+    # <summary>
+    # Розв'язує min ‖Xc·b - y‖ для одного центрованого стовпця y, починаючи з b = coefs.
+    # </summary>
+    # <param name="operator">Оператор центрованої X</param>
+    # <param name="y">Центрований вектор відповідей</param>
+    # <param name="coefs">Початкове наближення коефіцієнтів</param>
+    # <param name="progress">Функція, що отримує частку виконаних ітерацій</param>
+    # <returns>Коефіцієнти, кількість ітерацій, норма залишку та ознака збіжності</returns>
+    def _solve_column(
+        self,
+        operator: CenteredOperator,
+        y: np.ndarray,
+        coefs: np.ndarray,
+        progress: Callable[[float], None] | None = None,
+    ) -> tuple[np.ndarray, int, float, bool]:
+        n_obs, n_feats = operator.X.shape
+        max_iterations = self.max_iterations or 2 * min(n_obs, n_feats)
+        y_norm = np.linalg.norm(y)
+
+        u = y - operator.matvec(coefs) if coefs.any() else y.copy()
+        beta = np.linalg.norm(u)
+        if beta == 0:
+            return coefs, 0, 0.0, True
+        u /= beta
+        v = operator.rmatvec(u)
+        alpha = np.linalg.norm(v)
+        if alpha == 0:
+            return coefs, 0, float(beta), True
+        v /= alpha
+
+        w = v.copy()
+        phi_bar, rho_bar = beta, alpha
+        operator_norm_squared = 0.0
+        for iteration in range(1, max_iterations + 1):
+            if progress is not None:
+                progress((iteration - 1) / max_iterations)
+            u = operator.matvec(v) - alpha * u
+            beta = np.linalg.norm(u)
+            if beta > 0:
+                u /= beta
+            operator_norm_squared += alpha ** 2 + beta ** 2
+            v = operator.rmatvec(u) - beta * v
+            alpha = np.linalg.norm(v)
+            if alpha > 0:
+                v /= alpha
+
+            rho = np.hypot(rho_bar, beta)
+            c, s = rho_bar / rho, beta / rho
+            theta = s * alpha
+            rho_bar = -c * alpha
+            phi = c * phi_bar
+            phi_bar = s * phi_bar
+            coefs += (phi / rho) * w
+            w = v - (theta / rho) * w
+
+            # phi_bar — норма залишку ‖y - Xc·b‖, phi_bar·α·|c| — норма ‖Xcᵀ(y - Xc·b)‖
+            operator_norm = np.sqrt(operator_norm_squared)
+            if (
+                phi_bar <= self.tolerance * (y_norm + operator_norm * np.linalg.norm(coefs))
+                or phi_bar * alpha * abs(c) <= self.tolerance * operator_norm * phi_bar
+                or alpha == 0
+            ):
+                return coefs, iteration, float(phi_bar), True
+        return coefs, max_iterations, float(phi_bar), False
@@ -0,0 +1,115 @@
+import threading
+import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class JobContext:
+
+    # <summary>
+    # Контекст фонової задачі: зберігає прогрес і прапорець скасування.
+    # </summary>
+    def __init__(self):
+        self.cancel_event = threading.Event()
+        self.fraction = 0.0
+
+    # <summary>
+    # Повідомляє прогрес задачі. Водночас є точкою скасування: якщо задачу
+    # скасовано, кидає JobCancelled, що перериває обчислення.
+    # </summary>
+    # <param name="fraction">Частка виконаної роботи від 0 до 1</param>
+    def progress(self, fraction: float):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+        self.fraction = min(max(fraction, 0.0), 1.0)
+
+
+class JobExecutor:
+    # Інтервал опитування завершених задач головним потоком Tk, мс
+    POLL_MS = 50
+
+    # <summary>
+    # Виконує важкі обчислення у пулі потоків поза головним потоком Tk.
+    # На кожен етап (stage) допускається не більше однієї активної задачі.
+    # Результати передаються назад у GUI через root.after.
+    # </summary>
+    # <param name="root">Кореневе вікно Tkinter</param>
+    # <param name="on_progress">Викликається в головному потоці з назвою етапу та прогресом або None, коли задач немає</param>
+    def __init__(self, root: tk.Tk, on_progress: Callable[[str | None, float], None]):
+        self.root = root
+        self.on_progress = on_progress
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="job")
+        self._jobs: dict[str, tuple[Future, JobContext, Callable, Callable | None]] = {}
+        self._polling = False
+
+    # <summary>
+    # Перевіряє, чи виконується задача етапу.
+    # </summary>
+    # <param name="stage">Назва етапу</param>
+    def is_running(self, stage: str) -> bool:
+        return stage in self._jobs
+
+    # <summary>
+    # Запускає задачу у фоновому потоці.
+    # </summary>
+    # <param name="stage">Назва етапу</param>
+    # <param name="job">Функція, що приймає JobContext і повертає результат</param>
+    # <param name="on_done">Викликається в головному потоці з результатом задачі</param>
+    # <param name="on_error">Викликається в головному потоці з винятком задачі</param>
+    # <returns>False, якщо задача цього етапу вже виконується</returns>
+    def submit(
+        self,
+        stage: str,
+        job: Callable[[JobContext], object],
+        on_done: Callable[[object], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> bool:
+        if self.is_running(stage):
+            return False
+        context = JobContext()
+        self._jobs[stage] = (self._executor.submit(job, context), context, on_done, on_error)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+        return True
+
+    # <summary>
+    # Скасовує задачу етапу або всі задачі, якщо етап не вказано.
+    # </summary>
+    # <param name="stage">Назва етапу або None</param>
+    def cancel(self, stage: str | None = None):
+        for name, (_, context, _, _) in self._jobs.items():
+            if stage is None or name == stage:
+                context.cancel_event.set()
+
+    # <summary>
+    # Опитує задачі в головному потоці Tk: оновлює прогрес і викликає обробники завершених задач.
+    # </summary>
+    def _poll(self):
+        try:
+            for stage, (future, context, on_done, on_error) in list(self._jobs.items()):
+                if not future.done():
+                    continue
+                del self._jobs[stage]
+                try:
+                    result = future.result()
+                except JobCancelled:
+                    continue
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    on_error(e)
+                    continue
+                on_done(result)
+        finally:
+            if self._jobs:
+                stage, (_, context, _, _) = next(iter(self._jobs.items()))
+                self.on_progress(stage, context.fraction)
+                self.root.after(self.POLL_MS, self._poll)
+            else:
+                self.on_progress(None, 0.0)
+                self._polling = False
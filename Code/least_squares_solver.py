@@ -0,0 +1,607 @@
+import abc
+import functools
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+
+import numpy as np
+
+from sparse_matrix import column_means, is_sparse
+
+# Обсяг рядкового блоку X (у байтах), який центрується за один крок
+BLOCK_BYTES = 64 * 2**20
+
+
+# <summary>
+# Імпортує scipy.linalg.solve_triangular під час першого розв'язку, а не під час
+# імпорту модуля, щоб scipy не сповільнювала запуск додатку.
+# </summary>
+# <returns>Функція solve_triangular або None, якщо scipy не встановлено</returns>
+@functools.cache
+def _scipy_solve_triangular():
+    try:
+        from scipy.linalg import solve_triangular
+    except ImportError:  # scipy є необов'язковою залежністю
+        return None
+    return solve_triangular
+
+
+# <summary>
+# Розв'язує трикутну систему T·x = b. Використовує scipy, якщо вона доступна,
+# інакше — загальний розв'язувач NumPy.
+# </summary>
+# <param name="T">Верхня або нижня трикутна матриця</param>
+# <param name="b">Права частина системи</param>
+# <param name="lower">True, якщо T нижня трикутна</param>
+# <returns>Розв'язок системи</returns>
+def _solve_triangular(T: np.ndarray, b: np.ndarray, lower: bool) -> np.ndarray:
+    if (solve_triangular := _scipy_solve_triangular()) is not None:
+        return solve_triangular(T, b, lower=lower, check_finite=False)
+    return np.linalg.solve(T, b)
+
+
+# <summary>
+# Повертає кількість рядків X, що вміщується в один блок обсягом BLOCK_BYTES.
+# </summary>
+# <param name="X">Матриця спостережень</param>
+# <returns>Кількість рядків у блоці</returns>
+def block_rows(X: np.ndarray) -> int:
+    return max(1, BLOCK_BYTES // max(1, X.shape[1] * 8))
+
+
+# <summary>
+# Обчислює XᵀX розрідженої X у float64. Добуток scipy накопичується в типі X, тому
+# розріджена X іншого типу переводиться у float64 блоками рядків, а не цілком.
+# </summary>
+# <param name="X">Розріджена матриця спостережень</param>
+# <param name="progress">Функція, що отримує частку оброблених рядків</param>
+# <returns>Щільна матриця XᵀX розміру n_feats × n_feats</returns>
+def _sparse_gram(X, progress: Callable[[float], None] | None = None) -> np.ndarray:
+    if X.dtype == np.float64:
+        return (X.T @ X).toarray()
+    X = X.tocsr()
+    gram = np.zeros((X.shape[1], X.shape[1]))
+    step = block_rows(X)
+    for start in range(0, X.shape[0], step):
+        block = X[start:start + step].astype(np.float64)
+        gram += (block.T @ block).toarray()
+        if progress is not None:
+            progress(min(start + step, X.shape[0]) / X.shape[0])
+    return gram
+
+
+# <summary>
+# Обчислює центровану матрицю Грама (X - x̄)ᵀ(X - x̄) поблоково,
+# не створюючи повної центрованої копії X. Для розрідженої X центрування зруйнувало б
+# розрідженість, тому використовується XᵀX - n·x̄x̄ᵀ за O(nnz·p) без ущільнення.
+# </summary>
+# <param name="X">Матриця спостережень</param>
+# <param name="x_mean">Середні значення стовпців X</param>
+# <param name="progress">Функція, що отримує частку оброблених рядків</param>
+# <returns>Матриця Грама розміру n_feats × n_feats</returns>
+def centered_gram(
+    X: np.ndarray, x_mean: np.ndarray, progress: Callable[[float], None] | None = None
+) -> np.ndarray:
+    if is_sparse(X):
+        return _sparse_gram(X, progress) - X.shape[0] * np.outer(x_mean, x_mean)
+    gram = np.zeros((X.shape[1], X.shape[1]))
+    step = block_rows(X)
+    for start in range(0, X.shape[0], step):
+        block = X[start:start + step] - x_mean
+        gram += block.T @ block
+        if progress is not None:
+            progress(min(start + step, X.shape[0]) / X.shape[0])
+    return gram
+
+
+# <summary>
+# Обчислює (X - x̄)ᵀY поблоково. Центрувати Y не потрібно, оскільки
+# стовпці центрованої X мають нульову суму. Для розрідженої X — XᵀY - x̄·ΣY.
+# </summary>
+# <param name="X">Матриця спостережень</param>
+# <param name="x_mean">Середні значення стовпців X</param>
+# <param name="Y">Вектор або матриця відповідей</param>
+# <returns>Вектор або матриця розміру n_feats × k</returns>
+def centered_cross(X: np.ndarray, x_mean: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    if is_sparse(X):
+        return X.T @ Y - np.multiply.outer(x_mean, Y.sum(axis=0))
+    cross = np.zeros((X.shape[1],) + Y.shape[1:])
+    step = block_rows(X)
+    for start in range(0, X.shape[0], step):
+        cross += (X[start:start + step] - x_mean).T @ Y[start:start + step]
+    return cross
+
+
+# <summary>
+# Обчислює Xcᵀ(Yc - Xc·b) поблоково — проєкцію залишків центрованої задачі, не
+# зберігаючи залишків для всієї X. Для розрідженої X залишки Y - X·b формуються
+# за O(nnz), а центрування враховується поправкою x̄·Σr.
+# </summary>
+# <param name="X">Матриця спостережень</param>
+# <param name="x_mean">Середні значення стовпців X</param>
+# <param name="Y">Вектор або матриця відповідей</param>
+# <param name="coefs">Коефіцієнти без вільного члена</param>
+# <returns>Вектор або матриця розміру n_feats × k</returns>
+def centered_residual_cross(X: np.ndarray, x_mean: np.ndarray, Y: np.ndarray, coefs: np.ndarray) -> np.ndarray:
+    offset = Y.mean(axis=0) - x_mean @ coefs
+    if is_sparse(X):
+        return centered_cross(X, x_mean, Y - X @ coefs - offset)
+    cross = np.zeros((X.shape[1],) + Y.shape[1:])
+    step = block_rows(X)
+    for start in range(0, X.shape[0], step):
+        block = X[start:start + step] - x_mean
+        cross += block.T @ (Y[start:start + step] - offset - block @ coefs)
+    return cross
+
+
+class CenteredFactorization(abc.ABC):
+    method = ""
+
+    # <summary>
+    # Базовий клас розкладу центрованої матриці X - x̄. Вільний член не додається
+    # до матриці стовпцем одиниць, а відновлюється як b₀ = ȳ - x̄·b.
+    # </summary>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    def __init__(self, x_mean: np.ndarray):
+        self.x_mean = x_mean
+        self._gram_inverse: np.ndarray | None = None
+
+    # <summary>
+    # Обсяг пам'яті, який займають масиви розкладу.
+    # </summary>
+    @property
+    def nbytes(self) -> int:
+        return sum(value.nbytes for value in vars(self).values() if isinstance(value, np.ndarray))
+
+    # <summary>
+    # Оцінює коефіцієнти при центрованих ознаках.
+    # </summary>
+    # <param name="X">Матриця спостережень, для якої побудовано розклад</param>
+    # <param name="Y">Вектор або матриця відповідей</param>
+    # <returns>Коефіцієнти без вільного члена</returns>
+    @abc.abstractmethod
+    def _solve_centered(self, X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        ...
+
+    # <summary>
+    # Обчислює (XcᵀXc)⁻¹ з уже готового розкладу.
+    # </summary>
+    # <returns>Обернена центрована матриця Грама n_feats × n_feats</returns>
+    @abc.abstractmethod
+    def _compute_gram_inverse(self) -> np.ndarray:
+        ...
+
+    # <summary>
+    # Повертає (XcᵀXc)⁻¹, потрібну для стандартних похибок коефіцієнтів. Обчислюється
+    # з розкладу за O(p³) один раз і зберігається разом із ним у кеші розкладів.
+    # </summary>
+    # <returns>Обернена центрована матриця Грама n_feats × n_feats</returns>
+    def gram_inverse(self) -> np.ndarray:
+        if self._gram_inverse is None:
+            self._gram_inverse = self._compute_gram_inverse()
+        return self._gram_inverse
+
+    # <summary>
+    # Оцінює вектор коефіцієнтів разом із вільним членом.
+    # </summary>
+    # <param name="X">Матриця спостережень, для якої побудовано розклад</param>
+    # <param name="Y">Вектор або матриця відповідей</param>
+    # <returns>Коефіцієнти [b₀, b₁, ..., bₚ] тієї ж вимірності, що й Y</returns>
+    def solve(self, X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        coefs = self._solve_centered(X, Y)
+        intercept = Y.mean(axis=0) - self.x_mean @ coefs
+        return np.concatenate([np.reshape(intercept, (1,) + coefs.shape[1:]), coefs])
+
+
+class CholeskyFactorization(CenteredFactorization):
+    method = "cholesky"
+
+    # <summary>
+    # Зберігає розклад Холецького центрованої матриці Грама XcᵀXc = L·Lᵀ.
+    # </summary>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="L">Нижня трикутна матриця розкладу</param>
+    def __init__(self, x_mean: np.ndarray, L: np.ndarray):
+        super().__init__(x_mean)
+        self.L = L
+
+    # <summary>
+    # Розв'язує нормальні рівняння XcᵀXc·b = XcᵀY двома трикутними розв'язками.
+    # </summary>
+    def _solve_centered(self, X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        z = _solve_triangular(self.L, centered_cross(X, self.x_mean, Y), lower=True)
+        return _solve_triangular(self.L.T, z, lower=False)
+
+    # <summary>
+    # (L·Lᵀ)⁻¹ = L⁻ᵀ·L⁻¹.
+    # </summary>
+    def _compute_gram_inverse(self) -> np.ndarray:
+        L_inv = _solve_triangular(self.L, np.eye(self.L.shape[0]), lower=True)
+        return L_inv.T @ L_inv
+
+
+class QRFactorization(CenteredFactorization):
+    method = "qr"
+
+    # <summary>
+    # Зберігає лише R з QR-розкладу центрованої матриці Xc = Q·R: Q має розмір
+    # n × p, тобто стільки ж, скільки сама X, тому не зберігається ні в розкладі, ні в кеші.
+    # </summary>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="R">Верхня трикутна матриця</param>
+    def __init__(self, x_mean: np.ndarray, R: np.ndarray):
+        super().__init__(x_mean)
+        self.R = R
+
+    # <summary>
+    # Розв'язує RᵀR·b = XcᵀY без Q (напівнормальні рівняння).
+    # </summary>
+    # <param name="cross">Центрований добуток XcᵀY</param>
+    # <returns>Розв'язок розміру n_feats або n_feats × k</returns>
+    def _apply_inverse(self, cross: np.ndarray) -> np.ndarray:
+        z = _solve_triangular(self.R.T, cross, lower=True)
+        return _solve_triangular(self.R, z, lower=False)
+
+    # <summary>
+    # Розв'язує напівнормальні рівняння з одним кроком уточнення за залишками
+    # (виправлені напівнормальні рівняння): похибка першого розв'язку пропорційна κ²(Xc),
+    # а після уточнення — як у розв'язку через Q. Уточнення коштує ще один прохід по X за O(n·p).
+    # </summary>
+    def _solve_centered(self, X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        coefs = self._apply_inverse(centered_cross(X, self.x_mean, Y))
+        return coefs + self._apply_inverse(centered_residual_cross(X, self.x_mean, Y, coefs))
+
+    # <summary>
+    # (RᵀR)⁻¹ = R⁻¹·R⁻ᵀ.
+    # </summary>
+    def _compute_gram_inverse(self) -> np.ndarray:
+        R_inv = _solve_triangular(self.R, np.eye(self.R.shape[0]), lower=False)
+        return R_inv @ R_inv.T
+
+
+class SVDFactorization(CenteredFactorization):
+    method = "svd"
+
+    # <summary>
+    # Зберігає сингулярні значення та праві сингулярні вектори центрованої матриці
+    # Xc = U·diag(s)·Vᵀ та відкидає малі сингулярні значення, що дає розв'язок з мінімальною
+    # нормою для виродженої матриці. U розміру n × p не зберігається: UᵀY = diag(1/s)·Vᵀ·XcᵀY.
+    # </summary>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="s">Сингулярні значення</param>
+    # <param name="Vt">Транспоновані праві сингулярні вектори</param>
+    # <param name="n_obs">Кількість спостережень</param>
+    def __init__(self, x_mean: np.ndarray, s: np.ndarray, Vt: np.ndarray, n_obs: int):
+        super().__init__(x_mean)
+        self.n_obs = n_obs
+        self.s = s
+        self.Vt = Vt
+        cutoff = np.finfo(s.dtype).eps * max(n_obs, Vt.shape[1]) * (s[0] if s.size else 0.0)
+        self.s_inv = np.divide(1.0, s, out=np.zeros_like(s), where=s > cutoff)
+
+    # <summary>
+    # Проєктує відповіді на ліві сингулярні вектори без U: UᵀY = diag(1/s)·Vᵀ·XcᵀY.
+    # </summary>
+    # <param name="X">Матриця спостережень, для якої побудовано розклад</param>
+    # <param name="Y">Вектор або матриця відповідей</param>
+    # <returns>Проєкції розміру len(s) або len(s) × k</returns>
+    def project(self, X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        projected = self.Vt @ centered_cross(X, self.x_mean, Y)
+        projected *= self.s_inv.reshape(-1, *([1] * (projected.ndim - 1)))
+        return projected
+
+    # <summary>
+    # Обчислює V·diag(1/s²)·Vᵀ·c — псевдорозв'язок нормальних рівнянь.
+    # </summary>
+    # <param name="cross">Центрований добуток XcᵀY</param>
+    # <returns>Розв'язок розміру n_feats або n_feats × k</returns>
+    def _apply_inverse(self, cross: np.ndarray) -> np.ndarray:
+        projected = self.Vt @ cross
+        projected *= (self.s_inv ** 2).reshape(-1, *([1] * (projected.ndim - 1)))
+        return self.Vt.T @ projected
+
+    # <summary>
+    # Обчислює псевдорозв'язок b = V·diag(1/s)·UᵀY через XcᵀY з одним кроком уточнення
+    # за залишками, як у QRFactorization.
+    # </summary>
+    def _solve_centered(self, X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        coefs = self._apply_inverse(centered_cross(X, self.x_mean, Y))
+        return coefs + self._apply_inverse(centered_residual_cross(X, self.x_mean, Y, coefs))
+
+    # <summary>
+    # Псевдообернена (V·diag(s²)·Vᵀ)⁺ = V·diag(1/s²)·Vᵀ.
+    # </summary>
+    def _compute_gram_inverse(self) -> np.ndarray:
+        return (self.Vt.T * self.s_inv ** 2) @ self.Vt
+
+
+class GramSVDFactorization(SVDFactorization):
+
+    # <summary>
+    # SVD центрованої X, отриманий зі спектрального розкладу її матриці Грама:
+    # XcᵀXc = V·diag(s²)·Vᵀ. Використовується для розрідженої X, для якої Xc
+    # не формується. Через матрицю
+    # Грама обумовленість підноситься до квадрата, тому малі s відкидаються з
+    # порогом, розрахованим для s².
+    # </summary>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="gram">Центрована матриця Грама</param>
+    # <param name="n_obs">Кількість спостережень</param>
+    def __init__(self, x_mean: np.ndarray, gram: np.ndarray, n_obs: int):
+        eigenvalues, eigenvectors = np.linalg.eigh(gram)
+        order = np.argsort(eigenvalues)[::-1]
+        eigenvalues = np.maximum(eigenvalues[order], 0.0)
+        cutoff = np.finfo(float).eps * gram.shape[0] * (eigenvalues[0] if eigenvalues.size else 0.0)
+        eigenvalues[eigenvalues <= cutoff] = 0.0
+        CenteredFactorization.__init__(self, x_mean)
+        self.n_obs = n_obs
+        self.s = np.sqrt(eigenvalues)
+        self.Vt = eigenvectors[:, order].T
+        self.s_inv = np.divide(1.0, self.s, out=np.zeros_like(self.s), where=self.s > 0)
+
+
+class LeastSquaresSolver:
+    SOLVERS = ("auto", "qr", "cholesky", "svd")
+
+    # Гранична оцінка числа обумовленості XcᵀXc, за якої auto ще довіряє Холецькому
+    CHOLESKY_MAX_CONDITION = 1e8
+
+    # <summary>
+    # Будує розклад Холецького центрованої матриці Грама.
+    # </summary>
+    # <param name="X">Матриця спостережень</param>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="progress">Функція, що отримує частку оброблених рядків</param>
+    # <returns>Розклад та оцінка числа обумовленості; None, якщо матриця не додатно визначена</returns>
+    @staticmethod
+    def _cholesky(
+        X: np.ndarray, x_mean: np.ndarray, progress: Callable[[float], None] | None = None
+    ) -> tuple[CholeskyFactorization | None, float]:
+        try:
+            L = np.linalg.cholesky(centered_gram(X, x_mean, progress))
+        except np.linalg.LinAlgError:
+            return None, np.inf
+        diag = np.abs(np.diag(L))
+        if not np.all(np.isfinite(diag)) or diag.min() == 0:
+            return None, np.inf
+        return CholeskyFactorization(x_mean, L), float((diag.max() / diag.min()) ** 2)
+
+    # <summary>
+    # Обчислює трикутний множник R QR-розкладу центрованої матриці Xc = Q·R. Q розміру
+    # n × p не формується; центрована копія X існує лише під час розкладу.
+    # </summary>
+    # <param name="X">Матриця спостережень</param>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <returns>Верхня трикутна (трапецієподібна при n < p) матриця R</returns>
+    @staticmethod
+    def _triangular_factor(X: np.ndarray, x_mean: np.ndarray) -> np.ndarray:
+        return np.linalg.qr(X - x_mean, mode="r")
+
+    # <summary>
+    # Будує QR-розклад центрованої матриці X за її множником R.
+    # </summary>
+    # <param name="R">Трикутний множник Xc</param>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="n_obs">Кількість спостережень</param>
+    # <returns>Розклад; None, якщо R чисельно вироджена</returns>
+    @staticmethod
+    def _qr(R: np.ndarray, x_mean: np.ndarray, n_obs: int) -> QRFactorization | None:
+        diag = np.abs(np.diag(R))
+        tolerance = np.finfo(R.dtype).eps * max(n_obs, R.shape[1]) * (diag.max() if diag.size else 0.0)
+        if diag.size < R.shape[1] or diag.min() <= tolerance:
+            return None
+        return QRFactorization(x_mean, R)
+
+    # <summary>
+    # Будує SVD-розклад центрованої матриці X через SVD її множника R:
+    # Xc = Q·R і R = U_R·diag(s)·Vᵀ мають спільні s та V, тож U розміру n × p не формується.
+    # </summary>
+    # <param name="R">Трикутний множник Xc</param>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="n_obs">Кількість спостережень</param>
+    # <returns>Розклад</returns>
+    @staticmethod
+    def _svd(R: np.ndarray, x_mean: np.ndarray, n_obs: int) -> SVDFactorization:
+        _, s, Vt = np.linalg.svd(R, full_matrices=False)
+        return SVDFactorization(x_mean, s, Vt, n_obs)
+
+    # <summary>
+    # Розкладає центровану матрицю X обраним методом. Холецький і QR при виродженості
+    # переходять до SVD. Режим auto обирає SVD для недовизначених систем,
+    # Холецького для добре обумовлених і QR для погано обумовлених.
+    # Холецький працює поблоково без копії X; QR та SVD потребують однієї тимчасової
+    # центрованої копії X, а зберігають лише масиви p × p. X може бути float32: центрування відносно x̄ у float64
+    # переводить кожен блок у float64, тож накопичення і розклад виконуються у float64.
+    # Розріджена X розкладається через матрицю Грама (див. _factorize_sparse).
+    # Прогрес повідомляється під час поблокового накопичення матриці Грама та перед
+    # розкладом LAPACK, тож функція прогресу може перервати розклад, кинувши виняток.
+    # </summary>
+    # <param name="X">Матриця спостережень без стовпця одиниць</param>
+    # <param name="solver">Назва методу: auto, qr, cholesky або svd</param>
+    # <param name="progress">Функція, що отримує частку виконаної роботи</param>
+    # <returns>Об'єкт розкладу з методом solve та атрибутом method</returns>
+    @classmethod
+    def factorize(
+        cls, X: np.ndarray, solver: str = "auto", progress: Callable[[float], None] | None = None
+    ) -> CenteredFactorization:
+        if solver not in cls.SOLVERS:
+            raise ValueError(f"Unknown solver '{solver}', expected one of {cls.SOLVERS}")
+
+        n_obs, n_feats = X.shape
+        x_mean = column_means(X)
+        progress = progress or (lambda fraction: None)
+        if is_sparse(X):
+            return cls._factorize_sparse(X, x_mean, solver, progress)
+        if solver == "svd" or (solver == "auto" and n_obs <= n_feats):
+            progress(0.0)
+            return cls._svd(cls._triangular_factor(X, x_mean), x_mean, n_obs)
+
+        if solver in ("auto", "cholesky"):
+            factorization, condition = cls._cholesky(X, x_mean, progress)
+            if factorization is not None and (
+                solver == "cholesky" or condition <= cls.CHOLESKY_MAX_CONDITION
+            ):
+                return factorization
+            if solver == "cholesky":
+                return cls._svd(cls._triangular_factor(X, x_mean), x_mean, n_obs)
+
+        progress(0.0)
+        R = cls._triangular_factor(X, x_mean)
+        return cls._qr(R, x_mean, n_obs) or cls._svd(R, x_mean, n_obs)
+
+    # <summary>
+    # Розкладає розріджену X через центровану матрицю Грама XᵀX - n·x̄x̄ᵀ, яка
+    # обчислюється за O(nnz·p) без ущільнення X. auto і cholesky використовують
+    # Холецького, а для виродженої або (для auto) погано обумовленої матриці — SVD
+    # через спектральний розклад Грама; qr для розрідженої X недоступний і також
+    # переходить до SVD. Вироджена X типова для індикаторних ознак (повний набір
+    # one-hot стовпців разом із вільним членом), для неї повертається розв'язок з мінімальною нормою.
+    # </summary>
+    # <param name="X">Розріджена матриця спостережень</param>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="solver">Назва методу: auto, qr, cholesky або svd</param>
+    # <param name="progress">Функція, що отримує частку оброблених рядків</param>
+    # <returns>Об'єкт розкладу</returns>
+    @classmethod
+    def _factorize_sparse(
+        cls, X, x_mean: np.ndarray, solver: str, progress: Callable[[float], None] | None = None
+    ) -> CenteredFactorization:
+        gram = centered_gram(X, x_mean, progress)
+        if solver in ("auto", "cholesky"):
+            try:
+                L = np.linalg.cholesky(gram)
+                diag = np.abs(np.diag(L))
+                if diag.min() > 0 and (
+                    solver == "cholesky" or (diag.max() / diag.min()) ** 2 <= cls.CHOLESKY_MAX_CONDITION
+                ):
+                    return CholeskyFactorization(x_mean, L)
+            except np.linalg.LinAlgError:
+                pass
+        return GramSVDFactorization(x_mean, gram, X.shape[0])
+
+    # <summary>
+    # Розв'язує нормальні рівняння G·b = c за вже накопиченою матрицею Грама.
+    # Використовує Холецького, а для виродженої G — псевдообернення через
+    # спектральний розклад.
+    # </summary>
+    # <param name="gram">Центрована матриця Грама n_feats × n_feats</param>
+    # <param name="cross">Центрований добуток XᵀY розміру n_feats або n_feats × k</param>
+    # <returns>Коефіцієнти без вільного члена</returns>
+    @staticmethod
+    def solve_normal_equations(gram: np.ndarray, cross: np.ndarray) -> np.ndarray:
+        try:
+            L = np.linalg.cholesky(gram)
+            diag = np.abs(np.diag(L))
+            if diag.size and diag.min() > 0 and (diag.max() / diag.min()) ** 2 <= 1 / np.finfo(float).eps:
+                z = _solve_triangular(L, cross, lower=True)
+                return _solve_triangular(L.T, z, lower=False)
+        except np.linalg.LinAlgError:
+            pass
+        eigenvalues, eigenvectors = np.linalg.eigh(gram)
+        cutoff = np.finfo(float).eps * gram.shape[0] * max(eigenvalues.max(initial=0.0), 0.0)
+        inverse = np.divide(1.0, eigenvalues, out=np.zeros_like(eigenvalues), where=eigenvalues > cutoff)
+        projected = eigenvectors.T @ cross
+        projected *= inverse.reshape(-1, *([1] * (projected.ndim - 1)))
+        return eigenvectors @ projected
+
+
+class FactorizationCache:
+
+    # <summary>
+    # LRU-кеш розкладів матриці X, обмежений сумарним обсягом у байтах.
+    # Кешуються лише розклади, усі масиви яких мають розмір O(p²) (див. _is_compact),
+    # тож кеш ніколи не тримає копію X розміру n × p. Запис прив'язаний до конкретного об'єкта X (через слабке посилання) та до
+    # відбитка всього його вмісту, тож повторна оцінка з новим Y коштує O(n·p)
+    # замість O(n·p²) на новий розклад.
+    # </summary>
+    # <param name="max_bytes">Максимальний сумарний обсяг кешованих розкладів</param>
+    def __init__(self, max_bytes: int = 2 * 2**30):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    # <summary>
+    # Обчислює відбиток усього вмісту X (для розрідженої X — ненульових значень та індексів),
+    # тож зміна будь-якого елемента на місці робить кешований розклад недійсним.
+    # Хешування O(n·p) дешевше за розклад O(n·p²); суцільна X хешується без копіювання,
+    # несуцільна — блоками рядків.
+    # </summary>
+    # <param name="X">Матриця спостережень</param>
+    # <returns>Шістнадцятковий рядок хешу</returns>
+    @staticmethod
+    def fingerprint(X: np.ndarray) -> str:
+        # Хеш лише виявляє зміни, тож обирається найшвидший (апаратно прискорений) SHA-1
+        digest = hashlib.sha1(usedforsecurity=False)
+        if is_sparse(X):
+            X = X.tocsr()
+            for part in (X.data, X.indices, X.indptr):
+                digest.update(np.ascontiguousarray(part))
+        elif X.flags.c_contiguous:
+            digest.update(X)
+        else:
+            step = block_rows(X)
+            for start in range(0, X.shape[0], step):
+                digest.update(np.ascontiguousarray(X[start:start + step]))
+        return digest.hexdigest()
+
+    # <summary>
+    # Перевіряє, що розклад зберігає лише стан O(p²): жоден його масив не має
+    # виміру, більшого за кількість ознак, тобто не залежить від кількості рядків X.
+    # </summary>
+    # <param name="factorization">Розклад</param>
+    # <param name="n_feats">Кількість ознак X</param>
+    # <returns>True, якщо розклад можна кешувати</returns>
+    @staticmethod
+    def _is_compact(factorization: CenteredFactorization, n_feats: int) -> bool:
+        return all(
+            max(value.shape, default=0) <= n_feats
+            for value in vars(factorization).values()
+            if isinstance(value, np.ndarray)
+        )
+
+    # <summary>
+    # Повертає кешований розклад X або будує новий і додає його до кешу.
+    # </summary>
+    # <param name="X">Матриця спостережень</param>
+    # <param name="solver">Назва методу розкладу</param>
+    # <param name="progress">Функція, що отримує частку виконаної роботи розкладу</param>
+    # <returns>Об'єкт розкладу</returns>
+    def get_or_factorize(
+        self, X: np.ndarray, solver: str = "auto", progress: Callable[[float], None] | None = None
+    ) -> CenteredFactorization:
+        key = (id(X), X.shape, X.dtype.str, solver)
+        fingerprint = self.fingerprint(X)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                x_ref, entry_fingerprint, factorization = entry
+                if x_ref() is X and entry_fingerprint == fingerprint:
+                    self._entries.move_to_end(key)
+                    return factorization
+                del self._entries[key]
+
+        factorization = LeastSquaresSolver.factorize(X, solver, progress)
+        if self._is_compact(factorization, X.shape[1]) and factorization.nbytes <= self.max_bytes:
+            with self._lock:
+                self._entries[key] = (weakref.ref(X), fingerprint, factorization)
+                self._evict()
+        return factorization
+
+    # <summary>
+    # Видаляє записи для вже звільнених матриць та найдавніше використані записи,
+    # доки сумарний обсяг не стане меншим за max_bytes.
+    # </summary>
+    def _evict(self):
+        for key in [key for key, (x_ref, _, _) in self._entries.items() if x_ref() is None]:
+            del self._entries[key]
+        while sum(entry[2].nbytes for entry in self._entries.values()) > self.max_bytes:
+            self._entries.popitem(last=False)
+
+    # <summary>
+    # Очищає кеш.
+    # </summary>
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,21 @@
+class Limits:
+    # Допустимі межі параметрів датасету. Винесені з GUI, щоб командний рядок і процеси
+    # пулу перевіряли ті самі межі без імпорту tkinter
+
+    MIN_DIMENSION_DATASET = 1
+    MAX_DIMENSION_DATASET = 100_000
+
+    MIN_VAL = 0
+    MAX_VAL = 100_000_000
+
+    LOWER_LIMIT_E = -100
+    UPPER_LIMIT_E = 100
+
+    LOWER_LIMIT_SIGMA = 0
+    UPPER_LIMIT_SIGMA = 100
+
+    MIN_PRECISION = 0
+    MAX_PRECISION = 9
+
+    MIN_REPLICATES = 1
+    MAX_REPLICATES = 100_000
@@ -0,0 +1,562 @@
+import argparse
+import dataclasses
+import json
+import os
+import sys
+
+import numpy as np
+
+from app_state import AppState
+from dataset_store import DatasetStore
+from input_vectors import InputVectors
+from least_squares_solver import LeastSquaresSolver
+from limits import Limits
+from linear_regression_model import LinearRegressionModel
+from random_streams import RandomStreams
+from recursive_least_squares import RecursiveLeastSquares
+from sparse_matrix import density, is_sparse, scipy_sparse
+
+
+@dataclasses.dataclass()
+class RunConfig:
+    n_obs: int = 100
+    n_feats: int = 5
+    x_min: float = 0.0
+    x_max: float = 100.0
+    x_precision: int = 9
+    dtype: str = "float64"
+    x_density: float = 1.0
+    b_min: float = 0.0
+    b_max: float = 10.0
+    b_precision: int = 9
+    b_0: float = 1.0
+    noise_e: float = 0.0
+    noise_sigma: float = 1.0
+    seed: int | None = None
+    solver: str = "auto"
+    tolerance: float = 1e-10
+    max_iterations: int | None = None
+    x_file: str | None = None
+    b_file: str | None = None
+
+
+# <summary>
+# Перевіряє параметри запуску в тих самих межах, що й GUI.
+# </summary>
+# <param name="config">Параметри запуску</param>
+# <returns>Список повідомлень про помилки (порожній, якщо параметри коректні)</returns>
+def validate(config: RunConfig) -> list[str]:
+    errors = []
+
+    def check(name, value, lower, upper):
+        if not lower <= value <= upper:
+            errors.append(f"{name} must be in the range [{lower}, {upper}]")
+
+    if config.x_file is None:
+        check("n_obs", config.n_obs, Limits.MIN_DIMENSION_DATASET, Limits.MAX_DIMENSION_DATASET)
+        check("n_feats", config.n_feats, Limits.MIN_DIMENSION_DATASET, Limits.MAX_DIMENSION_DATASET)
+        check("x_min", config.x_min, Limits.MIN_VAL, Limits.MAX_VAL)
+        check("x_max", config.x_max, Limits.MIN_VAL, Limits.MAX_VAL)
+        check("x_precision", config.x_precision, Limits.MIN_PRECISION, Limits.MAX_PRECISION)
+        if config.x_min >= config.x_max:
+            errors.append("x_min must be less than x_max")
+        if not 0 < config.x_density <= 1:
+            errors.append("x_density must be in the range (0, 1]")
+    if config.b_file is None:
+        check("b_min", config.b_min, Limits.MIN_VAL, Limits.MAX_VAL)
+        check("b_max", config.b_max, Limits.MIN_VAL, Limits.MAX_VAL)
+        if config.b_min >= config.b_max:
+            errors.append("b_min must be less than b_max")
+    check("b_precision", config.b_precision, Limits.MIN_PRECISION, Limits.MAX_PRECISION)
+    check("b_0", config.b_0, Limits.MIN_VAL, Limits.MAX_VAL)
+    check("noise_e", config.noise_e, Limits.LOWER_LIMIT_E, Limits.UPPER_LIMIT_E)
+    check("noise_sigma", config.noise_sigma, Limits.LOWER_LIMIT_SIGMA, Limits.UPPER_LIMIT_SIGMA)
+    if config.dtype not in InputVectors.DTYPES:
+        errors.append(f"dtype must be one of {InputVectors.DTYPES}")
+    if config.seed is not None and config.seed < 0:
+        errors.append("seed must be non-negative")
+    if config.solver not in LinearRegressionModel.SOLVERS:
+        errors.append(f"solver must be one of {LinearRegressionModel.SOLVERS}")
+    if not 0 < config.tolerance < 1:
+        errors.append("tolerance must be in the range (0, 1)")
+    if config.max_iterations is not None and config.max_iterations < 1:
+        errors.append("max_iterations must be positive")
+    return errors
+
+
+# <summary>
+# Генерує або завантажує матрицю X і вектор коефіцієнтів B. X, B та шум беруться
+# з окремих потоків RandomStreams, тому однаковий seed відтворює прогін повністю.
+# За x_density < 1 або файлу .npz/.mtx X розріджена.
+# </summary>
+# <param name="config">Параметри запуску</param>
+# <returns>Стан із заповненими X та B і seed, з якого їх згенеровано</returns>
+def prepare_inputs(config: RunConfig) -> AppState:
+    streams = RandomStreams(config.seed)
+    state = AppState(
+        x_precision=config.x_precision,
+        dtype=config.dtype,
+        b_precision=config.b_precision,
+        b_0=config.b_0,
+        seed=streams.seed,
+        solver=config.solver,
+    )
+    if config.x_file is not None:
+        state.data_X = InputVectors.read_file(config.x_file, dtype=config.dtype)
+    elif config.x_density < 1:
+        state.data_X = InputVectors.generate_random_sparse_matrix(
+            config.x_min,
+            config.x_max,
+            config.n_obs,
+            config.n_feats,
+            config.x_density,
+            config.x_precision,
+            streams=streams,
+            dtype=config.dtype,
+        )
+    else:
+        state.data_X = InputVectors.generate_random_matrix(
+            config.x_min,
+            config.x_max,
+            config.n_obs,
+            config.n_feats,
+            config.x_precision,
+            streams=streams,
+            dtype=config.dtype,
+        )
+    state.n_obs, state.n_feats = state.data_X.shape
+    state.x_density = density(state.data_X) if is_sparse(state.data_X) else 1.0
+
+    if config.b_file is not None:
+        state.data_B = InputVectors.read_file(config.b_file).reshape(-1, 1)
+        if state.data_B.shape[0] != state.n_feats:
+            raise ValueError(f"B must have {state.n_feats} coefficients, got {state.data_B.shape[0]}")
+    else:
+        state.data_B = InputVectors.generate_random_matrix(
+            config.b_min,
+            config.b_max,
+            state.n_feats,
+            1,
+            config.b_precision,
+            streams=streams,
+            key=(RandomStreams.B,),
+        )
+    return state
+
+
+# <summary>
+# Готує X і B через prepare_inputs, генерує шум і обчислює y.
+# </summary>
+# <param name="config">Параметри запуску</param>
+# <returns>Стан з X, B, шумом і y</returns>
+def prepare_response(config: RunConfig) -> AppState:
+    state = prepare_inputs(config)
+    state.noise = LinearRegressionModel.generate_noise(
+        config.noise_e, config.noise_sigma, state.n_obs, Limits.MAX_PRECISION, RandomStreams(state.seed)
+    )
+    state.data_Y = LinearRegressionModel.calculate_y(
+        state.data_X, state.data_B, state.b_0, state.noise
+    )
+    return state
+
+
+# <summary>
+# Виконує один прогін без GUI: генерує або завантажує X і B, генерує шум,
+# обчислює y, B̂, метрики коефіцієнтів та R², скоригований R² і дисперсію залишків;
+# для методу ridge — також обране за GCV λ і df(λ), для lsqr — кількість ітерацій і норму залишку.
+# </summary>
+# <param name="config">Параметри запуску</param>
+# <returns>Стан з усіма масивами та словник метрик</returns>
+def run_regression(config: RunConfig) -> tuple[AppState, dict]:
+    state = prepare_response(config)
+    ridge = moments = None
+    if config.solver == "lsqr":
+        solution = LinearRegressionModel.calculate_B_hat_iterative(
+            state.data_X, state.data_Y, config.tolerance, config.max_iterations
+        )
+        state.B_hat, state.solver_used = solution.B_hat, "lsqr"
+    elif config.solver == "ridge":
+        solution = None
+        ridge = LinearRegressionModel.calculate_ridge(state.data_X, state.data_Y)
+        state.B_hat, state.solver_used = ridge["B_hat"], "ridge"
+    elif config.solver == "parallel":
+        solution = None
+        moments = LinearRegressionModel.calculate_moments_parallel(state.data_X, state.data_Y)
+        state.B_hat, state.solver_used = moments.solve(), "parallel"
+    else:
+        solution = None
+        state.B_hat, state.solver_used = LinearRegressionModel.calculate_B_hat(
+            state.data_X, state.data_Y, config.solver
+        )
+    metrics = LinearRegressionModel.calculate_metrics(state.data_B, state.B_hat[1:])
+    diagnostics = LinearRegressionModel.calculate_diagnostics(
+        state.data_X, state.data_Y, state.B_hat, config.solver, ridge, moments
+    )
+    for name in ("r2", "adj_r2", "residual_variance", "lambda", "df"):
+        if name in diagnostics:
+            metrics[name] = diagnostics[name]
+    if solution is not None:
+        metrics.update(iterations=solution.iterations, residual_norm=solution.residual_norm)
+    return state, metrics
+
+
+# <summary>
+# Записує результати прогону у директорію: B_hat.csv, y.csv, metrics.json
+# та, за потреби, повний стан у форматі DatasetStore.
+# </summary>
+# <param name="output_dir">Директорія результатів</param>
+# <param name="state">Стан прогону</param>
+# <param name="metrics">Метрики прогону</param>
+# <param name="save_state">Чи зберігати повний стан</param>
+def write_results(output_dir: str, state: AppState, metrics: dict, save_state: bool = False):
+    os.makedirs(output_dir, exist_ok=True)
+    np.savetxt(os.path.join(output_dir, "B_hat.csv"), state.B_hat, delimiter=",", fmt=f"%.{Limits.MAX_PRECISION}f")
+    np.savetxt(os.path.join(output_dir, "y.csv"), state.data_Y, delimiter=",", fmt=f"%.{Limits.MAX_PRECISION}f")
+    with open(os.path.join(output_dir, "metrics.json"), "w") as f:
+        json.dump(
+            {**{k: float(v) for k, v in metrics.items()}, "solver": state.solver_used, "seed": state.seed},
+            f,
+            indent=4,
+        )
+    if save_state:
+        DatasetStore.save_state(os.path.join(output_dir, "state"), state)
+
+
+# <summary>
+# Записує результати моделювання Монте-Карло: оцінки B̂ усіх реплік,
+# середнє і стандартне відхилення B̂ та середні метрики.
+# </summary>
+# <param name="output_dir">Директорія результатів</param>
+# <param name="result">Результат LinearRegressionModel.simulate</param>
+def write_simulation_results(output_dir: str, result: dict):
+    os.makedirs(output_dir, exist_ok=True)
+    fmt = f"%.{Limits.MAX_PRECISION}f"
+    np.savetxt(os.path.join(output_dir, "B_hat_replicates.csv"), result["B_hat"], delimiter=",", fmt=fmt)
+    np.savetxt(
+        os.path.join(output_dir, "B_hat_summary.csv"),
+        np.hstack([result["B_hat_mean"], result["B_hat_std"]]),
+        delimiter=",",
+        fmt=fmt,
+        header="mean,std",
+    )
+    with open(os.path.join(output_dir, "metrics.json"), "w") as f:
+        json.dump({**result["metrics_mean"], "solver": result["solver"]}, f, indent=4)
+
+
+# <summary>
+# Виконує перехресну перевірку без GUI: k-кратну з перемішуванням рядків потоком seed
+# або з виключенням по одному ("loo"), і записує cv.json.
+# </summary>
+# <param name="config">Параметри запуску</param>
+# <param name="folds">Кількість частин або "loo"</param>
+# <param name="output_dir">Директорія результатів</param>
+# <returns>Результат перехресної перевірки</returns>
+def run_cross_validation(config: RunConfig, folds: int | str, output_dir: str) -> dict:
+    state = prepare_response(config)
+    if folds != "loo" and not 2 <= folds <= state.n_obs:
+        raise ValueError(f"folds must be between 2 and {state.n_obs} or 'loo'")
+    if folds == "loo":
+        result = LinearRegressionModel.calculate_leave_one_out(state.data_X, state.data_Y, config.solver)
+    else:
+        result = LinearRegressionModel.calculate_cross_validation(
+            state.data_X, state.data_Y, folds, RandomStreams(state.seed)
+        )
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "cv.json"), "w") as f:
+        json.dump({**result, "folds_count": folds, "seed": state.seed}, f, indent=4)
+    return result
+
+
+# <summary>
+# Виконує прогін run і бутстреп-оцінку невизначеності B̂, записує B_hat_intervals.csv
+# (B̂, бутстреп-стандартна похибка, межі перцентильного інтервалу) та bootstrap.json
+# з часткою істинних коефіцієнтів [b₀, B], що потрапили в інтервали.
+# </summary>
+# <param name="config">Параметри запуску</param>
+# <param name="resamples">Кількість бутстреп-вибірок</param>
+# <param name="confidence">Рівень довіри інтервалів</param>
+# <param name="output_dir">Директорія результатів</param>
+# <param name="workers">Кількість процесів (за замовчуванням — кількість ядер)</param>
+# <returns>Словник зведених результатів</returns>
+def run_bootstrap(
+    config: RunConfig, resamples: int, confidence: float, output_dir: str, workers: int | None = None
+) -> dict:
+    state, _ = run_regression(config)
+    result = LinearRegressionModel.calculate_bootstrap(
+        state.data_X, state.data_Y, resamples, confidence, RandomStreams(state.seed), workers
+    )
+    B_true = np.vstack([[[state.b_0]], state.data_B])
+    summary = {
+        "resamples": resamples,
+        "confidence": confidence,
+        "coverage": float(np.mean((result["lower"] <= B_true) & (B_true <= result["upper"]))),
+        "mean_width": float(np.mean(result["upper"] - result["lower"])),
+        "solver": state.solver_used,
+        "seed": state.seed,
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    np.savetxt(
+        os.path.join(output_dir, "B_hat_intervals.csv"),
+        np.hstack([state.B_hat, result["B_hat_std"], result["lower"], result["upper"]]),
+        delimiter=",",
+        fmt=f"%.{Limits.MAX_PRECISION}f",
+        header="B_hat,std,lower,upper",
+    )
+    with open(os.path.join(output_dir, "bootstrap.json"), "w") as f:
+        json.dump(summary, f, indent=4)
+    return summary
+
+
+# <summary>
+# Виконує прогін run, після чого дописує rows нових рядків пакетами по batch_rows і оновлює B̂
+# рекурсивним МНК (як кнопка Append rows у GUI). Метрики обчислюються для B̂ після дописування.
+# </summary>
+# <param name="config">Параметри запуску</param>
+# <param name="rows">Загальна кількість нових рядків</param>
+# <param name="batch_rows">Кількість рядків в одному оновленні</param>
+# <param name="forgetting">Коефіцієнт забування RLS</param>
+# <param name="refactor_every">Кількість оновлень між повторними розкладами; 0 — не розкладати</param>
+# <returns>Стан з дописаними рядками та словник метрик</returns>
+def run_append(
+    config: RunConfig, rows: int, batch_rows: int, forgetting: float = 1.0, refactor_every: int = 100
+) -> tuple[AppState, dict]:
+    state, _ = run_regression(config)
+    streams = RandomStreams(state.seed)
+    model = RecursiveLeastSquares(forgetting, refactor_every).initialize(state.data_X, state.data_Y)
+    X_parts, noise_parts, Y_parts = [state.data_X], [state.noise], [state.data_Y]
+    offset = state.n_obs
+    for start in range(0, rows, batch_rows):
+        count = min(batch_rows, rows - start)
+        X_new = InputVectors.generate_rows_like(
+            state.data_X, count, config.x_precision, streams, (RandomStreams.APPEND, offset, RandomStreams.X)
+        )
+        noise_new = LinearRegressionModel.generate_noise(
+            config.noise_e, config.noise_sigma, count, Limits.MAX_PRECISION, streams,
+            (RandomStreams.APPEND, offset, RandomStreams.NOISE),
+        )
+        Y_new = LinearRegressionModel.calculate_y(X_new, state.data_B, state.b_0, noise_new)
+        model.update(X_new, Y_new)
+        X_parts.append(X_new)
+        noise_parts.append(noise_new)
+        Y_parts.append(Y_new)
+        offset += count
+
+    state.data_X = (
+        scipy_sparse().vstack(X_parts, format="csr") if is_sparse(state.data_X) else np.vstack(X_parts)
+    )
+    state.noise = np.concatenate(noise_parts)
+    state.data_Y = np.vstack(Y_parts)
+    state.n_obs = state.data_X.shape[0]
+    state.B_hat, state.solver_used = model.B_hat, "rls"
+    return state, LinearRegressionModel.calculate_metrics(state.data_B, state.B_hat[1:])
+
+
+# <summary>
+# Розбирає значення --folds: ціле число частин або "loo".
+# </summary>
+# <param name="value">Рядок аргументу</param>
+# <returns>Кількість частин або "loo"</returns>
+def parse_folds(value: str) -> int | str:
+    if value.lower() == "loo":
+        return "loo"
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("folds must be an integer or 'loo'") from None
+
+
+# <summary>
+# Додає до парсера параметри одного прогону.
+# </summary>
+# <param name="parser">Парсер аргументів командного рядка</param>
+# <param name="sweep">Чи приймають параметри сітки перебору список значень</param>
+def add_run_arguments(parser: argparse.ArgumentParser, sweep: bool = False):
+    defaults = RunConfig()
+    nargs = "+" if sweep else None
+
+    def default(value):
+        return [value] if sweep else value
+
+    parser.add_argument("--n-obs", type=int, nargs=nargs, default=default(defaults.n_obs))
+    parser.add_argument("--n-feats", type=int, nargs=nargs, default=default(defaults.n_feats))
+    parser.add_argument("--x-min", type=float, default=defaults.x_min)
+    parser.add_argument("--x-max", type=float, default=defaults.x_max)
+    parser.add_argument("--x-precision", type=int, default=defaults.x_precision)
+    parser.add_argument(
+        "--dtype", default=defaults.dtype, choices=InputVectors.DTYPES, help="Element type of X"
+    )
+    parser.add_argument(
+        "--x-density", type=float, default=defaults.x_density, help="Fraction of nonzeros; below 1 gives a sparse X"
+    )
+    parser.add_argument("--b-min", type=float, default=defaults.b_min)
+    parser.add_argument("--b-max", type=float, default=defaults.b_max)
+    parser.add_argument("--b-precision", type=int, default=defaults.b_precision)
+    parser.add_argument("--b0", dest="b_0", type=float, default=defaults.b_0)
+    parser.add_argument("--noise-e", type=float, nargs=nargs, default=default(defaults.noise_e))
+    parser.add_argument("--noise-sigma", type=float, nargs=nargs, default=default(defaults.noise_sigma))
+    parser.add_argument(
+        "--seed", type=int, nargs=nargs, default=default(defaults.seed), help="Random seed (default: from OS entropy)"
+    )
+    if sweep:
+        parser.add_argument("--precision", type=int, nargs="+", help="Precision of both X and B")
+    parser.add_argument("--solver", default=defaults.solver, choices=LinearRegressionModel.SOLVERS)
+    parser.add_argument(
+        "--tolerance", type=float, default=defaults.tolerance, help="Relative stopping tolerance of lsqr"
+    )
+    parser.add_argument(
+        "--max-iterations", type=int, default=defaults.max_iterations, help="Iteration cap of lsqr"
+    )
+    parser.add_argument("--x-file", help="X as comma-separated text, .npy, or sparse .npz/.mtx")
+    parser.add_argument("--b-file", help="B (without b0) as comma-separated text or .npy")
+
+
+# <summary>
+# Створює RunConfig з розібраних аргументів командного рядка.
+# </summary>
+# <param name="args">Розібрані аргументи</param>
+# <returns>Параметри запуску</returns>
+def config_from_args(args: argparse.Namespace) -> RunConfig:
+    return RunConfig(
+        **{field.name: getattr(args, field.name) for field in dataclasses.fields(RunConfig)}
+    )
+
+
+# <summary>
+# Виконує команду sweep: перевіряє кожну комірку сітки і запускає перебір
+# з дописуванням результатів у CSV та продовженням перерваного перебору.
+# </summary>
+# <param name="parser">Парсер для повідомлень про помилки</param>
+# <param name="args">Розібрані аргументи команди sweep</param>
+# <returns>Код завершення процесу</returns>
+def run_sweep_command(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    from parameter_sweep import GRID_PARAMETERS, cell_config, expand_grid, run_sweep
+
+    grid = {name: getattr(args, name) for name in GRID_PARAMETERS if getattr(args, name) is not None}
+    base = RunConfig(**{
+        field.name: getattr(args, field.name)
+        for field in dataclasses.fields(RunConfig)
+        if field.name not in grid
+    })
+    for cell in expand_grid(grid):
+        if errors := validate(cell_config(base, cell)):
+            parser.error(f"{cell}: " + "; ".join(errors))
+
+    try:
+        computed = run_sweep(base, grid, args.output, args.workers, on_result=print)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"{computed} cells computed, results in {args.output}")
+    return 0
+
+
+# <summary>
+# Точка входу командного рядка: python -m linear_regression run [параметри].
+# </summary>
+# <param name="argv">Аргументи командного рядка (за замовчуванням sys.argv)</param>
+# <returns>Код завершення процесу</returns>
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m linear_regression", description="Headless linear regression runs"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run a single regression and write B̂, y and metrics")
+    add_run_arguments(run_parser)
+    run_parser.add_argument("--output", "-o", default="regression_output")
+    run_parser.add_argument("--save-state", action="store_true", help="Also save all arrays as .npy")
+
+    simulate_parser = commands.add_parser(
+        "simulate", help="Monte-Carlo: fit R noise replicates against one factorization of X"
+    )
+    add_run_arguments(simulate_parser)
+    simulate_parser.add_argument("--replicates", "-r", type=int, default=1000)
+    simulate_parser.add_argument("--output", "-o", default="simulation_output")
+
+    cv_parser = commands.add_parser(
+        "cv", help="Cross-validate: k-fold via downdated fold moments, or leave-one-out via the hat matrix"
+    )
+    add_run_arguments(cv_parser)
+    cv_parser.add_argument("--folds", "-k", type=parse_folds, default=5, help="Number of folds or 'loo'")
+    cv_parser.add_argument("--output", "-o", default="cv_output")
+
+    append_parser = commands.add_parser(
+        "append", help="Run, then append rows in batches and update B̂ by recursive least squares"
+    )
+    add_run_arguments(append_parser)
+    append_parser.add_argument("--rows", type=int, default=100, help="Total number of appended rows")
+    append_parser.add_argument("--batch-rows", type=int, default=100, help="Rows per RLS update")
+    append_parser.add_argument("--forgetting", type=float, default=1.0, help="RLS forgetting factor in (0, 1]")
+    append_parser.add_argument(
+        "--refactor-every", type=int, default=100, help="RLS updates between refactorizations; 0 disables"
+    )
+    append_parser.add_argument("--output", "-o", default="append_output")
+    append_parser.add_argument("--save-state", action="store_true", help="Also save all arrays as .npy")
+
+    bootstrap_parser = commands.add_parser(
+        "bootstrap", help="Bootstrap percentile intervals for B̂ from multinomial row weights"
+    )
+    add_run_arguments(bootstrap_parser)
+    bootstrap_parser.add_argument("--resamples", "-r", type=int, default=1000)
+    bootstrap_parser.add_argument("--confidence", type=float, default=0.95)
+    bootstrap_parser.add_argument("--workers", type=int, default=None)
+    bootstrap_parser.add_argument("--output", "-o", default="bootstrap_output")
+
+    sweep_parser = commands.add_parser(
+        "sweep", help="Run a grid over n_obs, n_feats, E, σ, precision and seed in a process pool"
+    )
+    add_run_arguments(sweep_parser, sweep=True)
+    sweep_parser.add_argument("--output", "-o", default="sweep_results.csv")
+    sweep_parser.add_argument("--workers", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == "sweep":
+        return run_sweep_command(parser, args)
+    config = config_from_args(args)
+    if errors := validate(config):
+        parser.error("; ".join(errors))
+
+    match args.command:
+        case "run":
+            state, metrics = run_regression(config)
+            write_results(args.output, state, metrics, args.save_state)
+            print(json.dumps({k: float(v) for k, v in metrics.items()}))
+        case "simulate":
+            if config.solver not in LeastSquaresSolver.SOLVERS:
+                parser.error(f"simulate supports solvers {LeastSquaresSolver.SOLVERS}")
+            state = prepare_inputs(config)
+            result = LinearRegressionModel.simulate(
+                state.data_X,
+                state.data_B,
+                state.b_0,
+                config.noise_e,
+                config.noise_sigma,
+                args.replicates,
+                Limits.MAX_PRECISION,
+                config.solver,
+                streams=RandomStreams(state.seed),
+            )
+            write_simulation_results(args.output, result)
+            print(json.dumps(result["metrics_mean"]))
+        case "cv":
+            try:
+                result = run_cross_validation(config, args.folds, args.output)
+            except ValueError as e:
+                parser.error(str(e))
+            print(json.dumps(result.get("mean", result)))
+        case "append":
+            if args.rows < 1 or args.batch_rows < 1:
+                parser.error("rows and batch-rows must be positive")
+            if not 0 < args.forgetting <= 1 or args.refactor_every < 0:
+                parser.error("forgetting must be in (0, 1] and refactor-every non-negative")
+            state, metrics = run_append(config, args.rows, args.batch_rows, args.forgetting, args.refactor_every)
+            write_results(args.output, state, metrics, args.save_state)
+            print(json.dumps(metrics))
+        case "bootstrap":
+            if args.resamples < 1 or not 0 < args.confidence < 1:
+                parser.error("resamples must be positive and confidence in (0, 1)")
+            print(json.dumps(run_bootstrap(config, args.resamples, args.confidence, args.output, args.workers)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,51 +1,249 @@
+import contextlib
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from sklearn.metrics import mean_squared_error, mean_absolute_error
+
+from bootstrap import Bootstrap
+from cross_validation import CrossValidation
+from iterative_solver import IterativeSolution, LSQRSolver
+from least_squares_solver import FactorizationCache, LeastSquaresSolver, block_rows
+from random_streams import RandomStreams
+from regression_metrics import RegressionMetrics
+from ridge_regression import RidgePath
+from sparse_matrix import column_means, is_sparse
+from streaming_regression import RegressionMoments
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:  # threadpoolctl є необов'язковою залежністю
+    threadpool_limits = None
 
 
 class LinearRegressionModel:
+    SOLVERS = LeastSquaresSolver.SOLVERS + ("parallel", "ridge", "lsqr")
+
+    # Мінімальна кількість рядків у блоці паралельного накопичення
+    MIN_PARALLEL_BLOCK_ROWS = 4096
+
+    # Кеш розкладів X: повторна оцінка з тією ж X і новим Y не розкладає X заново
+    factorization_cache = FactorizationCache()
 
     # <summary>
     # Генерує шум із заданим математичним сподіванням і стандартним відхиленням.
     # </summary>
     # <param name="expected_value">Математичне сподівання нормального розподілу</param>
     # <param name="standard_deviation">Стандартне відхилення нормального розподілу</param>
-    # <param name="size">Кількість значень шуму</param>
+    # <param name="size">Кількість значень шуму або форма масиву, наприклад (n_obs, R) для R реплік</param>
     # <param name="precision">Кількість знаків після коми для округлення</param>
+    # <param name="streams">Джерело випадкових чисел; None — нове з випадковим seed</param>
+    # <param name="key">Ключ потоку шуму, наприклад (RandomStreams.NOISE, номер пакета)</param>
+    # <param name="progress">Функція, що отримує частку згенерованих рядків</param>
     # <returns>Масив значень шуму</returns>
     @staticmethod
     def generate_noise(
-        expected_value: float, standard_deviation: float, size: int, precision: int
+        expected_value: float,
+        standard_deviation: float,
+        size: int | tuple[int, ...],
+        precision: int,
+        streams: RandomStreams | None = None,
+        key: tuple[int, ...] = (RandomStreams.NOISE,),
+        progress: Callable[[float], None] | None = None,
     ) -> np.ndarray:
-        return np.round(np.random.normal(expected_value, standard_deviation, size), precision)
+        streams = streams or RandomStreams()
+        return streams.normal(key, expected_value, standard_deviation, size, precision, progress)
 
     # <summary>
     # Обчислює вектор значень Y, використовуючи вхідний датасет, вектор коефіцієнтів знучущості, біас і шум.
     # </summary>
-    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="design_matrix">Матриця спостережень, щільна або розріджена</param>
     # <param name="B">Вектор істинних коефіцієнтів</param>
     # <param name="bias">Значення зсуву</param>
-    # <param name="noise">Масив шуму</param>
-    # <returns>Розраховані значення Y</returns>
+    # <param name="noise">Вектор шуму або матриця n_obs × R, кожен стовпець якої — окрема репліка</param>
+    # <returns>Розраховані значення Y розміру n_obs × 1 або n_obs × R у float64</returns>
     @staticmethod
     def calculate_y(
         design_matrix: np.ndarray, B: np.ndarray, bias: float, noise: np.ndarray
     ) -> np.ndarray:
-        B = B.reshape(-1, 1)
-        noise = noise.reshape(-1, 1)
-        return np.dot(design_matrix, B) + bias + noise
+        B = B.reshape(-1, 1).astype(np.float64, copy=False)
+        noise = noise.reshape(-1, 1) if noise.ndim == 1 else noise
+        if is_sparse(design_matrix):
+            # Розріджений добуток матриці на вектор коштує O(nnz)
+            return design_matrix @ B + bias + noise
+        Y = np.empty((design_matrix.shape[0], 1), dtype=np.float64)
+        # Добуток рахується поблоково, щоб float32 X не перетворювалась у float64 цілком
+        step = block_rows(design_matrix)
+        for start in range(0, design_matrix.shape[0], step):
+            np.dot(design_matrix[start:start + step], B, out=Y[start:start + step])
+        return Y + bias + noise
 
     # <summary>
     # Обчислює оцінку вектора коефіцієнтів B за методом найменших квадратів.
+    # Псевдообернена матриця не формується: система розв'язується через розклад
+    # (QR, Холецького або SVD), обраний параметром solver. Вільний член
+    # враховується центруванням X, тому копія X зі стовпцем одиниць не створюється.
+    # Розклад X кешується, тому повторний виклик з тією ж X розв'язує лише для нового Y.
+    # Метод ridge повертає гребеневу оцінку з λ, обраним за GCV (див. calculate_ridge),
+    # lsqr — ітераційний розв'язок без розкладу з типовими параметрами (див. calculate_B_hat_iterative).
     # </summary>
     # <param name="design_matrix">Матриця спостережень</param>
     # <param name="Y">Вектор відповідей</param>
-    # <returns>Оцінений вектор коефіцієнтів B_hat</returns>
-    @staticmethod
+    # <param name="solver">Метод розв'язання: auto, qr, cholesky, svd, parallel, ridge або lsqr</param>
+    # <param name="progress">Функція, що отримує частку виконаної роботи; може перервати оцінку винятком</param>
+    # <returns>Оцінений вектор коефіцієнтів B_hat та назва фактично використаного методу</returns>
+    @classmethod
     def calculate_B_hat(
-        design_matrix: np.ndarray, Y: np.ndarray
+        cls,
+        design_matrix: np.ndarray,
+        Y: np.ndarray,
+        solver: str = "auto",
+        progress: Callable[[float], None] | None = None,
+    ) -> tuple[np.ndarray, str]:
+        if solver == "parallel":
+            return cls.calculate_B_hat_parallel(design_matrix, Y, progress=progress), "parallel"
+        if solver == "ridge":
+            return cls.calculate_ridge(design_matrix, Y, progress=progress)["B_hat"], "ridge"
+        if solver == "lsqr":
+            return cls.calculate_B_hat_iterative(design_matrix, Y, progress=progress).B_hat, "lsqr"
+        factorization = cls.factorization_cache.get_or_factorize(design_matrix, solver, progress)
+        return factorization.solve(design_matrix, Y), factorization.method
+
+    # <summary>
+    # Обчислює оцінку B ітераційно (LSQR), використовуючи лише добутки з X та Xᵀ.
+    # Ні матриця Грама, ні розклад X не формуються, тож додаткова пам'ять — O(n + p),
+    # і метод придатний для форм, за яких XᵀX не вміщується в пам'ять.
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="Y">Вектор відповідей</param>
+    # <param name="tolerance">Відносна точність зупинки</param>
+    # <param name="max_iterations">Максимальна кількість ітерацій; None — 2·min(n_obs, n_feats)</param>
+    # <param name="B_init">Початкове наближення, наприклад попередня B̂; None — нульове</param>
+    # <param name="progress">Функція, що отримує частку виконаних ітерацій</param>
+    # <returns>Розв'язок з B̂, кількістю ітерацій, нормою залишку та ознакою збіжності</returns>
+    @staticmethod
+    def calculate_B_hat_iterative(
+        design_matrix: np.ndarray,
+        Y: np.ndarray,
+        tolerance: float = 1e-10,
+        max_iterations: int | None = None,
+        B_init: np.ndarray | None = None,
+        progress: Callable[[float], None] | None = None,
+    ) -> IterativeSolution:
+        return LSQRSolver(tolerance, max_iterations).solve(design_matrix, Y, B_init, progress)
+
+    # <summary>
+    # Обчислює оцінку B паралельно: рядки X розбиваються на блоки, для кожного блоку
+    # у пулі потоків обчислюються центровані XᵀX та XᵀY, після чого часткові
+    # результати об'єднуються і розв'язуються нормальні рівняння.
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="Y">Вектор відповідей</param>
+    # <param name="n_workers">Кількість потоків пулу (за замовчуванням — кількість ядер)</param>
+    # <param name="blas_threads">Кількість потоків BLAS на один потік пулу; None — не обмежувати</param>
+    # <param name="progress">Функція, що отримує частку оброблених блоків; виняток з неї скасовує решту блоків</param>
+    # <returns>Оцінений вектор коефіцієнтів B_hat</returns>
+    @classmethod
+    def calculate_B_hat_parallel(
+        cls,
+        design_matrix: np.ndarray,
+        Y: np.ndarray,
+        n_workers: int | None = None,
+        blas_threads: int | None = 1,
+        progress: Callable[[float], None] | None = None,
     ) -> np.ndarray:
-        A = np.hstack([np.ones((design_matrix.shape[0], 1)), design_matrix])
-        return (np.linalg.pinv(A.T @ A) @ A.T) @ Y
+        B_hat = cls.calculate_moments_parallel(design_matrix, Y, n_workers, blas_threads, progress).solve()
+        return B_hat if Y.ndim == 2 else B_hat[:, 0]
+
+    # <summary>
+    # Накопичує достатні статистики МНК паралельно: для кожного блоку рядків у пулі
+    # потоків обчислюються центровані XᵀX та XᵀY, а часткові результати об'єднуються.
+    # Об'єднані статистики дають і B̂, і (XcᵀXc)⁻¹ для діагностики без розкладу X.
+    # Щоб потоки пулу не конкурували з потоками BLAS, кількість потоків BLAS
+    # обмежується через threadpoolctl (якщо встановлено).
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="Y">Вектор відповідей</param>
+    # <param name="n_workers">Кількість потоків пулу (за замовчуванням — кількість ядер)</param>
+    # <param name="blas_threads">Кількість потоків BLAS на один потік пулу; None — не обмежувати</param>
+    # <param name="progress">Функція, що отримує частку оброблених блоків; виняток з неї скасовує решту блоків</param>
+    # <returns>Статистики всіх рядків X</returns>
+    @classmethod
+    def calculate_moments_parallel(
+        cls,
+        design_matrix: np.ndarray,
+        Y: np.ndarray,
+        n_workers: int | None = None,
+        blas_threads: int | None = 1,
+        progress: Callable[[float], None] | None = None,
+    ) -> RegressionMoments:
+        n_workers = n_workers or os.cpu_count() or 1
+        n_obs = design_matrix.shape[0]
+        step = max(cls.MIN_PARALLEL_BLOCK_ROWS, -(-n_obs // n_workers))
+        Y_2d = Y.reshape(n_obs, -1)
+
+        def block_moments(start: int) -> RegressionMoments:
+            return RegressionMoments.from_block(
+                design_matrix[start:start + step], Y_2d[start:start + step]
+            )
+
+        starts = range(0, n_obs, step)
+        moments = None
+        with cls._blas_limits(blas_threads):
+            executor = ThreadPoolExecutor(max_workers=n_workers)
+            try:
+                for index, block in enumerate(executor.map(block_moments, starts), 1):
+                    moments = block if moments is None else moments.merge(block)
+                    if progress is not None:
+                        progress(index / len(starts))
+            finally:
+                executor.shutdown(cancel_futures=True)
+        return moments
+
+    # <summary>
+    # Обмежує кількість потоків BLAS на час роботи пулу потоків через threadpoolctl
+    # (якщо встановлено), щоб потоки пулу не конкурували з потоками BLAS.
+    # </summary>
+    # <param name="blas_threads">Кількість потоків BLAS; None — не обмежувати</param>
+    # <returns>Менеджер контексту</returns>
+    @staticmethod
+    def _blas_limits(blas_threads: int | None):
+        if threadpool_limits is None or blas_threads is None:
+            return contextlib.nullcontext()
+        return threadpool_limits(limits=blas_threads, user_api="blas")
+
+    # <summary>
+    # Гребенева регресія по сітці λ за одним SVD-розкладом центрованої X, взятим з кешу
+    # розкладів. Кожне додаткове λ коштує O(p) для GCV, тож λ обирається узагальненою
+    # перехресною перевіркою без повторних оцінок; коефіцієнти обчислюються лише для обраного λ.
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="Y">Вектор відповідей</param>
+    # <param name="lambdas">Сітка λ; None — логарифмічна сітка RidgePath.default_lambdas</param>
+    # <param name="progress">Функція, що отримує частку виконаної роботи розкладу</param>
+    # <returns>Словник: B_hat, lambda — обране λ, lambdas, gcv, df — значення на сітці, path — RidgePath</returns>
+    @classmethod
+    def calculate_ridge(
+        cls,
+        design_matrix: np.ndarray,
+        Y: np.ndarray,
+        lambdas: np.ndarray | None = None,
+        progress: Callable[[float], None] | None = None,
+    ) -> dict:
+        factorization = cls.factorization_cache.get_or_factorize(design_matrix, "svd", progress)
+        path = RidgePath(factorization, design_matrix, Y)
+        lambdas = path.default_lambdas() if lambdas is None else np.asarray(lambdas, dtype=np.float64)
+        if lambdas.size == 0 or np.any(lambdas < 0):
+            raise ValueError("lambdas must be a non-empty grid of non-negative values")
+        lam, gcv = path.select(lambdas)
+        return {
+            "B_hat": path.coefficients(lam),
+            "lambda": lam,
+            "lambdas": lambdas,
+            "gcv": gcv,
+            "df": path.degrees_of_freedom(lambdas),
+            "path": path,
+        }
 
     # <summary>
     # Обчислює метрики якості оцінки коефіцієнтів: MSE, RMSE, MAE, MAPE.
@@ -55,9 +253,212 @@ class LinearRegressionModel:
     # <returns>Словник з метриками якості</returns>
     @staticmethod
     def calculate_metrics(B_true: np.ndarray, B_pred: np.ndarray) -> dict:
-        mse = mean_squared_error(B_true, B_pred)
-        rmse = np.sqrt(mse)
-        mae = mean_absolute_error(B_true, B_pred)
-        mape = np.mean(np.abs((B_true - B_pred) / B_true)) * 100
-        metrics = {"mse": mse, "rmse": rmse, "mae": mae, "mape": mape}
-        return metrics
+        metrics = RegressionMetrics.coefficient_metrics(B_true, np.reshape(B_pred, (-1, 1)))
+        return {name: float(values[0]) for name, values in metrics.items()}
+
+    # <summary>
+    # Обчислює метрики якості для кожної репліки окремо, векторизовано по стовпцях.
+    # </summary>
+    # <param name="B_true">Істинний вектор коефіцієнтів розміру n_feats × 1</param>
+    # <param name="B_preds">Оцінки коефіцієнтів розміру n_feats × R</param>
+    # <returns>Словник метрик, кожна з яких є масивом довжини R</returns>
+    @staticmethod
+    def calculate_replicate_metrics(B_true: np.ndarray, B_preds: np.ndarray) -> dict:
+        return RegressionMetrics.coefficient_metrics(B_true, B_preds)
+
+    # <summary>
+    # Обчислює діагностику підгонки: R², скоригований R², дисперсію залишків,
+    # стандартні похибки B̂ та t-статистики. (XcᵀXc)⁻¹ береться з кешованого
+    # розкладу X, тому після calculate_B_hat діагностика коштує один прохід по X.
+    # Для parallel X не розкладається: (XcᵀXc)⁻¹ обчислюється за O(p³) з об'єднаної
+    # матриці Грама паралельної оцінки.
+    # Для ridge діагностика рахується для λ, обраного GCV, з ефективною кількістю
+    # параметрів df(λ), і додатково містить lambda та df. Для lsqr (XcᵀXc)⁻¹ не обчислюється,
+    # тому стандартні похибки і t-статистики дорівнюють NaN.
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="Y">Вектор відповідей</param>
+    # <param name="B_hat">Оцінений вектор коефіцієнтів разом із вільним членом</param>
+    # <param name="solver">Метод, яким оцінено B_hat</param>
+    # <param name="ridge">Результат calculate_ridge, з якого оцінено B_hat; None — обчислити заново</param>
+    # <param name="moments">Статистики calculate_moments_parallel, з яких оцінено B_hat; None — обчислити заново</param>
+    # <returns>Словник: r2, adj_r2, residual_variance — числа; se, t_stats — масиви форми B_hat</returns>
+    @classmethod
+    def calculate_diagnostics(
+        cls,
+        design_matrix: np.ndarray,
+        Y: np.ndarray,
+        B_hat: np.ndarray,
+        solver: str = "auto",
+        ridge: dict | None = None,
+        moments: RegressionMoments | None = None,
+    ) -> dict:
+        if solver == "ridge":
+            ridge = ridge or cls.calculate_ridge(design_matrix, Y)
+            diagnostics = ridge["path"].diagnostics(ridge["lambda"], B_hat)
+            diagnostics["lambda"] = ridge["lambda"]
+            diagnostics["df"] = float(diagnostics["df"][0])
+        elif solver == "parallel":
+            moments = moments or cls.calculate_moments_parallel(design_matrix, Y)
+            gram_inverse = LeastSquaresSolver.solve_normal_equations(moments.sxx, np.eye(moments.sxx.shape[0]))
+            diagnostics = RegressionMetrics.prediction_metrics(
+                design_matrix, Y, B_hat, gram_inverse, moments.x_mean
+            )
+        elif solver == "lsqr":
+            diagnostics = RegressionMetrics.prediction_metrics(
+                design_matrix, Y, B_hat, None, column_means(design_matrix)
+            )
+        else:
+            solver = solver if solver in LeastSquaresSolver.SOLVERS else "auto"
+            factorization = cls.factorization_cache.get_or_factorize(design_matrix, solver)
+            diagnostics = RegressionMetrics.prediction_metrics(
+                design_matrix, Y, B_hat, factorization.gram_inverse(), factorization.x_mean
+            )
+        for name in ("r2", "adj_r2", "residual_variance"):
+            diagnostics[name] = float(diagnostics[name][0])
+        return diagnostics
+
+    # <summary>
+    # Бутстреп-оцінка невизначеності B̂ без відомих істинних коефіцієнтів: resamples
+    # мультиноміальних зважувань рядків розв'язуються паралельно в пулі процесів
+    # (Bootstrap.resample), з оцінок беруться стандартні похибки та перцентильні інтервали.
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="Y">Вектор відповідей</param>
+    # <param name="resamples">Кількість бутстреп-вибірок</param>
+    # <param name="confidence">Рівень довіри інтервалів</param>
+    # <param name="streams">Джерело випадкових чисел; вибірка r береться з потоку (BOOTSTRAP, r)</param>
+    # <param name="n_workers">Кількість процесів (за замовчуванням — кількість ядер)</param>
+    # <returns>Словник: B_hat — оцінки вибірок, B_hat_std, lower, upper — стовпці розміру (n_feats + 1) × 1</returns>
+    @staticmethod
+    def calculate_bootstrap(
+        design_matrix: np.ndarray,
+        Y: np.ndarray,
+        resamples: int = 1000,
+        confidence: float = 0.95,
+        streams: RandomStreams | None = None,
+        n_workers: int | None = None,
+    ) -> dict:
+        if Y.ndim == 2 and Y.shape[1] != 1:
+            raise ValueError("Bootstrap supports a single response column")
+        B_hats = Bootstrap.resample(design_matrix, Y.reshape(-1), resamples, streams, n_workers)
+        lower, upper = Bootstrap.percentile_intervals(B_hats, confidence)
+        return {
+            "B_hat": B_hats,
+            "B_hat_std": B_hats.std(axis=0, ddof=min(1, resamples - 1)).reshape(-1, 1),
+            "lower": lower.reshape(-1, 1),
+            "upper": upper.reshape(-1, 1),
+            "confidence": confidence,
+        }
+
+    # <summary>
+    # K-кратна перехресна перевірка МНК: статистики частин обчислюються паралельно за один
+    # прохід по X, а навчальні статистики кожної частини — відніманням її внеску із загальних.
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="Y">Вектор відповідей</param>
+    # <param name="folds">Кількість частин</param>
+    # <param name="streams">Джерело випадкових чисел для перемішування рядків; None — суцільні частини</param>
+    # <param name="n_workers">Кількість потоків пулу (за замовчуванням — кількість ядер)</param>
+    # <param name="blas_threads">Кількість потоків BLAS на один потік пулу; None — не обмежувати</param>
+    # <returns>Словник: folds — метрики частин (fold, n_test, mse, rmse, r2), mean — середні метрики, pooled_mse</returns>
+    @classmethod
+    def calculate_cross_validation(
+        cls,
+        design_matrix: np.ndarray,
+        Y: np.ndarray,
+        folds: int = 5,
+        streams: RandomStreams | None = None,
+        n_workers: int | None = None,
+        blas_threads: int | None = 1,
+    ) -> dict:
+        with cls._blas_limits(blas_threads):
+            result = CrossValidation.k_fold(design_matrix, Y, folds, streams, n_workers or os.cpu_count() or 1)
+        return {
+            "folds": [
+                {
+                    "fold": index + 1,
+                    "n_test": int(fold["n_test"]),
+                    **{name: float(fold[name][0]) for name in ("mse", "rmse", "r2")},
+                }
+                for index, fold in enumerate(result["folds"])
+            ],
+            "mean": {name: float(values[0]) for name, values in result["mean"].items()},
+            "pooled_mse": float(result["pooled_mse"][0]),
+        }
+
+    # <summary>
+    # Перехресна перевірка з виключенням по одному через діагональ матриці впливу.
+    # (XcᵀXc)⁻¹ береться з кешованого розкладу X, тож після calculate_B_hat перевірка
+    # коштує один прохід по X.
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="Y">Вектор відповідей</param>
+    # <param name="solver">Метод розкладу; для parallel, ridge і lsqr використовується auto</param>
+    # <returns>Словник: press, mse, rmse, r2, max_leverage — числа</returns>
+    @classmethod
+    def calculate_leave_one_out(cls, design_matrix: np.ndarray, Y: np.ndarray, solver: str = "auto") -> dict:
+        solver = solver if solver in LeastSquaresSolver.SOLVERS else "auto"
+        factorization = cls.factorization_cache.get_or_factorize(design_matrix, solver)
+        result = CrossValidation.leave_one_out(design_matrix, Y, factorization)
+        return {name: float(np.ravel(values)[0]) for name, values in result.items()}
+
+    # <summary>
+    # Моделювання Монте-Карло: генерує R реплік шуму, обчислює всі R векторів y одним
+    # матричним добутком і розв'язує їх відносно одного спільного розкладу X.
+    # Репліки обробляються пакетами по batch_size, щоб обмежити пам'ять під матрицю шуму.
+    # Шум репліки r береться з фіксованої сітки RandomStreams.normal_replicates, тож
+    # за тим самим seed результат не залежить від batch_size. batch_size округлюється
+    # вгору до кратного RandomStreams.REPLICATE_BLOCK, щоб блоки сітки не генерувалися двічі.
+    # </summary>
+    # <param name="design_matrix">Матриця спостережень</param>
+    # <param name="B">Вектор істинних коефіцієнтів</param>
+    # <param name="bias">Значення зсуву</param>
+    # <param name="expected_value">Математичне сподівання шуму</param>
+    # <param name="standard_deviation">Стандартне відхилення шуму</param>
+    # <param name="replicates">Кількість реплік R</param>
+    # <param name="precision">Кількість знаків після коми для округлення шуму</param>
+    # <param name="solver">Метод розкладу: auto, qr, cholesky або svd</param>
+    # <param name="batch_size">Кількість реплік в одному пакеті</param>
+    # <param name="streams">Джерело випадкових чисел; шум блоку реплік j береться з потоку (NOISE, j)</param>
+    # <returns>Словник з оцінками B̂ усіх реплік, їх середнім і стандартним відхиленням та метриками</returns>
+    @staticmethod
+    def simulate(
+        design_matrix: np.ndarray,
+        B: np.ndarray,
+        bias: float,
+        expected_value: float,
+        standard_deviation: float,
+        replicates: int,
+        precision: int,
+        solver: str = "auto",
+        batch_size: int = 256,
+        streams: RandomStreams | None = None,
+    ) -> dict:
+        streams = streams or RandomStreams()
+        factorization = LinearRegressionModel.factorization_cache.get_or_factorize(design_matrix, solver)
+        B_hats = np.empty((design_matrix.shape[1] + 1, replicates))
+        batch_size = -(-max(batch_size, 1) // RandomStreams.REPLICATE_BLOCK) * RandomStreams.REPLICATE_BLOCK
+        for start in range(0, replicates, batch_size):
+            stop = min(start + batch_size, replicates)
+            noise = streams.normal_replicates(
+                (RandomStreams.NOISE,),
+                expected_value,
+                standard_deviation,
+                design_matrix.shape[0],
+                start,
+                stop,
+                precision,
+            )
+            Y = LinearRegressionModel.calculate_y(design_matrix, B, bias, noise)
+            B_hats[:, start:stop] = factorization.solve(design_matrix, Y)
+
+        metrics = LinearRegressionModel.calculate_replicate_metrics(B, B_hats[1:])
+        return {
+            "B_hat": B_hats,
+            "B_hat_mean": B_hats.mean(axis=1, keepdims=True),
+            "B_hat_std": B_hats.std(axis=1, ddof=min(1, replicates - 1), keepdims=True),
+            "metrics": metrics,
+            "metrics_mean": {name: float(values.mean()) for name, values in metrics.items()},
+            "solver": factorization.method,
+        }
@@ -0,0 +1,39 @@
+import io
+
+import numpy as np
+
+from sparse_matrix import is_sparse, to_dense
+
+# Кількість рядків, що форматуються за один раз і кешуються як буфер прокрутки
+BLOCK_ROWS = 256
+
+
+# <summary>
+# Форматує прямокутний блок матриці в рядки тексту одним викликом np.savetxt.
+# </summary>
+# <param name="block">Двовимірний блок даних; розріджений блок ущільнюється (він не більший за вікно)</param>
+# <param name="precision">Кількість знаків після коми</param>
+# <returns>Список відформатованих рядків без символу нового рядка</returns>
+def format_block(block: np.ndarray, precision: int) -> list[str]:
+    block = to_dense(block)
+    if block.size == 0:
+        return [""] * block.shape[0]
+    buffer = io.StringIO()
+    np.savetxt(buffer, np.asarray(block, dtype=float), fmt=f"%.{precision}f", delimiter=", ")
+    return buffer.getvalue().splitlines()
+
+
+# <summary>
+# Обчислює ширину найширшої комірки блоку у форматі format_block, не форматуючи весь
+# блок: довжина "%.nf" не спадає зі зростанням |v| для чисел одного знака, тож
+# найширшими є мінімальне або максимальне значення. Розріджений блок не ущільнюється.
+# </summary>
+# <param name="block">Двовимірний блок даних, щільний або розріджений</param>
+# <param name="precision">Кількість знаків після коми</param>
+# <returns>Кількість символів найширшої комірки; 1 для порожнього блоку</returns>
+def max_cell_width(block: np.ndarray, precision: int) -> int:
+    values = block.data if is_sparse(block) else np.asarray(block)
+    extremes = [values.min(), values.max()] if values.size else []
+    if is_sparse(block) and block.nnz < block.shape[0] * block.shape[1]:
+        extremes.append(0.0)
+    return max((len(f"{value:.{precision}f}") for value in extremes), default=1)
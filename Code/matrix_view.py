@@ -0,0 +1,170 @@
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import font as tkfont
+from tkinter import ttk
+
+import numpy as np
+
+from matrix_format import BLOCK_ROWS, format_block, max_cell_width
+from sparse_matrix import is_sparse
+
+
+class MatrixView(ttk.Frame):
+    # Кількість рядків у блоці форматування (див. matrix_format)
+    BLOCK_ROWS = BLOCK_ROWS
+    # Максимальна кількість кешованих блоків
+    CACHE_BLOCKS = 64
+
+    # <summary>
+    # Віртуалізований перегляд матриці: у текстовому полі відображається лише видиме
+    # вікно рядків і стовпців, а смуги прокрутки керують зсувом цього вікна.
+    # </summary>
+    # <param name="parent">Батьківський віджет</param>
+    # <param name="height">Висота текстового поля в рядках</param>
+    # <param name="width">Ширина текстового поля в символах</param>
+    def __init__(self, parent, height: int, width: int):
+        super().__init__(parent)
+        self.text = tk.Text(self, height=height, width=width, state="disabled", wrap="none")
+        self.scrollbar_y = ttk.Scrollbar(self, orient="vertical", command=self.scroll_rows)
+        self.scrollbar_x = ttk.Scrollbar(self, orient="horizontal", command=self.scroll_cols)
+        self.scrollbar_y.pack(side="right", fill="y")
+        self.scrollbar_x.pack(side="bottom", fill="x")
+        self.text.pack(fill="both", expand=True)
+
+        self.data = np.empty((0, 0))
+        self.precision = 0
+        self.row_offset = 0
+        self.col_offset = 0
+        self.visible_rows = height
+        self.visible_cols = 1
+        self.cell_width = 1
+        self._cache: OrderedDict = OrderedDict()
+
+        self.text.bind("<Configure>", self._on_resize)
+        self.text.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.text.bind("<Button-4>", lambda _: self.scroll_rows("scroll", -3, "units"))
+        self.text.bind("<Button-5>", lambda _: self.scroll_rows("scroll", 3, "units"))
+
+    # <summary>
+    # Встановлює нові дані для відображення. 1-D масив відображається як стовпець.
+    # Розріджена матриця зберігається як є: ущільнюються лише видимі блоки.
+    # </summary>
+    # <param name="data">Масив чисел або розріджена матриця</param>
+    # <param name="precision">Кількість знаків після коми</param>
+    def set_data(self, data: np.ndarray, precision: int):
+        data = data.tocsr() if is_sparse(data) else np.asanyarray(data)
+        self.data = data.reshape(-1, 1) if data.ndim == 1 else data
+        self.precision = precision
+        self.row_offset = 0
+        self.col_offset = 0
+        self._cache.clear()
+        # Ширина комірки — за найширшим значенням у першому блоці рядків по всіх стовпцях
+        self.cell_width = max_cell_width(self.data[:self.BLOCK_ROWS], precision) + 2
+        self._update_visible_cols()
+        self.render()
+
+    # <summary>
+    # Повертає відформатовані рядки блоку з кешу або форматує їх.
+    # </summary>
+    # <param name="block_index">Номер блоку з BLOCK_ROWS рядків</param>
+    # <returns>Список рядків блоку для поточного вікна стовпців</returns>
+    def _block_lines(self, block_index: int) -> list[str]:
+        key = (self.precision, block_index, self.col_offset, self.visible_cols)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        start = block_index * self.BLOCK_ROWS
+        block = self.data[start:start + self.BLOCK_ROWS, self.col_offset:self.col_offset + self.visible_cols]
+        lines = format_block(block, self.precision)
+        self._cache[key] = lines
+        if len(self._cache) > self.CACHE_BLOCKS:
+            self._cache.popitem(last=False)
+        return lines
+
+    # <summary>
+    # Перемальовує видиме вікно матриці та оновлює положення смуг прокрутки.
+    # </summary>
+    def render(self):
+        n_rows, n_cols = self.data.shape if self.data.ndim == 2 else (0, 0)
+        last_row = min(self.row_offset + self.visible_rows, n_rows)
+        lines = []
+        for block_index in range(self.row_offset // self.BLOCK_ROWS, -(-last_row // self.BLOCK_ROWS)):
+            block_start = block_index * self.BLOCK_ROWS
+            block = self._block_lines(block_index)
+            lines.extend(block[max(self.row_offset - block_start, 0):last_row - block_start])
+
+        self.text.config(state="normal")
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, "\n".join(lines))
+        self.text.config(state="disabled")
+
+        self.scrollbar_y.set(*self._fraction(self.row_offset, self.visible_rows, n_rows))
+        self.scrollbar_x.set(*self._fraction(self.col_offset, self.visible_cols, n_cols))
+
+    # <summary>
+    # Обчислює положення повзунка смуги прокрутки.
+    # </summary>
+    @staticmethod
+    def _fraction(offset: int, visible: int, total: int) -> tuple[float, float]:
+        if total == 0:
+            return 0.0, 1.0
+        return offset / total, min(offset + visible, total) / total
+
+    # <summary>
+    # Переводить команду смуги прокрутки (moveto/scroll) у новий зсув.
+    # </summary>
+    @staticmethod
+    def _scroll_offset(args: tuple, offset: int, visible: int, total: int) -> int:
+        if args[0] == "moveto":
+            offset = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = visible if args[2] == "pages" else 1
+            offset += int(args[1]) * step
+        return max(0, min(offset, total - visible))
+
+    # <summary>
+    # Обробляє вертикальну прокрутку по рядках.
+    # </summary>
+    def scroll_rows(self, *args):
+        offset = self._scroll_offset(args, self.row_offset, self.visible_rows, self.data.shape[0])
+        if offset != self.row_offset:
+            self.row_offset = offset
+            self.render()
+
+    # <summary>
+    # Обробляє горизонтальну прокрутку по стовпцях.
+    # </summary>
+    def scroll_cols(self, *args):
+        n_cols = self.data.shape[1] if self.data.ndim == 2 else 0
+        offset = self._scroll_offset(args, self.col_offset, self.visible_cols, n_cols)
+        if offset != self.col_offset:
+            self.col_offset = offset
+            self.render()
+
+    # <summary>
+    # Перераховує кількість видимих стовпців за шириною поля та шириною комірки.
+    # </summary>
+    def _update_visible_cols(self):
+        char_width = tkfont.Font(font=self.text.cget("font")).measure("0") or 1
+        width_pixels = self.text.winfo_width()
+        width_chars = width_pixels // char_width if width_pixels > 1 else int(self.text.cget("width"))
+        self.visible_cols = max(1, width_chars // self.cell_width)
+
+    # <summary>
+    # Після зміни розміру поля перераховує видиме вікно і перемальовує його.
+    # </summary>
+    def _on_resize(self, _=None):
+        line_height = tkfont.Font(font=self.text.cget("font")).metrics("linespace") or 1
+        visible_rows = max(1, self.text.winfo_height() // line_height)
+        visible_cols = self.visible_cols
+        self._update_visible_cols()
+        if visible_rows != self.visible_rows or visible_cols != self.visible_cols:
+            self.visible_rows = visible_rows
+            self.render()
+
+    # <summary>
+    # Прокручує рядки коліщатком миші.
+    # </summary>
+    def _on_mouse_wheel(self, event):
+        self.scroll_rows("scroll", -1 if event.delta > 0 else 1, "units")
+        return "break"
@@ -0,0 +1,159 @@
+import csv
+import dataclasses
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from linear_regression import RunConfig, run_regression
+
+# Параметри, за якими будується сітка; precision задає точність і X, і B
+GRID_PARAMETERS = ("n_obs", "n_feats", "noise_e", "noise_sigma", "precision", "seed")
+RESULT_COLUMNS = (
+    "mse", "rmse", "mae", "mape", "r2", "adj_r2", "residual_variance", "lambda", "df",
+    "iterations", "residual_norm", "solver", "seconds",
+)
+
+
+# <summary>
+# Розгортає сітку параметрів у список комірок (декартів добуток значень).
+# </summary>
+# <param name="grid">Словник: назва параметра -> список значень</param>
+# <returns>Список комірок, кожна — словник значень параметрів</returns>
+def expand_grid(grid: dict[str, list]) -> list[dict]:
+    unknown = set(grid) - set(GRID_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+    names = [name for name in GRID_PARAMETERS if name in grid]
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+# <summary>
+# Формує ключ комірки для порівняння з рядками вже записаного CSV.
+# </summary>
+# <param name="cell">Значення параметрів комірки</param>
+# <returns>Кортеж рядкових значень у порядку GRID_PARAMETERS</returns>
+def cell_key(cell: dict) -> tuple:
+    return tuple(cell_value(cell.get(name)) for name in GRID_PARAMETERS)
+
+
+# <summary>
+# Перетворює значення параметра комірки на рядок так само, як його записує csv.DictWriter:
+# None (наприклад, seed за замовчуванням) записується як порожній рядок.
+# </summary>
+# <param name="value">Значення параметра</param>
+# <returns>Рядкове значення</returns>
+def cell_value(value) -> str:
+    return "" if value is None else str(value)
+
+
+# <summary>
+# Застосовує значення параметрів комірки до базових параметрів запуску.
+# </summary>
+# <param name="base">Базові параметри запуску</param>
+# <param name="cell">Значення параметрів комірки</param>
+# <returns>Параметри запуску комірки</returns>
+def cell_config(base: RunConfig, cell: dict) -> RunConfig:
+    overrides = {name: value for name, value in cell.items() if name != "precision"}
+    if "precision" in cell:
+        overrides.update(x_precision=cell["precision"], b_precision=cell["precision"])
+    return dataclasses.replace(base, **overrides)
+
+
+# <summary>
+# Виконує одну комірку сітки: генерація, y, B̂ та метрики. Запускається в окремому процесі.
+# </summary>
+# <param name="base">Базові параметри запуску</param>
+# <param name="cell">Значення параметрів комірки</param>
+# <returns>Рядок результату: параметри комірки, метрики, метод і час виконання</returns>
+def run_cell(base: RunConfig, cell: dict) -> dict:
+    start = time.perf_counter()
+    state, metrics = run_regression(cell_config(base, cell))
+    return {
+        **{name: cell_value(cell.get(name)) for name in GRID_PARAMETERS},
+        **{name: float(value) for name, value in metrics.items()},
+        "solver": state.solver_used,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+# <summary>
+# Зчитує ключі вже обчислених комірок з CSV попереднього (можливо, перерваного) запуску.
+# </summary>
+# <param name="output_path">Шлях до CSV результатів</param>
+# <returns>Множина ключів обчислених комірок</returns>
+def completed_cells(output_path: str) -> set[tuple]:
+    if not os.path.exists(output_path):
+        return set()
+    with open(output_path, newline="") as f:
+        return {tuple(row[name] for name in GRID_PARAMETERS) for row in csv.DictReader(f)}
+
+
+# <summary>
+# Перевіряє заголовок CSV попереднього запуску, оскільки DictWriter дописує рядки без
+# перевірки стовпців. Файл, стовпці якого є підмножиною поточних (записаний до появи
+# нових метрик), переписується з поточним заголовком і порожніми новими стовпцями;
+# файл з іншими стовпцями не продовжується.
+# </summary>
+# <param name="output_path">Шлях до CSV результатів</param>
+def migrate_header(output_path: str):
+    if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
+        return
+    fieldnames = GRID_PARAMETERS + RESULT_COLUMNS
+    with open(output_path, newline="") as f:
+        reader = csv.DictReader(f)
+        header = tuple(reader.fieldnames or ())
+        if header == fieldnames:
+            return
+        if not set(header) <= set(fieldnames) or not set(GRID_PARAMETERS) <= set(header):
+            raise ValueError(
+                f"{output_path} has columns {list(header)}, expected {list(fieldnames)}; use a new output file"
+            )
+        rows = list(reader)
+    temporary_path = f"{output_path}.tmp"
+    with open(temporary_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(temporary_path, output_path)
+
+
+# <summary>
+# Запускає перебір сітки параметрів у пулі процесів. Результати дописуються в CSV
+# у міру завершення комірок, тому перерваний перебір можна продовжити:
+# комірки, які вже є у файлі, повторно не обчислюються. Файл зі старішим набором
+# стовпців спершу переводиться на поточний заголовок (див. migrate_header).
+# </summary>
+# <param name="base">Базові параметри запуску (діапазони X і B, b₀, метод)</param>
+# <param name="grid">Словник: назва параметра -> список значень</param>
+# <param name="output_path">Шлях до CSV результатів</param>
+# <param name="max_workers">Кількість процесів (за замовчуванням — кількість ядер)</param>
+# <param name="on_result">Викликається з рядком результату після кожної комірки</param>
+# <returns>Кількість обчислених у цьому запуску комірок</returns>
+def run_sweep(
+    base: RunConfig,
+    grid: dict[str, list],
+    output_path: str,
+    max_workers: int | None = None,
+    on_result=None,
+) -> int:
+    migrate_header(output_path)
+    done = completed_cells(output_path)
+    pending = [cell for cell in expand_grid(grid) if cell_key(cell) not in done]
+    if not pending:
+        return 0
+
+    write_header = not os.path.exists(output_path) or os.path.getsize(output_path) == 0
+    with open(output_path, "a", newline="") as f, ProcessPoolExecutor(max_workers=max_workers) as executor:
+        writer = csv.DictWriter(f, fieldnames=GRID_PARAMETERS + RESULT_COLUMNS)
+        if write_header:
+            writer.writeheader()
+            f.flush()
+        futures = [executor.submit(run_cell, base, cell) for cell in pending]
+        for future in as_completed(futures):
+            row = future.result()
+            writer.writerow(row)
+            f.flush()
+            if on_result is not None:
+                on_result(row)
+    return len(pending)
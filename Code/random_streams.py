@@ -0,0 +1,250 @@
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+class RandomStreams:
+    # Ідентифікатори незалежних потоків для кожного випадкового масиву
+    X = 0
+    B = 1
+    NOISE = 2
+    # Рядки, дописані до X; ключ (APPEND, номер першого рядка, X або NOISE)
+    APPEND = 3
+    # Перемішування рядків для розбиття на частини перехресної перевірки
+    FOLDS = 4
+    # Мультиноміальні ваги бутстрепу; ключ (BOOTSTRAP, номер вибірки)
+    BOOTSTRAP = 5
+
+    # Розмір блоку, який заповнюється одним генератором. Розбиття на блоки залежить
+    # лише від форми масиву, а не від кількості потоків, тому результат відтворюваний
+    BLOCK_BYTES = 8 * 2**20
+    # Кількість стовпців-реплік у блоці сітки реплік (див. normal_replicates)
+    REPLICATE_BLOCK = 64
+
+    # <summary>
+    # Джерело відтворюваних випадкових чисел на основі np.random.SeedSequence.
+    # Кожен масив має власний потік (ключ), а кожен блок рядків масиву — власний
+    # генератор SeedSequence(seed, spawn_key=(*key, block)), тому блоки заповнюються
+    # незалежно і паралельно, а результат не залежить від кількості потоків.
+    # </summary>
+    # <param name="seed">Початкове значення; None — нове значення з ентропії ОС</param>
+    # <param name="workers">Кількість потоків заповнення (за замовчуванням — кількість ядер)</param>
+    def __init__(self, seed: int | None = None, workers: int | None = None):
+        self.seed = self.new_seed() if seed is None else int(seed)
+        self.workers = workers or os.cpu_count() or 1
+
+    # <summary>
+    # Створює нове початкове значення з ентропії ОС.
+    # </summary>
+    # <returns>Невід'ємне ціле 32-бітне значення, зручне для введення та збереження</returns>
+    @staticmethod
+    def new_seed() -> int:
+        return int(np.random.SeedSequence().generate_state(1)[0])
+
+    # <summary>
+    # Створює генератор для потоку з заданим ключем.
+    # </summary>
+    # <param name="key">Ключ потоку, наприклад (RandomStreams.NOISE, номер пакета)</param>
+    # <returns>Незалежний генератор PCG64</returns>
+    def generator(self, *key: int) -> np.random.Generator:
+        return np.random.Generator(np.random.PCG64(np.random.SeedSequence(self.seed, spawn_key=key)))
+
+    # <summary>
+    # Заповнює масив блоками рядків: кожен блок заповнюється власним генератором
+    # у пулі потоків (генератори NumPy звільняють GIL під час заповнення).
+    # </summary>
+    # <param name="key">Ключ потоку масиву</param>
+    # <param name="shape">Форма масиву</param>
+    # <param name="fill">Функція, що заповнює блок на місці: fill(generator, block)</param>
+    # <param name="progress">Функція, що отримує частку заповнених рядків</param>
+    # <param name="dtype">Тип елементів масиву (float32 або float64)</param>
+    # <returns>Заповнений масив</returns>
+    def _fill(
+        self,
+        key: tuple[int, ...],
+        shape: int | tuple[int, ...],
+        fill: Callable[[np.random.Generator, np.ndarray], None],
+        progress: Callable[[float], None] | None = None,
+        dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
+        out = np.empty(shape, dtype=dtype)
+        rows = out.shape[0]
+        row_bytes = max(out.itemsize * (out.size // max(rows, 1)), 1)
+        step = max(1, self.BLOCK_BYTES // row_bytes)
+        starts = range(0, rows, step)
+
+        def fill_block(index: int) -> int:
+            block = out[starts[index]:starts[index] + step]
+            fill(self.generator(*key, index), block)
+            return block.shape[0]
+
+        executor = ThreadPoolExecutor(self.workers) if len(starts) > 1 and self.workers > 1 else None
+        filled_blocks = (executor.map if executor else map)(fill_block, range(len(starts)))
+        filled = 0
+        try:
+            for block_rows in filled_blocks:
+                filled += block_rows
+                if progress is not None:
+                    progress(filled / rows)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return out
+
+    # <summary>
+    # Генерує масив рівномірно розподілених значень на [low, high), округлених до precision.
+    # </summary>
+    # <param name="key">Ключ потоку масиву</param>
+    # <param name="low">Нижня межа</param>
+    # <param name="high">Верхня межа</param>
+    # <param name="shape">Форма масиву</param>
+    # <param name="precision">Кількість знаків після коми для округлення</param>
+    # <param name="progress">Функція, що отримує частку заповнених рядків</param>
+    # <param name="dtype">Тип елементів масиву (float32 або float64)</param>
+    # <returns>Масив значень</returns>
+    def uniform(
+        self,
+        key: tuple[int, ...],
+        low: float,
+        high: float,
+        shape: int | tuple[int, ...],
+        precision: int,
+        progress: Callable[[float], None] | None = None,
+        dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
+        def fill(generator: np.random.Generator, block: np.ndarray):
+            generator.random(out=block, dtype=block.dtype)
+            # Масштабування та округлення виконуються на місці, без другої копії блоку
+            block *= high - low
+            block += low
+            np.round(block, precision, out=block)
+
+        return self._fill(key, shape, fill, progress, dtype)
+
+    # <summary>
+    # Генерує масив нормально розподілених значень, округлених до precision.
+    # </summary>
+    # <param name="key">Ключ потоку масиву</param>
+    # <param name="loc">Математичне сподівання</param>
+    # <param name="scale">Стандартне відхилення</param>
+    # <param name="shape">Форма масиву</param>
+    # <param name="precision">Кількість знаків після коми для округлення</param>
+    # <param name="progress">Функція, що отримує частку заповнених рядків</param>
+    # <param name="dtype">Тип елементів масиву (float32 або float64)</param>
+    # <returns>Масив значень</returns>
+    def normal(
+        self,
+        key: tuple[int, ...],
+        loc: float,
+        scale: float,
+        shape: int | tuple[int, ...],
+        precision: int,
+        progress: Callable[[float], None] | None = None,
+        dtype: np.dtype = np.float64,
+    ) -> np.ndarray:
+        def fill(generator: np.random.Generator, block: np.ndarray):
+            generator.standard_normal(out=block, dtype=block.dtype)
+            block *= scale
+            block += loc
+            np.round(block, precision, out=block)
+
+        return self._fill(key, shape, fill, progress, dtype)
+
+    # <summary>
+    # Генерує стовпці start..stop-1 нескінченної за шириною матриці нормальних значень
+    # з n_rows рядків. Стовпці згруповано у фіксовану сітку блоків по REPLICATE_BLOCK:
+    # блок j завжди генерується повністю з потоку (*key, j), тож значення стовпця залежать
+    # лише від seed, ключа, n_rows і номера стовпця, а не від того, якими пакетами їх запитують.
+    # </summary>
+    # <param name="key">Ключ потоку масиву</param>
+    # <param name="loc">Математичне сподівання</param>
+    # <param name="scale">Стандартне відхилення</param>
+    # <param name="n_rows">Кількість рядків</param>
+    # <param name="start">Номер першого стовпця</param>
+    # <param name="stop">Номер після останнього стовпця</param>
+    # <param name="precision">Кількість знаків після коми для округлення</param>
+    # <returns>Масив розміру n_rows × (stop - start)</returns>
+    def normal_replicates(
+        self,
+        key: tuple[int, ...],
+        loc: float,
+        scale: float,
+        n_rows: int,
+        start: int,
+        stop: int,
+        precision: int,
+    ) -> np.ndarray:
+        first = start // self.REPLICATE_BLOCK
+        blocks = [
+            self.normal((*key, block), loc, scale, (n_rows, self.REPLICATE_BLOCK), precision)
+            for block in range(first, -(-stop // self.REPLICATE_BLOCK))
+        ]
+        offset = first * self.REPLICATE_BLOCK
+        return np.hstack(blocks)[:, start - offset:stop - offset]
+
+    # <summary>
+    # Генерує розріджену матрицю CSR, у якій кожна комірка незалежно з імовірністю density
+    # містить рівномірно розподілене значення на [low, high), округлене до precision.
+    # Блок рядків отримує власний генератор (ключ (*key, номер блоку)); у блоці спершу
+    # вибирається кількість ненульових елементів, потім різні позиції та значення,
+    # тому час і пам'ять пропорційні nnz, а не n·p.
+    # </summary>
+    # <param name="key">Ключ потоку масиву</param>
+    # <param name="low">Нижня межа</param>
+    # <param name="high">Верхня межа</param>
+    # <param name="shape">Форма матриці (n_obs, n_feats)</param>
+    # <param name="density">Частка ненульових елементів, 0 < density ≤ 1</param>
+    # <param name="precision">Кількість знаків після коми для округлення</param>
+    # <param name="progress">Функція, що отримує частку згенерованих рядків</param>
+    # <param name="dtype">Тип елементів матриці (float32 або float64)</param>
+    # <returns>Розріджена матриця scipy.sparse.csr_matrix</returns>
+    def sparse_uniform(
+        self,
+        key: tuple[int, ...],
+        low: float,
+        high: float,
+        shape: tuple[int, int],
+        density: float,
+        precision: int,
+        progress: Callable[[float], None] | None = None,
+        dtype: np.dtype = np.float64,
+    ):
+        from sparse_matrix import scipy_sparse
+
+        rows, cols = shape
+        dtype = np.dtype(dtype)
+        # Елемент CSR займає значення та індекс стовпця
+        entry_bytes = dtype.itemsize + np.dtype(np.int64).itemsize
+        step = max(1, int(self.BLOCK_BYTES // max(entry_bytes * cols * density, 1)))
+        indptr = np.zeros(rows + 1, dtype=np.int64)
+        indices, data = [], []
+        for index, start in enumerate(range(0, rows, step)):
+            block_rows = min(step, rows - start)
+            cells = block_rows * cols
+            generator = self.generator(*key, index)
+            count = generator.binomial(cells, density)
+            positions = np.empty(0, dtype=np.int64)
+            while positions.size < count:
+                positions = np.sort(
+                    np.concatenate([positions, generator.integers(0, cells, count - positions.size)])
+                )
+                # Повторні позиції відкидаються і доповнюються новими
+                positions = positions[np.concatenate([[True], positions[1:] != positions[:-1]])]
+            values = generator.random(count, dtype=dtype)
+            values *= high - low
+            values += low
+            np.round(values, precision, out=values)
+            row_counts = np.bincount(positions // cols, minlength=block_rows)
+            indptr[start + 1:start + block_rows + 1] = indptr[start] + np.cumsum(row_counts)
+            indices.append(positions % cols)
+            data.append(values)
+            if progress is not None:
+                progress((start + block_rows) / rows)
+        return scipy_sparse().csr_matrix(
+            (np.concatenate(data) if data else np.empty(0, dtype),
+             np.concatenate(indices) if indices else np.empty(0, np.int64),
+             indptr),
+            shape=shape,
+        )
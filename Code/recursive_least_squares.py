@@ -0,0 +1,104 @@
+import numpy as np
+
+from least_squares_solver import LeastSquaresSolver, centered_cross, centered_gram
+from sparse_matrix import column_means, to_dense
+
+
+class RecursiveLeastSquares:
+
+    # <summary>
+    # Рекурсивний МНК: зберігає обернену матрицю Грама P = (AᵀA)⁻¹ розширеної матриці
+    # A = [1, X - x₀] і оновлює P та B̂ для пакета з k нових рядків за формулою
+    # Вудбері за O(k·p² + k³), не звертаючись до попередніх даних. Зсув x₀ — середнє
+    # початкових даних — покращує обумовленість AᵀA при великих значеннях X.
+    # Для чисельної стійкості паралельно накопичуються AᵀA та AᵀY, з яких кожні
+    # refactor_every оновлень P і B̂ обчислюються заново за O(p³).
+    # </summary>
+    # <param name="forgetting">Коефіцієнт забування λ ∈ (0, 1]: вага старих спостережень множиться на λ з кожним пакетом</param>
+    # <param name="refactor_every">Кількість оновлень між повторними розкладами; 0 — не розкладати повторно</param>
+    def __init__(self, forgetting: float = 1.0, refactor_every: int = 100):
+        if not 0 < forgetting <= 1:
+            raise ValueError("forgetting must be in (0, 1]")
+        self.forgetting = forgetting
+        self.refactor_every = refactor_every
+        self.n_obs = 0
+        self.n_updates = 0
+        self.x_shift: np.ndarray | None = None
+        self.P: np.ndarray | None = None
+        self.gram: np.ndarray | None = None
+        self.cross: np.ndarray | None = None
+        self.coefs: np.ndarray | None = None
+        self._y_ndim = 2
+
+    # <summary>
+    # Будує початкову оцінку за повними даними: один прохід по X для центрованих
+    # XcᵀXc та XcᵀY і обернення матриці Грама.
+    # </summary>
+    # <param name="X">Матриця спостережень, щільна або розріджена</param>
+    # <param name="Y">Вектор або матриця відповідей</param>
+    # <returns>Поточний екземпляр для ланцюжкових викликів</returns>
+    def initialize(self, X: np.ndarray, Y: np.ndarray) -> "RecursiveLeastSquares":
+        n_obs, n_feats = X.shape
+        self._y_ndim = Y.ndim
+        Y = Y.reshape(n_obs, -1)
+        self.x_shift = column_means(X)
+        # Стовпці центрованої X ортогональні до стовпця одиниць, тому AᵀA блочно-діагональна
+        self.gram = np.zeros((n_feats + 1, n_feats + 1))
+        self.gram[0, 0] = n_obs
+        self.gram[1:, 1:] = centered_gram(X, self.x_shift)
+        self.cross = np.vstack([Y.sum(axis=0), centered_cross(X, self.x_shift, Y)])
+        self.n_obs = n_obs
+        self.n_updates = 0
+        self._refactor()
+        return self
+
+    # <summary>
+    # Обчислює P та B̂ заново з накопичених AᵀA та AᵀY.
+    # </summary>
+    def _refactor(self):
+        self.P = LeastSquaresSolver.solve_normal_equations(self.gram, np.eye(self.gram.shape[0]))
+        self.coefs = self.P @ self.cross
+
+    # <summary>
+    # Оновлює оцінку пакетом нових рядків (оновлення рангу k):
+    # S = λI + AₖPAₖᵀ, K = PAₖᵀS⁻¹, B̂ ← B̂ + K(Yₖ - AₖB̂), P ← (P - KAₖP)/λ.
+    # </summary>
+    # <param name="X">Нові рядки матриці спостережень розміру k × n_feats</param>
+    # <param name="Y">Нові відповіді розміру k або k × m</param>
+    # <returns>Поточний екземпляр для ланцюжкових викликів</returns>
+    def update(self, X: np.ndarray, Y: np.ndarray) -> "RecursiveLeastSquares":
+        if self.P is None:
+            return self.initialize(X, Y)
+        if X.ndim != 2 or X.shape[1] != self.x_shift.shape[0] or X.shape[0] != Y.shape[0]:
+            raise ValueError(f"Expected k × {self.x_shift.shape[0]} rows and k responses")
+        Y = Y.reshape(X.shape[0], -1)
+        # Пакет нових рядків невеликий, тому розріджений пакет ущільнюється
+        A = np.hstack([np.ones((X.shape[0], 1)), to_dense(X) - self.x_shift])
+
+        PAt = self.P @ A.T
+        S = A @ PAt
+        S[np.diag_indices_from(S)] += self.forgetting
+        K = np.linalg.solve(S, PAt.T).T
+        self.coefs = self.coefs + K @ (Y - A @ self.coefs)
+        self.P = (self.P - K @ PAt.T) / self.forgetting
+        self.P = (self.P + self.P.T) / 2
+
+        self.gram = self.forgetting * self.gram + A.T @ A
+        self.cross = self.forgetting * self.cross + A.T @ Y
+        self.n_obs += X.shape[0]
+        self.n_updates += 1
+        if self.refactor_every and self.n_updates % self.refactor_every == 0:
+            self._refactor()
+        return self
+
+    # <summary>
+    # Поточна оцінка коефіцієнтів у вихідних координатах X: b₀ = b₀' - x₀·b.
+    # </summary>
+    # <returns>Коефіцієнти [b₀, b₁, ..., bₚ] тієї ж вимірності, що й Y</returns>
+    @property
+    def B_hat(self) -> np.ndarray:
+        if self.coefs is None:
+            raise ValueError("The model has not been initialized")
+        B_hat = self.coefs.copy()
+        B_hat[0] -= self.x_shift @ self.coefs[1:]
+        return B_hat if self._y_ndim == 2 else B_hat[:, 0]
@@ -0,0 +1,84 @@
+import numpy as np
+
+from least_squares_solver import block_rows
+
+
+class RegressionMetrics:
+
+    # <summary>
+    # Обчислює метрики якості оцінки коефіцієнтів для кожного стовпця оцінок:
+    # MSE, RMSE, MAE та MAPE. MAPE рахується лише за ненульовими істинними
+    # коефіцієнтами; якщо всі вони нульові, MAPE дорівнює NaN.
+    # </summary>
+    # <param name="B_true">Істинний вектор коефіцієнтів розміру n_feats × 1</param>
+    # <param name="B_preds">Оцінки коефіцієнтів розміру n_feats × R</param>
+    # <returns>Словник метрик, кожна з яких є масивом довжини R</returns>
+    @staticmethod
+    def coefficient_metrics(B_true: np.ndarray, B_preds: np.ndarray) -> dict:
+        B_true = B_true.reshape(-1, 1)
+        errors = B_preds - B_true
+        mse = np.mean(errors ** 2, axis=0)
+        nonzero = B_true[:, 0] != 0
+        if nonzero.any():
+            mape = np.mean(np.abs(errors[nonzero] / B_true[nonzero]), axis=0) * 100
+        else:
+            mape = np.full(errors.shape[1], np.nan)
+        return {
+            "mse": mse,
+            "rmse": np.sqrt(mse),
+            "mae": np.mean(np.abs(errors), axis=0),
+            "mape": mape,
+        }
+
+    # <summary>
+    # Обчислює метрики у просторі прогнозів за один поблоковий прохід по X та y:
+    # R², скоригований R², дисперсію залишків, стандартні похибки B̂ і t-статистики.
+    # (XcᵀXc)⁻¹ передається готовою з розкладу X, тож обернення не повторюється;
+    # без неї (ітераційні методи) стандартні похибки і t-статистики дорівнюють NaN.
+    # </summary>
+    # <param name="X">Матриця спостережень</param>
+    # <param name="Y">Відповіді розміру n_obs або n_obs × k</param>
+    # <param name="B_hat">Оцінки [b₀, b₁, ..., bₚ] розміру n_feats + 1 або (n_feats + 1) × k</param>
+    # <param name="gram_inverse">Обернена центрована матриця Грама n_feats × n_feats або None</param>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <returns>Словник: r2, adj_r2, residual_variance — масиви довжини k; se, t_stats — форми B_hat</returns>
+    @staticmethod
+    def prediction_metrics(
+        X: np.ndarray, Y: np.ndarray, B_hat: np.ndarray, gram_inverse: np.ndarray | None, x_mean: np.ndarray
+    ) -> dict:
+        n_obs, n_feats = X.shape
+        Y_2d = Y.reshape(n_obs, -1)
+        B_2d = B_hat.reshape(n_feats + 1, -1)
+        y_mean = Y_2d.mean(axis=0)
+
+        sse = np.zeros(Y_2d.shape[1])
+        sst = np.zeros(Y_2d.shape[1])
+        step = block_rows(X)
+        for start in range(0, n_obs, step):
+            Y_block = Y_2d[start:start + step]
+            residuals = Y_block - B_2d[0] - X[start:start + step] @ B_2d[1:]
+            deviations = Y_block - y_mean
+            sse += np.einsum("ij,ij->j", residuals, residuals)
+            sst += np.einsum("ij,ij->j", deviations, deviations)
+
+        df = n_obs - n_feats - 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = 1 - sse / sst
+            adj_r2 = 1 - (1 - r2) * (n_obs - 1) / df if df > 0 else np.full_like(sse, np.nan)
+            residual_variance = sse / df if df > 0 else np.full_like(sse, np.nan)
+            # Var(b₀) = σ²(1/n + x̄ᵀ(XcᵀXc)⁻¹x̄), Var(bⱼ) = σ²[(XcᵀXc)⁻¹]ⱼⱼ
+            if gram_inverse is None:
+                variance_factors = np.full(n_feats + 1, np.nan)
+            else:
+                variance_factors = np.concatenate(
+                    [[1 / n_obs + x_mean @ gram_inverse @ x_mean], np.diag(gram_inverse)]
+                )
+            se = np.sqrt(np.outer(variance_factors, residual_variance))
+            t_stats = B_2d / se
+        return {
+            "r2": r2,
+            "adj_r2": adj_r2,
+            "residual_variance": residual_variance,
+            "se": se.reshape(B_hat.shape),
+            "t_stats": t_stats.reshape(B_hat.shape),
+        }
@@ -0,0 +1,150 @@
+import numpy as np
+
+from least_squares_solver import SVDFactorization
+
+
+class RidgePath:
+    # Кількість значень λ у сітці за замовчуванням
+    DEFAULT_GRID_SIZE = 50
+    # Межі сітки за замовчуванням відносно середнього квадрата сингулярних значень Xc
+    DEFAULT_GRID_RANGE = (1e-6, 1e2)
+
+    # <summary>
+    # Шлях гребеневої регресії за одним SVD-розкладом центрованої матриці Xc = U·diag(s)·Vᵀ.
+    # Для будь-якого λ оцінка b(λ) = V·diag(s / (s² + λ))·UᵀY, тож після одного
+    # проєктування z = Uᵀ(Y - ȳ) за O(n·p) кожне λ коштує O(p) для GCV і O(p²) для коефіцієнтів.
+    # Використовуються лише компоненти з s вище порогу розкладу, тож при n ≤ p (ранг Xc ≤ n - 1)
+    # RSS, GCV і df рахуються в просторі стовпців Xc. Вільний член не штрафується і
+    # відновлюється як b₀ = ȳ - x̄·b.
+    # </summary>
+    # <param name="factorization">SVD-розклад центрованої X (зазвичай з кешу розкладів)</param>
+    # <param name="X">Матриця спостережень, для якої побудовано розклад</param>
+    # <param name="Y">Вектор або матриця відповідей</param>
+    def __init__(self, factorization: SVDFactorization, X: np.ndarray, Y: np.ndarray):
+        n_obs = X.shape[0]
+        Y_2d = Y.reshape(n_obs, -1)
+        self.factorization = factorization
+        self.n_obs = n_obs
+        self._y_ndim = Y.ndim
+        self.y_mean = Y_2d.mean(axis=0)
+        # Лише компоненти з ненульовими s: при n ≤ p ранг Xc не перевищує n - 1, і стовпець U
+        # при s ≈ 0 може бути напрямком одиниць, тож його проєкція не належить простору Xc
+        retained = factorization.s_inv > 0
+        self.s = factorization.s[retained]
+        self.Vt = factorization.Vt[retained]
+        self.s2 = self.s ** 2
+        deviations = Y_2d - self.y_mean
+        self.z = factorization.project(X, deviations)[retained]
+        self.total_sum_of_squares = np.einsum("ij,ij->j", deviations, deviations)
+        # Частина RSS поза простором стовпців Xc не залежить від λ
+        self._outside_sum_of_squares = np.maximum(
+            self.total_sum_of_squares - np.einsum("ij,ij->j", self.z, self.z), 0.0
+        )
+
+    # <summary>
+    # Будує логарифмічну сітку λ відносно масштабу сингулярних значень Xc.
+    # </summary>
+    # <param name="count">Кількість значень λ</param>
+    # <returns>Зростаючий масив λ</returns>
+    def default_lambdas(self, count: int = DEFAULT_GRID_SIZE) -> np.ndarray:
+        scale = float(self.s2.mean()) if self.s2.size and self.s2.mean() > 0 else 1.0
+        low, high = self.DEFAULT_GRID_RANGE
+        return np.logspace(np.log10(low), np.log10(high), count) * scale
+
+    # <summary>
+    # Ефективна кількість параметрів при ознаках df(λ) = Σ s² / (s² + λ).
+    # </summary>
+    # <param name="lambdas">Значення λ</param>
+    # <returns>Масив df довжини len(lambdas)</returns>
+    def degrees_of_freedom(self, lambdas: np.ndarray) -> np.ndarray:
+        lambdas = np.asarray(lambdas, dtype=np.float64).reshape(-1, 1)
+        return np.sum(self.s2 / (self.s2 + lambdas), axis=1)
+
+    # <summary>
+    # Сума квадратів залишків для кожного λ: RSS(λ) = RSS⊥ + Σ (λ / (s² + λ))²·z².
+    # </summary>
+    # <param name="lambdas">Значення λ</param>
+    # <returns>Масив розміру len(lambdas) × k</returns>
+    def residual_sum_of_squares(self, lambdas: np.ndarray) -> np.ndarray:
+        lambdas = np.asarray(lambdas, dtype=np.float64).reshape(-1, 1)
+        shrinkage = (lambdas / (self.s2 + lambdas)) ** 2
+        return self._outside_sum_of_squares + shrinkage @ self.z ** 2
+
+    # <summary>
+    # Узагальнена перехресна перевірка без повторних оцінок:
+    # GCV(λ) = n·RSS(λ) / (n - 1 - df(λ))², де 1 враховує вільний член.
+    # </summary>
+    # <param name="lambdas">Значення λ</param>
+    # <returns>Масив розміру len(lambdas) × k; inf, якщо знаменник недодатний</returns>
+    def gcv(self, lambdas: np.ndarray) -> np.ndarray:
+        residual_df = (self.n_obs - 1 - self.degrees_of_freedom(lambdas)).reshape(-1, 1)
+        rss = self.residual_sum_of_squares(lambdas)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(residual_df > 0, self.n_obs * rss / residual_df ** 2, np.inf)
+
+    # <summary>
+    # Обчислює коефіцієнти разом із вільним членом для одного λ за O(p²).
+    # </summary>
+    # <param name="lam">Параметр регуляризації λ ≥ 0</param>
+    # <returns>Коефіцієнти [b₀, b₁, ..., bₚ] тієї ж вимірності, що й Y</returns>
+    def coefficients(self, lam: float) -> np.ndarray:
+        filters = np.divide(
+            self.s, self.s2 + lam,
+            out=np.zeros_like(self.s2), where=self.s2 + lam > 0,
+        )
+        coefs = self.Vt.T @ (filters[:, None] * self.z)
+        B_hat = np.vstack([self.y_mean - self.factorization.x_mean @ coefs, coefs])
+        return B_hat if self._y_ndim == 2 else B_hat[:, 0]
+
+    # <summary>
+    # Обчислює коефіцієнти для всієї сітки λ.
+    # </summary>
+    # <param name="lambdas">Значення λ</param>
+    # <returns>Масив розміру len(lambdas) × (n_feats + 1) або len(lambdas) × (n_feats + 1) × k</returns>
+    def path(self, lambdas: np.ndarray) -> np.ndarray:
+        return np.stack([self.coefficients(lam) for lam in np.asarray(lambdas, dtype=np.float64)])
+
+    # <summary>
+    # Обирає λ з мінімальним GCV. Для кількох стовпців Y обирається спільне λ
+    # з мінімальною сумою GCV по стовпцях.
+    # </summary>
+    # <param name="lambdas">Значення λ</param>
+    # <returns>Обране λ та масив GCV розміру len(lambdas) × k</returns>
+    def select(self, lambdas: np.ndarray) -> tuple[float, np.ndarray]:
+        gcv = self.gcv(lambdas)
+        return float(np.asarray(lambdas)[np.argmin(gcv.sum(axis=1))]), gcv
+
+    # <summary>
+    # Обчислює діагностику гребеневої оцінки для λ: R², скоригований R² і дисперсію
+    # залишків з ефективною кількістю параметрів df(λ), стандартні похибки з
+    # Cov(b) = σ̂²·V·diag(s² / (s² + λ)²)·Vᵀ та t-статистики.
+    # </summary>
+    # <param name="lam">Параметр регуляризації λ</param>
+    # <param name="B_hat">Коефіцієнти для цього λ</param>
+    # <returns>Словник: r2, adj_r2, residual_variance, df — масиви довжини k; se, t_stats — форми B_hat</returns>
+    def diagnostics(self, lam: float, B_hat: np.ndarray) -> dict:
+        n_obs = self.n_obs
+        df = float(self.degrees_of_freedom([lam])[0])
+        rss = self.residual_sum_of_squares([lam])[0]
+        residual_df = n_obs - 1 - df
+        B_2d = B_hat.reshape(B_hat.shape[0], -1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r2 = 1 - rss / self.total_sum_of_squares
+            adj_r2 = 1 - (1 - r2) * (n_obs - 1) / residual_df if residual_df > 0 else np.full_like(rss, np.nan)
+            residual_variance = rss / residual_df if residual_df > 0 else np.full_like(rss, np.nan)
+            V_scaled = self.Vt.T * (self.s / (self.s2 + lam))
+            covariance = V_scaled @ V_scaled.T
+            x_mean = self.factorization.x_mean
+            variance_factors = np.concatenate(
+                [[1 / n_obs + x_mean @ covariance @ x_mean], np.diag(covariance)]
+            )
+            se = np.sqrt(np.outer(variance_factors, residual_variance))
+            t_stats = B_2d / se
+        return {
+            "r2": r2,
+            "adj_r2": adj_r2,
+            "residual_variance": residual_variance,
+            "df": np.full_like(rss, df),
+            "se": se.reshape(B_hat.shape),
+            "t_stats": t_stats.reshape(B_hat.shape),
+        }
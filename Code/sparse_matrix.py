@@ -0,0 +1,63 @@
+import functools
+import sys
+
+import numpy as np
+
+
+# <summary>
+# Імпортує scipy.sparse під час першого звернення до розріджених матриць, а не під час
+# імпорту модуля, щоб scipy не сповільнювала запуск додатку.
+# </summary>
+# <returns>Модуль scipy.sparse</returns>
+@functools.cache
+def scipy_sparse():
+    try:
+        import scipy.sparse
+    except ImportError:  # scipy є необов'язковою залежністю
+        raise ImportError("Sparse matrices require scipy") from None
+    return scipy.sparse
+
+
+# <summary>
+# Перевіряє, чи є матриця розрідженою матрицею scipy. Якщо scipy.sparse ще не
+# імпортовано, розрідженої матриці існувати не може, тому scipy не імпортується.
+# </summary>
+# <param name="X">Матриця</param>
+# <returns>True для розрідженої матриці</returns>
+def is_sparse(X) -> bool:
+    sparse = sys.modules.get("scipy.sparse")
+    return sparse is not None and sparse.issparse(X)
+
+
+# <summary>
+# Обчислює середні значення стовпців у float64 для щільної або розрідженої X
+# (для розрідженої — за O(nnz) без ущільнення). Суму розрідженої X дає добуток Xᵀ·1:
+# sum(dtype=float64) у scipy накопичує в типі X і лише потім перетворює результат.
+# </summary>
+# <param name="X">Матриця спостережень</param>
+# <returns>Вектор середніх довжини n_feats</returns>
+def column_means(X) -> np.ndarray:
+    if is_sparse(X):
+        return np.asarray(X.T @ np.ones(X.shape[0])).ravel() / X.shape[0]
+    return X.mean(axis=0, dtype=np.float64)
+
+
+# <summary>
+# Повертає щільну копію розрідженої матриці або саму щільну матрицю.
+# </summary>
+# <param name="X">Матриця</param>
+# <returns>Щільний масив</returns>
+def to_dense(X) -> np.ndarray:
+    return X.toarray() if is_sparse(X) else X
+
+
+# <summary>
+# Частка ненульових елементів матриці.
+# </summary>
+# <param name="X">Матриця</param>
+# <returns>Щільність від 0 до 1</returns>
+def density(X) -> float:
+    cells = X.shape[0] * X.shape[1]
+    if not cells:
+        return 0.0
+    return (X.nnz if is_sparse(X) else np.count_nonzero(X)) / cells
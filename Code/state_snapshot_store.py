@@ -0,0 +1,133 @@
+import contextlib
+import dataclasses
+import os
+import shutil
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app_state import AppState
+from dataset_store import DatasetStore
+from instrumentation import Instrumentation
+
+
+class StateSnapshotStore:
+
+    # <summary>
+    # Інкрементне сховище знімків стану у форматі DatasetStore. Перезаписуються лише
+    # ті масиви, які змінилися від попереднього збереження, кожен файл пишеться атомарно.
+    # Відомості про збережені поля змінюються і потоком виклику save, і фоновим потоком
+    # запису (після помилки), тому захищені блокуванням.
+    # </summary>
+    # <param name="directory">Директорія знімка</param>
+    # <param name="background">Чи виконувати запис у фоновому потоці</param>
+    # <param name="instrumentation">Якщо задано, кожен запис вимірюється як етап save_state</param>
+    # <param name="on_error">Викликається з винятком кожного невдалого фонового запису (у фоновому потоці)</param>
+    def __init__(
+        self,
+        directory: str = "regression_state",
+        background: bool = False,
+        instrumentation: Instrumentation | None = None,
+        on_error: Callable[[BaseException], None] | None = None,
+    ):
+        self.directory = directory
+        self.instrumentation = instrumentation
+        self.on_error = on_error
+        self._saved_arrays: dict[str, weakref.ref] = {}
+        self._saved_metadata: dict | None = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1) if background else None
+        self._pending: Future | None = None
+
+    # <summary>
+    # Визначає, які масиви стану змінилися з моменту останнього збереження.
+    # Масиви в стані замінюються, а не змінюються на місці, тому порівнюється ідентичність об'єкта.
+    # </summary>
+    # <param name="state">Стан додатку</param>
+    # <returns>Словник змінених масивів</returns>
+    def _changed_arrays(self, state: AppState) -> dict:
+        changed = {}
+        for name in DatasetStore.ARRAY_FIELDS:
+            array = getattr(state, name)
+            saved = self._saved_arrays.get(name)
+            if saved is None or saved() is not array:
+                changed[name] = array
+        return changed
+
+    # <summary>
+    # Записує змінені масиви та скалярні поля стану.
+    # </summary>
+    # <param name="arrays">Змінені масиви</param>
+    # <param name="state">Копія скалярної частини стану або None, якщо вона не змінилася</param>
+    def _write(self, arrays: dict, state: AppState | None) -> None:
+        measure = (
+            self.instrumentation.measure("save_state")
+            if self.instrumentation is not None
+            else contextlib.nullcontext()
+        )
+        try:
+            with measure:
+                os.makedirs(self.directory, exist_ok=True)
+                for name, array in arrays.items():
+                    DatasetStore.save_array(self.directory, name, array)
+                if state is not None:
+                    DatasetStore.save_metadata(self.directory, state)
+        except BaseException:
+            # Після невдалого запису наступне збереження перезапише всі поля
+            with self._lock:
+                self._saved_arrays.clear()
+                self._saved_metadata = None
+            raise
+
+    # <summary>
+    # Передає помилку завершеного фонового запису в on_error, щоб жодна невдача
+    # не залишилася непоміченою, навіть якщо flush не викликається.
+    # </summary>
+    # <param name="future">Завершений запис</param>
+    def _report(self, future: Future) -> None:
+        if self.on_error is not None and not future.cancelled() and (error := future.exception()) is not None:
+            self.on_error(error)
+
+    # <summary>
+    # Зберігає знімок стану, записуючи лише змінені поля. У фоновому режимі
+    # повертається одразу, а запис виконується в окремому потоці у порядку викликів.
+    # </summary>
+    # <param name="state">Стан додатку</param>
+    def save(self, state: AppState) -> None:
+        metadata = {
+            field.name: getattr(state, field.name)
+            for field in dataclasses.fields(state)
+            if field.name not in DatasetStore.ARRAY_FIELDS
+        }
+        with self._lock:
+            arrays = self._changed_arrays(state)
+            scalars = dataclasses.replace(state) if metadata != self._saved_metadata else None
+            if not arrays and scalars is None:
+                return
+            for name, array in arrays.items():
+                self._saved_arrays[name] = weakref.ref(array)
+            self._saved_metadata = metadata
+
+        if self._executor is None:
+            self._write(arrays, scalars)
+        else:
+            self._pending = self._executor.submit(self._write, arrays, scalars)
+            self._pending.add_done_callback(self._report)
+
+    # <summary>
+    # Очікує завершення фонового запису та повертає його помилку, якщо вона виникла.
+    # </summary>
+    def flush(self) -> None:
+        if self._pending is not None:
+            self._pending.result()
+
+    # <summary>
+    # Видаляє директорію знімка і забуває збережені поля.
+    # </summary>
+    def clear(self) -> None:
+        self.flush()
+        shutil.rmtree(self.directory, ignore_errors=True)
+        with self._lock:
+            self._saved_arrays.clear()
+            self._saved_metadata = None
@@ -0,0 +1,243 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+from least_squares_solver import LeastSquaresSolver, centered_cross, centered_gram
+from sparse_matrix import column_means, is_sparse
+
+
+class RegressionMoments:
+    # Обсяг блоку зважених рядків: блок вміщується в кеш, поки з нього обчислюється ZᵀZ
+    WEIGHTED_BLOCK_BYTES = 2**20
+
+    # <summary>
+    # Достатні статистики МНК для частини даних: кількість рядків, середні X та Y,
+    # центровані добутки XcᵀXc, XcᵀYc та суми квадратів Yc.
+    # Зберігаються центрованими, щоб уникнути втрати точності при великих значеннях X.
+    # </summary>
+    # <param name="n_obs">Кількість спостережень</param>
+    # <param name="x_mean">Середні значення стовпців X</param>
+    # <param name="y_mean">Середні значення стовпців Y</param>
+    # <param name="sxx">Центрована матриця Грама</param>
+    # <param name="sxy">Центрований добуток XᵀY</param>
+    # <param name="syy">Центровані суми квадратів стовпців Y</param>
+    def __init__(
+        self,
+        n_obs: int,
+        x_mean: np.ndarray,
+        y_mean: np.ndarray,
+        sxx: np.ndarray,
+        sxy: np.ndarray,
+        syy: np.ndarray,
+    ):
+        self.n_obs = n_obs
+        self.x_mean = x_mean
+        self.y_mean = y_mean
+        self.sxx = sxx
+        self.sxy = sxy
+        self.syy = syy
+
+    # <summary>
+    # Обчислює статистики для одного блоку рядків.
+    # </summary>
+    # <param name="X">Блок матриці спостережень, щільний або розріджений</param>
+    # <param name="Y">Блок відповідей розміру n × k</param>
+    # <returns>Статистики блоку</returns>
+    @classmethod
+    def from_block(cls, X: np.ndarray, Y: np.ndarray) -> "RegressionMoments":
+        x_mean = column_means(X)
+        y_mean = Y.mean(axis=0, dtype=np.float64)
+        return cls(
+            X.shape[0],
+            x_mean,
+            y_mean,
+            centered_gram(X, x_mean),
+            centered_cross(X, x_mean, Y),
+            ((Y - y_mean) ** 2).sum(axis=0),
+        )
+
+    # <summary>
+    # Обчислює статистики даних, де i-й рядок повторено weights[i] разів (наприклад,
+    # бутстреп-вибірка з мультиноміальними вагами), не копіюючи повторені рядки: рядки
+    # з нульовою вагою пропускаються, решта множаться на √w, і XᵀWX = ZᵀZ обчислюється
+    # симетричним добутком блоками, що вміщуються в кеш. Центрування виконується після
+    # накопичення (XᵀWX - n·x̄x̄ᵀ), тож для точності X слід центрувати заздалегідь —
+    # тоді поправка мала.
+    # </summary>
+    # <param name="X">Матриця спостережень, щільна або розріджена</param>
+    # <param name="Y">Відповіді розміру n × k</param>
+    # <param name="weights">Невід'ємні ваги (кількості повторень) рядків</param>
+    # <returns>Статистики зваженої вибірки; n_obs — сума ваг</returns>
+    @classmethod
+    def from_weighted_block(cls, X: np.ndarray, Y: np.ndarray, weights: np.ndarray) -> "RegressionMoments":
+        rows = np.flatnonzero(weights)
+        # Розріджена X зважується цілком за O(nnz), щільна — блоками рядків
+        step = max(1, rows.size if is_sparse(X) else cls.WEIGHTED_BLOCK_BYTES // (X.shape[1] * 8))
+        n_feats, n_targets = X.shape[1], Y.shape[1]
+        gram, cross = np.zeros((n_feats, n_feats)), np.zeros((n_feats, n_targets))
+        x_sum, y_sum, y_squares = np.zeros(n_feats), np.zeros(n_targets), np.zeros(n_targets)
+        for start in range(0, rows.size, step):
+            block = rows[start:start + step]
+            scale = np.sqrt(weights[block], dtype=np.float64)
+            if is_sparse(X):
+                Z = X[block].astype(np.float64).multiply(scale[:, None]).tocsr()
+                gram += (Z.T @ Z).toarray()
+            else:
+                Z = np.asarray(X[block], dtype=np.float64)
+                Z *= scale[:, None]
+                gram += Z.T @ Z
+            Y_scaled = Y[block] * scale[:, None]
+            cross += np.asarray(Z.T @ Y_scaled)
+            x_sum += np.asarray(Z.T @ scale).ravel()
+            y_sum += scale @ Y_scaled
+            y_squares += np.einsum("ij,ij->j", Y_scaled, Y_scaled)
+        n_obs = weights.sum()
+        x_mean, y_mean = x_sum / n_obs, y_sum / n_obs
+        return cls(
+            int(n_obs),
+            x_mean,
+            y_mean,
+            gram - n_obs * np.outer(x_mean, x_mean),
+            cross - n_obs * np.outer(x_mean, y_mean),
+            np.maximum(y_squares - n_obs * y_mean ** 2, 0.0),
+        )
+
+    # <summary>
+    # Об'єднує статистики двох непересічних частин даних (формула Чана).
+    # </summary>
+    # <param name="other">Статистики іншої частини</param>
+    # <returns>Статистики об'єднання</returns>
+    def merge(self, other: "RegressionMoments") -> "RegressionMoments":
+        if self.n_obs == 0:
+            return other
+        if other.n_obs == 0:
+            return self
+        n_obs = self.n_obs + other.n_obs
+        dx = other.x_mean - self.x_mean
+        dy = other.y_mean - self.y_mean
+        weight = self.n_obs * other.n_obs / n_obs
+        return RegressionMoments(
+            n_obs,
+            self.x_mean + dx * (other.n_obs / n_obs),
+            self.y_mean + dy * (other.n_obs / n_obs),
+            self.sxx + other.sxx + weight * np.outer(dx, dx),
+            self.sxy + other.sxy + weight * np.outer(dx, dy),
+            self.syy + other.syy + weight * dy ** 2,
+        )
+
+    # <summary>
+    # Віднімає статистики частини даних, що входить до поточних (обернена до merge):
+    # для T = A ∪ B статистики B дорівнюють T - A - n_A·n_B/n_T·(x̄_B - x̄_A)(x̄_B - x̄_A)ᵀ.
+    # Коштує O(p²) замість повторного проходу по рядках, що залишилися.
+    # </summary>
+    # <param name="other">Статистики частини, яку потрібно вилучити</param>
+    # <returns>Статистики решти даних</returns>
+    def remove(self, other: "RegressionMoments") -> "RegressionMoments":
+        n_obs = self.n_obs - other.n_obs
+        if n_obs <= 0:
+            raise ValueError("Cannot remove all observations")
+        x_mean = (self.n_obs * self.x_mean - other.n_obs * other.x_mean) / n_obs
+        y_mean = (self.n_obs * self.y_mean - other.n_obs * other.y_mean) / n_obs
+        dx = x_mean - other.x_mean
+        dy = y_mean - other.y_mean
+        weight = other.n_obs * n_obs / self.n_obs
+        return RegressionMoments(
+            n_obs,
+            x_mean,
+            y_mean,
+            self.sxx - other.sxx - weight * np.outer(dx, dx),
+            self.sxy - other.sxy - weight * np.outer(dx, dy),
+            self.syy - other.syy - weight * dy ** 2,
+        )
+
+    # <summary>
+    # Обчислює суму квадратів залишків довільних коефіцієнтів на даних цих статистик
+    # без проходу по рядках: SSE = syy - 2bᵀsxy + bᵀsxx·b + n·(ȳ - b₀ - x̄ᵀb)².
+    # </summary>
+    # <param name="B_hat">Коефіцієнти [b₀, b₁, ..., bₚ] розміру (n_feats + 1) × k</param>
+    # <returns>Масив SSE довжини k</returns>
+    def sum_of_squared_errors(self, B_hat: np.ndarray) -> np.ndarray:
+        coefs = B_hat[1:]
+        offset = self.y_mean - B_hat[0] - self.x_mean @ coefs
+        sse = (
+            self.syy
+            - 2 * np.einsum("ij,ij->j", coefs, self.sxy)
+            + np.einsum("ij,ij->j", coefs, self.sxx @ coefs)
+            + self.n_obs * offset ** 2
+        )
+        return np.maximum(sse, 0.0)
+
+    # <summary>
+    # Оцінює коефіцієнти за накопиченими статистиками.
+    # </summary>
+    # <returns>Коефіцієнти [b₀, b₁, ..., bₚ] розміру (n_feats + 1) × k</returns>
+    def solve(self) -> np.ndarray:
+        coefs = LeastSquaresSolver.solve_normal_equations(self.sxx, self.sxy)
+        intercept = self.y_mean - self.x_mean @ coefs
+        return np.vstack([intercept, coefs])
+
+
+class StreamingLinearRegression:
+
+    # <summary>
+    # Інкрементна оцінка МНК: накопичує центровані XᵀX та XᵀY по блоках рядків,
+    # тому пам'ять обмежена розміром блоку × n_feats, а не всім датасетом.
+    # </summary>
+    def __init__(self):
+        self.moments: RegressionMoments | None = None
+        self._y_ndim = 2
+
+    # <summary>
+    # Кількість уже поданих спостережень.
+    # </summary>
+    @property
+    def n_obs(self) -> int:
+        return self.moments.n_obs if self.moments is not None else 0
+
+    # <summary>
+    # Додає блок рядків до накопичених статистик.
+    # </summary>
+    # <param name="X">Блок матриці спостережень розміру n × n_feats</param>
+    # <param name="Y">Блок відповідей розміру n або n × k</param>
+    # <returns>Поточний екземпляр для ланцюжкових викликів</returns>
+    def partial_fit(self, X: np.ndarray, Y: np.ndarray) -> "StreamingLinearRegression":
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        if X.ndim != 2 or X.shape[0] != Y.shape[0]:
+            raise ValueError("X must be 2-D and have as many rows as Y")
+        if X.shape[0] == 0:
+            return self
+        if self.moments is None:
+            self._y_ndim = Y.ndim
+        elif X.shape[1] != self.moments.x_mean.shape[0]:
+            raise ValueError(
+                f"Expected {self.moments.x_mean.shape[0]} features, got {X.shape[1]}"
+            )
+        block = RegressionMoments.from_block(X, Y.reshape(Y.shape[0], -1))
+        self.moments = block if self.moments is None else self.moments.merge(block)
+        return self
+
+    # <summary>
+    # Подає у модель блоки, прочитані з файлу, в яких один зі стовпців є відповіддю.
+    # </summary>
+    # <param name="chunks">Ітератор блоків рядків (наприклад, InputVectors.iter_file_chunks)</param>
+    # <param name="target_column">Індекс стовпця відповіді в блоці</param>
+    # <returns>Поточний екземпляр для ланцюжкових викликів</returns>
+    def fit_chunks(
+        self, chunks: Iterable[np.ndarray], target_column: int = -1
+    ) -> "StreamingLinearRegression":
+        for chunk in chunks:
+            Y = chunk[:, target_column]
+            X = np.delete(chunk, target_column, axis=1)
+            self.partial_fit(X, Y)
+        return self
+
+    # <summary>
+    # Повертає оцінку коефіцієнтів за всіма поданими на цей момент рядками.
+    # </summary>
+    # <returns>Коефіцієнти [b₀, b₁, ..., bₚ] тієї ж вимірності, що й подані Y</returns>
+    def B_hat(self) -> np.ndarray:
+        if self.moments is None:
+            raise ValueError("No observations have been fed yet")
+        B_hat = self.moments.solve()
+        return B_hat if self._y_ndim == 2 else B_hat[:, 0]
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from cross_validation import CrossValidation
+from least_squares_solver import LeastSquaresSolver
+from random_streams import RandomStreams
+
+
+def _lstsq_sse(X_train, y_train, X_test, y_test) -> float:
+    B_hat = np.linalg.lstsq(np.column_stack([np.ones(len(y_train)), X_train]), y_train, rcond=None)[0]
+    residuals = y_test - B_hat[0] - X_test @ B_hat[1:]
+    return float(residuals @ residuals)
+
+
+# <summary>
+# K-кратна перевірка з відніманням статистик дає ті самі помилки, що й повторна оцінка
+# на кожній навчальній частині, для суцільних і перемішаних частин.
+# </summary>
+@pytest.mark.parametrize("streams", [None, RandomStreams(4)])
+def test_k_fold_matches_refitting(streams):
+    rng = np.random.default_rng(9)
+    X = rng.uniform(0, 10, (103, 4))
+    y = X @ rng.normal(size=4) + rng.normal(size=103)
+    result = CrossValidation.k_fold(X, y, 5, streams, n_workers=2)
+
+    for part, fold in zip(CrossValidation.split(103, 5, streams), result["folds"]):
+        train = np.setdiff1d(np.arange(103), np.arange(103)[part])
+        expected = _lstsq_sse(X[train], y[train], X[part], y[part])
+        np.testing.assert_allclose(fold["sse"][0], expected, rtol=1e-8)
+        assert fold["n_test"] == len(y[part])
+
+
+# <summary>
+# Перевірка з виключенням по одному через діагональ матриці впливу збігається з n оцінками.
+# </summary>
+@pytest.mark.parametrize("solver", ["cholesky", "qr", "svd"])
+def test_leave_one_out_matches_refitting(solver):
+    rng = np.random.default_rng(10)
+    X = rng.uniform(0, 10, (40, 3))
+    y = X @ rng.normal(size=3) + rng.normal(size=40)
+    result = CrossValidation.leave_one_out(X, y, LeastSquaresSolver.factorize(X, solver))
+
+    mask = np.ones(40, dtype=bool)
+    press = 0.0
+    for row in range(40):
+        mask[row] = False
+        press += _lstsq_sse(X[mask], y[mask], X[row:row + 1], y[row:row + 1])
+        mask[row] = True
+    np.testing.assert_allclose(result["press"][0], press, rtol=1e-8)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from least_squares_solver import FactorizationCache
+from linear_regression_model import LinearRegressionModel
+
+
+# <summary>
+# Розріджена float32 X має давати ті самі оцінки, що й щільна float32 X з тими самими
+# значеннями: матриця Грама накопичується у float64 незалежно від типу X.
+# </summary>
+@pytest.mark.parametrize("solver", ["auto", "cholesky", "svd", "parallel"])
+def test_sparse_float32_matches_dense_float32(solver):
+    sparse = pytest.importorskip("scipy.sparse")
+    rng = np.random.default_rng(15)
+    X_sparse = sparse.random(
+        20000, 30, density=0.3, format="csr", dtype=np.float32, random_state=rng,
+        data_rvs=lambda size: rng.uniform(0, 100, size),
+    )
+    X_dense = X_sparse.toarray()
+    B = rng.uniform(-5, 5, 30)
+    Y = X_dense.astype(np.float64) @ B + 50
+
+    B_sparse, _ = LinearRegressionModel.calculate_B_hat(X_sparse, Y, solver)
+    B_dense, _ = LinearRegressionModel.calculate_B_hat(X_dense, Y, solver)
+    np.testing.assert_allclose(B_sparse, B_dense, rtol=1e-8, atol=1e-8)
+    np.testing.assert_allclose(B_sparse, np.concatenate([[50], B]), rtol=1e-8, atol=1e-8)
+
+
+# <summary>
+# Кеш зберігає лише розклади зі станом O(p²) і повертає новий розклад після зміни X на місці.
+# </summary>
+@pytest.mark.parametrize("solver", ["auto", "qr", "cholesky", "svd"])
+def test_factorization_cache_holds_compact_state(solver):
+    X = np.random.default_rng(12).uniform(0, 100, (5000, 20))
+    cache = FactorizationCache()
+    factorization = cache.get_or_factorize(X, solver)
+    factorization.gram_inverse()
+    assert factorization.nbytes <= 4 * 20 * 20 * 8
+    assert cache.get_or_factorize(X, solver) is factorization
+
+    X[0, 0] += 1
+    assert cache.get_or_factorize(X, solver) is not factorization
+
+
+# <summary>
+# Усі методи дають розв'язок МНК np.linalg.lstsq для щільної, float32 та розрідженої X.
+# </summary>
+@pytest.mark.parametrize("solver", ["auto", "qr", "cholesky", "svd", "parallel", "lsqr"])
+@pytest.mark.parametrize("kind", ["dense", "float32", "sparse"])
+def test_solvers_match_lstsq(solver, kind):
+    rng = np.random.default_rng(1)
+    X = rng.uniform(0, 10, (2000, 12))
+    if kind == "sparse":
+        sparse = pytest.importorskip("scipy.sparse")
+        X[rng.random(X.shape) < 0.7] = 0
+        X_input = sparse.csr_matrix(X)
+    elif kind == "float32":
+        X_input = X.astype(np.float32)
+        X = X_input.astype(np.float64)
+    else:
+        X_input = X
+    Y = X @ rng.normal(size=12) + 3 + rng.normal(size=2000)
+    expected = np.linalg.lstsq(np.column_stack([np.ones(X.shape[0]), X]), Y, rcond=None)[0]
+
+    B_hat, _ = LinearRegressionModel.calculate_B_hat(X_input, Y, solver)
+    np.testing.assert_allclose(B_hat, expected, rtol=1e-7, atol=1e-9)
+    B_hat_2d, _ = LinearRegressionModel.calculate_B_hat(X_input, np.column_stack([Y, 2 * Y]), solver)
+    np.testing.assert_allclose(B_hat_2d, np.column_stack([expected, 2 * expected]), rtol=1e-7, atol=1e-9)
+
+
+# <summary>
+# LSQR з точним початковим наближенням зупиняється майже одразу і не змінює розв'язку.
+# </summary>
+def test_lsqr_warm_start():
+    rng = np.random.default_rng(22)
+    X = rng.uniform(0, 10, (1000, 30))
+    Y = X @ rng.normal(size=30) + rng.normal(size=1000)
+    cold = LinearRegressionModel.calculate_B_hat_iterative(X, Y)
+    warm = LinearRegressionModel.calculate_B_hat_iterative(X, Y, B_init=cold.B_hat)
+    assert cold.converged and warm.converged
+    assert warm.iterations < cold.iterations
+    np.testing.assert_allclose(warm.B_hat, cold.B_hat, rtol=1e-8, atol=1e-10)
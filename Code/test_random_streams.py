@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from linear_regression_model import LinearRegressionModel
+from random_streams import RandomStreams
+
+
+# <summary>
+# За тим самим seed оцінки реплік не залежать від розміру пакета і загальної кількості реплік.
+# </summary>
+def test_simulation_does_not_depend_on_batch_size():
+    rng = np.random.default_rng(14)
+    X = rng.uniform(0, 10, (300, 5))
+    B = rng.uniform(-1, 1, (5, 1))
+
+    def simulate(replicates: int, batch_size: int) -> np.ndarray:
+        return LinearRegressionModel.simulate(
+            X, B, 1.0, 0.0, 1.0, replicates, 4, batch_size=batch_size, streams=RandomStreams(7)
+        )["B_hat"]
+
+    reference = simulate(200, 256)
+    for batch_size in (1, 50, 64, 1000):
+        np.testing.assert_array_equal(simulate(200, batch_size), reference)
+    np.testing.assert_array_equal(simulate(70, 256), reference[:, :70])
+
+
+# <summary>
+# Будь-який діапазон стовпців збігається з відповідним зрізом повної сітки.
+# </summary>
+@pytest.mark.parametrize("start, stop", [(0, 1), (63, 65), (70, 130), (128, 192)])
+def test_normal_replicates_slices_fixed_grid(start, stop):
+    streams = RandomStreams(3)
+    full = streams.normal_replicates((RandomStreams.NOISE,), 0.0, 1.0, 10, 0, 200, 5)
+    np.testing.assert_array_equal(
+        streams.normal_replicates((RandomStreams.NOISE,), 0.0, 1.0, 10, start, stop, 5), full[:, start:stop]
+    )
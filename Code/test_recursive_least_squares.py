@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from recursive_least_squares import RecursiveLeastSquares
+
+
+def _batches(n_batches: int = 12, rows: int = 7, n_feats: int = 5) -> list[tuple[np.ndarray, np.ndarray]]:
+    rng = np.random.default_rng(5)
+    B = rng.normal(size=n_feats)
+    batches = []
+    for size in [100] + [rows] * n_batches:
+        X = rng.uniform(0, 50, (size, n_feats))
+        batches.append((X, X @ B + 2 + rng.normal(size=size)))
+    return batches
+
+
+# <summary>
+# Розв'язок зваженого МНК: рядки пакета i мають вагу λ^(кількість пізніших пакетів).
+# </summary>
+def _weighted_lstsq(batches: list[tuple[np.ndarray, np.ndarray]], forgetting: float) -> np.ndarray:
+    X = np.vstack([X for X, _ in batches])
+    y = np.concatenate([y for _, y in batches])
+    weights = np.concatenate([
+        np.full(len(y_batch), forgetting ** (len(batches) - 1 - index))
+        for index, (_, y_batch) in enumerate(batches)
+    ])
+    A = np.column_stack([np.ones(len(y)), X]) * np.sqrt(weights)[:, None]
+    return np.linalg.lstsq(A, y * np.sqrt(weights), rcond=None)[0]
+
+
+# <summary>
+# Після початкової оцінки та пакетних оновлень B̂ збігається з МНК на всіх рядках
+# (або зі зваженим МНК при забуванні) — як з оновленнями Вудбері, так і з повторними розкладами.
+# </summary>
+@pytest.mark.parametrize("forgetting", [1.0, 0.9])
+@pytest.mark.parametrize("refactor_every", [0, 1, 5])
+def test_updates_match_weighted_lstsq(forgetting, refactor_every):
+    batches = _batches()
+    model = RecursiveLeastSquares(forgetting, refactor_every).initialize(*batches[0])
+    for X, y in batches[1:]:
+        model.update(X, y)
+
+    assert model.n_obs == sum(len(y) for _, y in batches)
+    assert model.n_updates == len(batches) - 1
+    np.testing.assert_allclose(model.B_hat, _weighted_lstsq(batches, forgetting), rtol=1e-8, atol=1e-10)
+
+
+# <summary>
+# Двовимірні Y оновлюються стовпцями незалежно, а оновлення без ініціалізації її виконує.
+# </summary>
+def test_matrix_responses_and_implicit_initialize():
+    batches = _batches(3)
+    Y_batches = [(X, np.column_stack([y, -y])) for X, y in batches]
+    model = RecursiveLeastSquares()
+    for X, Y in Y_batches:
+        model.update(X, Y)
+    expected = _weighted_lstsq(batches, 1.0)
+    np.testing.assert_allclose(model.B_hat, np.column_stack([expected, -expected]), rtol=1e-8)
+    with pytest.raises(ValueError):
+        model.update(batches[1][0][:, :3], batches[1][1])
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from least_squares_solver import LeastSquaresSolver
+from ridge_regression import RidgePath
+
+
+# <summary>
+# Порівнює шлях гребеневої регресії з явним розв'язком b = (XcᵀXc + λI)⁻¹XcᵀYc,
+# зокрема при n ≤ p, коли ранг Xc дорівнює n - 1.
+# </summary>
+@pytest.mark.parametrize("n_obs, n_feats", [(40, 60), (60, 60), (200, 10)])
+def test_ridge_path_matches_explicit_solution(n_obs, n_feats):
+    rng = np.random.default_rng(n_obs)
+    X = rng.uniform(0, 100, (n_obs, n_feats))
+    y = X @ rng.normal(size=n_feats) + 50 + rng.normal(size=n_obs)
+    path = RidgePath(LeastSquaresSolver.factorize(X, "svd"), X, y)
+    Xc, yc = X - X.mean(axis=0), y - y.mean()
+
+    for lam in path.default_lambdas(5):
+        coefs = np.linalg.solve(Xc.T @ Xc + lam * np.eye(n_feats), Xc.T @ yc)
+        residuals = yc - Xc @ coefs
+        rss = residuals @ residuals
+        df = np.trace(Xc @ np.linalg.solve(Xc.T @ Xc + lam * np.eye(n_feats), Xc.T))
+
+        B_hat = path.coefficients(lam)
+        np.testing.assert_allclose(B_hat[1:], coefs, rtol=1e-6, atol=1e-9)
+        np.testing.assert_allclose(B_hat[0], y.mean() - X.mean(axis=0) @ coefs, rtol=1e-6)
+        np.testing.assert_allclose(
+            path.residual_sum_of_squares([lam])[0, 0], rss, rtol=1e-6, atol=1e-12 * (yc @ yc)
+        )
+        np.testing.assert_allclose(path.degrees_of_freedom([lam])[0], df, rtol=1e-6)
+        np.testing.assert_allclose(path.diagnostics(lam, B_hat)["r2"][0], 1 - rss / (yc @ yc), rtol=1e-9)
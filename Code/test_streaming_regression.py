@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from streaming_regression import RegressionMoments, StreamingLinearRegression
+
+
+def _assert_moments_equal(actual: RegressionMoments, expected: RegressionMoments):
+    assert actual.n_obs == expected.n_obs
+    for name in ("x_mean", "y_mean", "sxx", "sxy", "syy"):
+        np.testing.assert_allclose(
+            getattr(actual, name), getattr(expected, name), rtol=1e-7, atol=1e-7, err_msg=name
+        )
+
+
+def _data(n_obs: int = 600, n_feats: int = 6) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(n_obs)
+    # Великий зсув X перевіряє, що об'єднання не втрачає точності на центруванні
+    X = rng.uniform(1000, 1010, (n_obs, n_feats))
+    Y = np.column_stack([X @ rng.normal(size=n_feats), X @ rng.normal(size=n_feats)]) + rng.normal(size=(n_obs, 2))
+    return X, Y
+
+
+# <summary>
+# Об'єднання статистик блоків дорівнює статистикам усіх даних, а вилучення частини —
+# статистикам решти рядків.
+# </summary>
+def test_merge_and_remove_round_trip():
+    X, Y = _data()
+    bounds = [0, 1, 150, 151, 420, 600]
+    blocks = [RegressionMoments.from_block(X[a:b], Y[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+    total = blocks[0]
+    for block in blocks[1:]:
+        total = total.merge(block)
+    _assert_moments_equal(total, RegressionMoments.from_block(X, Y))
+
+    part = RegressionMoments.from_block(X[150:420], Y[150:420])
+    rest = np.r_[0:150, 420:600]
+    _assert_moments_equal(total.remove(part), RegressionMoments.from_block(X[rest], Y[rest]))
+    _assert_moments_equal(total.remove(part).merge(part), total)
+    with pytest.raises(ValueError):
+        total.remove(total)
+
+
+# <summary>
+# Статистики зі зважених рядків дорівнюють статистикам даних із повтореними рядками.
+# </summary>
+def test_weighted_block_matches_repeated_rows():
+    X, Y = _data(200)
+    weights = np.random.default_rng(3).multinomial(200, np.full(200, 1 / 200))
+    rows = np.repeat(np.arange(200), weights)
+    _assert_moments_equal(
+        RegressionMoments.from_weighted_block(X - X.mean(axis=0), Y, weights),
+        RegressionMoments.from_block(X[rows] - X.mean(axis=0), Y[rows]),
+    )
+
+
+# <summary>
+# Потокова оцінка по блоках та SSE зі статистик збігаються з np.linalg.lstsq.
+# </summary>
+def test_streaming_matches_lstsq():
+    X, Y = _data()
+    A = np.column_stack([np.ones(X.shape[0]), X])
+    expected = np.linalg.lstsq(A, Y, rcond=None)[0]
+
+    model = StreamingLinearRegression()
+    for start in range(0, X.shape[0], 128):
+        model.partial_fit(X[start:start + 128], Y[start:start + 128, 0])
+    np.testing.assert_allclose(model.B_hat(), expected[:, 0], rtol=1e-7)
+    assert model.n_obs == X.shape[0]
+
+    moments = RegressionMoments.from_block(X, Y)
+    np.testing.assert_allclose(
+        moments.sum_of_squared_errors(expected), ((Y - A @ expected) ** 2).sum(axis=0), rtol=1e-6
+    )